@@ -0,0 +1,86 @@
+from typing import Any, Callable, Dict
+
+import httpx
+import pytest
+
+from openai_responses import OpenAIMock
+from openai_responses._utils.serde import model_dict, model_json
+
+BASE_URL = "https://api.openai.com/v1"
+
+MESSAGES = [
+    {"role": "system", "content": "You are a helpful assistant."},
+    {"role": "user", "content": "Hello!"},
+]
+
+CASES: Dict[str, Any] = {
+    "chat.completion": (
+        lambda m: m.chat.completions.create,
+        "/chat/completions",
+        {
+            "model": "gpt-4o",
+            "messages": MESSAGES,
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"content": "Hello!", "role": "assistant"},
+                }
+            ],
+        },
+        {},
+    ),
+    "assistant": (
+        lambda m: m.beta.assistants.create,
+        "/assistants",
+        {"model": "gpt-4o", "instructions": "Be helpful.", "name": "Helper"},
+        {},
+    ),
+    "thread": (
+        lambda m: m.beta.threads.create,
+        "/threads",
+        {"metadata": {"user": "abc"}},
+        {},
+    ),
+    "message": (
+        lambda m: m.beta.threads.messages.create,
+        "/threads/thread_abc123/messages",
+        {"role": "user", "content": "Hello!"},
+        {"thread_id": "thread_abc123"},
+    ),
+    "run": (
+        lambda m: m.beta.threads.runs.create,
+        "/threads/thread_abc123/runs",
+        {"assistant_id": "asst_abc123"},
+        {"thread_id": "thread_abc123", "model": "gpt-4o", "tools": []},
+    ),
+    "vector_store": (
+        lambda m: m.vector_stores.create,
+        "/vector_stores",
+        {"name": "docs"},
+        {},
+    ),
+}
+
+
+@pytest.mark.parametrize("resource", CASES)
+def test_build(benchmark, resource: str):
+    get_route, path, body, partial = CASES[resource]
+    route = get_route(OpenAIMock())
+    request = httpx.Request("POST", BASE_URL + path, json=body)
+    build: Callable[..., Any] = route._build
+
+    def run() -> Dict[str, Any]:
+        return model_dict(build(partial, request))
+
+    assert benchmark(run)["id"]
+
+
+@pytest.mark.parametrize("resource", CASES)
+def test_serialize(benchmark, resource: str):
+    get_route, path, body, partial = CASES[resource]
+    route = get_route(OpenAIMock())
+    request = httpx.Request("POST", BASE_URL + path, json=body)
+    model = route._build(partial, request)
+
+    assert benchmark(model_json, model)
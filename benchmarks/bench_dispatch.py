@@ -0,0 +1,66 @@
+from typing import Any, Dict
+
+import httpx
+import pytest
+
+from openai_responses import OpenAIMock
+
+BASE_URL = "https://api.openai.com/v1"
+
+REQUESTS = [
+    ("POST", "/chat/completions"),
+    ("POST", "/embeddings"),
+    ("GET", "/models/gpt-4o"),
+    ("POST", "/files"),
+    ("GET", "/files/file-abc123/content"),
+    ("POST", "/assistants"),
+    ("GET", "/assistants/asst_abc123"),
+    ("POST", "/threads/thread_abc123/messages"),
+    ("GET", "/threads/thread_abc123/runs/run_abc123/steps/step_abc123"),
+    ("POST", "/threads/thread_abc123/runs/run_abc123/submit_tool_outputs"),
+    ("GET", "/vector_stores/vs_abc123/file_batches/vsfb_abc123/files"),
+]
+
+COMPLETION: Dict[str, Any] = {
+    "choices": [
+        {
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"content": "Hello! How can I help?", "role": "assistant"},
+        }
+    ]
+}
+
+
+@pytest.mark.parametrize("method,path", REQUESTS, ids=[p for _, p in REQUESTS])
+def test_dispatch(benchmark, method: str, path: str):
+    openai_mock = OpenAIMock()
+    request = httpx.Request(method, BASE_URL + path)
+    dispatch = getattr(openai_mock.router, "_dispatch")
+
+    assert benchmark(dispatch, request) is not None
+
+
+def test_resolve_chat_completion(benchmark):
+    openai_mock = OpenAIMock()
+    openai_mock.chat.completions.create.response = COMPLETION
+    request = httpx.Request(
+        "POST",
+        BASE_URL + "/chat/completions",
+        json={"model": "gpt-4o", "messages": []},
+    )
+
+    resolved = benchmark(openai_mock.router.resolve, request)
+    assert resolved.response.status_code == 201
+
+
+def test_resolve_assistant_create(benchmark):
+    openai_mock = OpenAIMock()
+    request = httpx.Request(
+        "POST",
+        BASE_URL + "/assistants",
+        json={"model": "gpt-4o"},
+    )
+
+    resolved = benchmark(openai_mock.router.resolve, request)
+    assert resolved.response.status_code == 201
@@ -0,0 +1,49 @@
+import openai
+import pytest
+
+from openai_responses import OpenAIMock
+from openai_responses.stores import StateStore
+
+SIZES = [1_024, 1_024 * 1_024, 16 * 1_024 * 1_024]
+
+
+def ids(size: int) -> str:
+    return f"{size // 1_024}KB"
+
+
+@pytest.mark.parametrize("spill", [False, True], ids=["memory", "spilled"])
+@pytest.mark.parametrize("size", SIZES, ids=ids)
+def test_upload(benchmark, size: int, spill: bool):
+    openai_mock = OpenAIMock(state=StateStore(spill_threshold=0 if spill else None))
+    client = openai.Client(api_key="sk-fake123")
+    content = b"x" * size
+
+    def run() -> str:
+        file = client.files.create(
+            file=("data.jsonl", content),
+            purpose="assistants",
+        )
+        openai_mock.state.files.content.delete(file.id)
+        openai_mock.state.files.delete(file.id)
+        return file.id
+
+    with openai_mock.router:
+        benchmark(run)
+
+
+@pytest.mark.parametrize("spill", [False, True], ids=["memory", "spilled"])
+@pytest.mark.parametrize("size", SIZES, ids=ids)
+def test_download(benchmark, size: int, spill: bool):
+    openai_mock = OpenAIMock(state=StateStore(spill_threshold=0 if spill else None))
+    client = openai.Client(api_key="sk-fake123")
+
+    with openai_mock.router:
+        file = client.files.create(
+            file=("data.jsonl", b"x" * size),
+            purpose="assistants",
+        )
+
+        def run() -> int:
+            return len(client.files.content(file.id).content)
+
+        assert benchmark(run) == size
@@ -0,0 +1,27 @@
+import openai
+
+import openai_responses
+from openai_responses import OpenAIMock
+
+
+def test_construct_mock(benchmark):
+    benchmark(OpenAIMock)
+
+
+def test_start_stop_mock(benchmark):
+    openai_mock = OpenAIMock()
+
+    def run() -> None:
+        with openai_mock.router:
+            pass
+
+    benchmark(run)
+
+
+def test_decorated_test(benchmark):
+    @openai_responses.mock()
+    def run(openai_mock: OpenAIMock) -> None:
+        client = openai.Client(api_key="sk-fake123")
+        client.beta.assistants.create(model="gpt-4o")
+
+    benchmark(run)
@@ -0,0 +1,104 @@
+from typing import Tuple
+
+import pytest
+from openai.types.beta.assistant import Assistant
+from openai.types.beta.threads.message import Message
+
+from openai_responses._utils.serde import model_parse
+from openai_responses.stores import SQLiteStateStore, StateStore
+
+THREADS = 100
+
+SIZES = [
+    1_000,
+    100_000,
+    pytest.param(1_000_000, marks=pytest.mark.large),
+]
+
+
+def seed(state: StateStore, size: int) -> None:
+    """Add `size` assistants and `size` messages spread over the threads"""
+    with state.transaction():
+        for i in range(size):
+            created_at = i // 10
+            state.beta.assistants.put(
+                model_parse(
+                    Assistant,
+                    {
+                        "id": f"asst_{i}",
+                        "created_at": created_at,
+                        "model": "gpt-4o",
+                        "object": "assistant",
+                        "tools": [],
+                    },
+                )
+            )
+            state.beta.threads.messages.put(
+                model_parse(
+                    Message,
+                    {
+                        "id": f"msg_{i}",
+                        "content": [],
+                        "created_at": created_at,
+                        "object": "thread.message",
+                        "role": "user",
+                        "status": "completed",
+                        "thread_id": f"thread_{i % THREADS}",
+                    },
+                )
+            )
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda size: f"{size:_}")
+def size(request: pytest.FixtureRequest) -> int:
+    return request.param
+
+
+@pytest.fixture(scope="module", params=["memory", "sqlite"])
+def seeded(request: pytest.FixtureRequest, size: int) -> Tuple[StateStore, int]:
+    state = SQLiteStateStore() if request.param == "sqlite" else StateStore()
+    seed(state, size)
+    return state, size
+
+
+def test_list_first_page(benchmark, seeded: Tuple[StateStore, int]):
+    state, _ = seeded
+
+    page = benchmark(state.beta.assistants.list, limit="20")
+    assert len(page) == 20
+
+
+def test_list_page_after_cursor(benchmark, seeded: Tuple[StateStore, int]):
+    state, size = seeded
+
+    page = benchmark(state.beta.assistants.list, limit="100", after=f"asst_{size // 2}")
+    assert len(page) == 100
+
+
+def test_list_thread_messages(benchmark, seeded: Tuple[StateStore, int]):
+    state, size = seeded
+    messages = state.beta.threads.messages
+
+    page = benchmark(messages.list, "thread_7", limit="100", order="asc")
+    assert len(page) == min(100, size // THREADS)
+
+
+def test_fork(benchmark, seeded: Tuple[StateStore, int]):
+    state, _ = seeded
+
+    fork = benchmark(state.fork)
+    assert fork.beta.assistants.get("asst_0") is not None
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_put(benchmark, backend: str):
+    state = SQLiteStateStore() if backend == "sqlite" else StateStore()
+    assistant = Assistant(
+        id="asst_abc123",
+        created_at=0,
+        model="gpt-4o",
+        object="assistant",
+        tools=[],
+    )
+
+    benchmark(state.beta.assistants.put, assistant)
@@ -0,0 +1,115 @@
+from typing import Generator
+
+import openai
+import pytest
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
+from openai_responses import OpenAIMock
+from openai_responses._utils.serde import model_parse
+from openai_responses.streaming import (
+    DONE_FRAME,
+    ChatCompletionEventStream,
+    EventStream,
+    SSEFramer,
+)
+
+CONTENT = "lorem ipsum dolor sit amet " * 4_000  # NOTE: ~100 KB, 27k deltas
+
+COMPLETION = {
+    "id": "chatcmpl-abc123",
+    "created": 1694268190,
+    "model": "gpt-4o",
+    "object": "chat.completion",
+    "choices": [
+        {
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"content": CONTENT, "role": "assistant"},
+        }
+    ],
+}
+
+
+class ChunkEventStream(EventStream[ChatCompletionChunk]):
+    """Stream that builds every chunk as a model, like most custom streams do"""
+
+    def __init__(self, n: int) -> None:
+        self.n = n
+
+    def generate(self) -> Generator[ChatCompletionChunk, None, None]:
+        for _ in range(self.n):
+            yield model_parse(
+                ChatCompletionChunk,
+                {
+                    "id": "chatcmpl-abc123",
+                    "object": "chat.completion.chunk",
+                    "created": 1694268190,
+                    "model": "gpt-4o",
+                    "choices": [
+                        {
+                            "index": 0,
+                            "delta": {"content": "lore"},
+                            "finish_reason": None,
+                        }
+                    ],
+                },
+            )
+
+
+def consume(stream: EventStream[ChatCompletionChunk]) -> int:
+    return sum(len(chunk) for chunk in stream)
+
+
+@pytest.mark.parametrize("delta_size", [4, 64])
+def test_chat_completion_stream_bytes(benchmark, delta_size: int):
+    completion = model_parse(ChatCompletion, COMPLETION)
+    stream = ChatCompletionEventStream(completion, delta_size=delta_size)
+
+    size = benchmark(consume, stream)
+    benchmark.extra_info["bytes"] = size
+
+
+def test_event_stream_bytes(benchmark):
+    size = benchmark(consume, ChunkEventStream(1_000))
+    benchmark.extra_info["bytes"] = size
+
+
+@pytest.mark.parametrize(
+    "max_events,chunk_size",
+    [(1, None), (16, None), (1, 1_024)],
+    ids=["frame", "coalesced", "rechunked"],
+)
+def test_framer(benchmark, max_events: int, chunk_size: int):
+    frame = b'data: {"choices": [{"delta": {"content": "lore"}}]}\n\n'
+
+    def run() -> int:
+        framer = SSEFramer(max_events, chunk_size=chunk_size)
+        size = 0
+        for _ in range(10_000):
+            for chunk in framer.push(frame):
+                size += len(chunk)
+        for chunk in framer.push(DONE_FRAME):
+            size += len(chunk)
+        for chunk in framer.flush():
+            size += len(chunk)
+        return size
+
+    benchmark(run)
+
+
+def test_client_stream(benchmark):
+    openai_mock = OpenAIMock()
+    openai_mock.chat.completions.create.response = COMPLETION
+    openai_mock.chat.completions.create.stream_delta_size = 64
+    client = openai.Client(api_key="sk-fake123")
+
+    def run() -> int:
+        stream = client.chat.completions.create(
+            model="gpt-4o",
+            messages=[{"role": "user", "content": "Hello!"}],
+            stream=True,
+        )
+        return sum(1 for _ in stream)
+
+    with openai_mock.router:
+        assert benchmark(run) > 1
@@ -0,0 +1,35 @@
+"""Benchmarks for the hot paths of the mock
+
+Run with `pytest benchmarks -o python_files="bench_*.py"`. Cases with a million
+objects take a lot of time and memory, so they only run with `--large`.
+"""
+
+from typing import List
+
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--large",
+        action="store_true",
+        default=False,
+        help="also run benchmarks with a million objects",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line("markers", "large: needs a lot of time and memory")
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config,
+    items: List[pytest.Item],
+) -> None:
+    if config.getoption("--large"):
+        return
+
+    skip = pytest.mark.skip(reason="needs --large")
+    for item in items:
+        if "large" in item.keywords:
+            item.add_marker(skip)
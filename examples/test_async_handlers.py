@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+import openai
+from openai.types.beta import Assistant
+
+import openai_responses
+from openai_responses import OpenAIMock
+from openai_responses.ext.httpx import Request, Response
+from openai_responses.helpers.builders.threads import thread_from_create_request
+from openai_responses.stores import StateStore
+
+from test_streaming_simple import CreateChatCompletionEventStream
+
+
+async def create_thread(request: Request, state_store: StateStore) -> Response:
+    await asyncio.sleep(0)
+    thread = thread_from_create_request(request)
+    state_store.beta.threads.put(thread)
+    return Response(201, json=thread.model_dump())
+
+
+@pytest.mark.asyncio
+@openai_responses.mock()
+async def test_async_handler(openai_mock: OpenAIMock):
+    openai_mock.beta.threads.create.response = create_thread
+
+    client = openai.AsyncClient(api_key="sk-fake123")
+    thread = await client.beta.threads.create()
+
+    assert openai_mock.state.beta.threads.get(thread.id)
+
+
+@openai_responses.mock()
+def test_async_handler_sync_client(openai_mock: OpenAIMock):
+    openai_mock.beta.threads.create.response = create_thread
+
+    client = openai.Client(api_key="sk-fake123")
+    thread = client.beta.threads.create()
+
+    assert openai_mock.state.beta.threads.get(thread.id)
+
+
+@pytest.mark.asyncio
+@openai_responses.mock()
+async def test_sync_event_stream_async_client(openai_mock: OpenAIMock):
+    def create_chat_completion(request: Request) -> Response:
+        stream = CreateChatCompletionEventStream()
+        return Response(201, content=stream, request=request)
+
+    openai_mock.chat.completions.create.response = create_chat_completion
+
+    client = openai.AsyncClient(api_key="sk-fake123")
+    stream = await client.chat.completions.create(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "Hello!"}],
+        stream=True,
+    )
+
+    chunks = [chunk async for chunk in stream]
+    assert len(chunks) == 3
+
+
+@pytest.mark.asyncio
+@openai_responses.mock(state=StateStore(thread_safe=True), offload=True)
+async def test_offload_gather(openai_mock: OpenAIMock):
+    client = openai.AsyncClient(api_key="sk-fake123")
+
+    assistants = await asyncio.gather(
+        *(client.beta.assistants.create(model="gpt-4o") for _ in range(500))
+    )
+
+    assert len({assistant.id for assistant in assistants}) == 500
+    assert all(isinstance(assistant, Assistant) for assistant in assistants)
+    assert len(openai_mock.state.beta.assistants.list(limit="1000")) == 500
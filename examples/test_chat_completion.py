@@ -1,3 +1,5 @@
+import pytest
+
 import openai
 
 import openai_responses
@@ -28,3 +30,106 @@ def test_create_chat_completion(openai_mock: OpenAIMock):
     assert len(completion.choices) == 1
     assert completion.choices[0].message.content == "Hello! How can I help?"
     assert openai_mock.chat.completions.create.route.call_count == 1
+
+
+@openai_responses.mock()
+def test_create_chat_completion_cached_response(openai_mock: OpenAIMock):
+    openai_mock.chat.completions.create.response = {
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"content": "Hello! How can I help?", "role": "assistant"},
+            }
+        ]
+    }
+    openai_mock.chat.completions.create.cache_response = True
+
+    client = openai.Client(api_key="sk-fake123")
+    completions = [
+        client.chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=[{"role": "user", "content": "Hello!"}],
+        )
+        for _ in range(3)
+    ]
+
+    assert len({completion.id for completion in completions}) == 3
+    assert all(c.id.startswith("chatcmpl_") for c in completions)
+    assert all(
+        c.choices[0].message.content == "Hello! How can I help?" for c in completions
+    )
+    assert openai_mock.chat.completions.create.route.call_count == 3
+
+
+@openai_responses.mock()
+def test_create_chat_completion_stream(openai_mock: OpenAIMock):
+    openai_mock.chat.completions.create.response = {
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"content": "Hello! How can I help?", "role": "assistant"},
+            }
+        ]
+    }
+    openai_mock.chat.completions.create.stream_delta_size = 5
+
+    client = openai.Client(api_key="sk-fake123")
+    stream = client.chat.completions.create(
+        model="gpt-3.5-turbo",
+        messages=[{"role": "user", "content": "Hello!"}],
+        stream=True,
+        stream_options={"include_usage": True},
+    )
+
+    chunks = list(stream)
+    deltas = [c.choices[0].delta.content for c in chunks if c.choices]
+
+    assert deltas == ["", "Hello", "! How", " can ", "I hel", "p?", None]
+    assert chunks[-2].choices[0].finish_reason == "stop"
+    assert chunks[-1].usage is not None
+    assert chunks[-1].usage.completion_tokens == 5
+    assert len({c.id for c in chunks}) == 1
+
+
+@pytest.mark.asyncio
+@openai_responses.mock()
+async def test_async_create_chat_completion_stream(openai_mock: OpenAIMock):
+    openai_mock.chat.completions.create.response = {
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "tool_calls",
+                "message": {
+                    "role": "assistant",
+                    "tool_calls": [
+                        {
+                            "id": "call_abc123",
+                            "type": "function",
+                            "function": {
+                                "name": "get_weather",
+                                "arguments": '{"location": "Boston"}',
+                            },
+                        }
+                    ],
+                },
+            }
+        ]
+    }
+
+    client = openai.AsyncClient(api_key="sk-fake123")
+    stream = await client.chat.completions.create(
+        model="gpt-3.5-turbo",
+        messages=[{"role": "user", "content": "What's the weather in Boston?"}],
+        stream=True,
+    )
+
+    arguments = ""
+    async for chunk in stream:
+        assert chunk.usage is None
+        for tool_call in chunk.choices[0].delta.tool_calls or []:
+            if tool_call.function and tool_call.function.arguments:
+                arguments += tool_call.function.arguments
+
+    assert arguments == '{"location": "Boston"}'
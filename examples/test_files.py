@@ -1,7 +1,10 @@
+import pytest
+
 import openai
 
 import openai_responses
 from openai_responses import OpenAIMock
+from openai_responses.stores import StateStore
 
 
 @openai_responses.mock()
@@ -14,6 +17,7 @@ def test_create_file(openai_mock: OpenAIMock):
     )
 
     assert file.filename == "example.json"
+    assert file.bytes == len(b'{\n  "foo": "bar",\n  "fizz": "buzz"\n}')
     assert openai_mock.files.create.route.call_count == 1
 
 
@@ -76,3 +80,79 @@ def test_retrieve_file_content(openai_mock: OpenAIMock):
     )
     res = client.files.content(file.id)
     assert res.content == b'{\n  "foo": "bar",\n  "fizz": "buzz"\n}'
+
+
+@openai_responses.mock(state=StateStore(spill_threshold=16))
+def test_retrieve_spilled_file_content(openai_mock: OpenAIMock):
+    client = openai.Client(api_key="sk-fake123")
+
+    file = client.files.create(
+        file=open("examples/example.json", "rb"),
+        purpose="fine-tune",
+    )
+    res = client.files.content(file.id)
+    assert res.content == b'{\n  "foo": "bar",\n  "fizz": "buzz"\n}'
+    assert openai_mock.files.content.route.call_count == 1
+
+
+@pytest.mark.asyncio
+@openai_responses.mock(state=StateStore(spill_threshold=16))
+async def test_async_retrieve_spilled_file_content(openai_mock: OpenAIMock):
+    client = openai.AsyncClient(api_key="sk-fake123")
+
+    file = await client.files.create(
+        file=open("examples/example.json", "rb"),
+        purpose="fine-tune",
+    )
+    res = await client.files.content(file.id)
+    assert res.content == b'{\n  "foo": "bar",\n  "fizz": "buzz"\n}'
+
+
+@openai_responses.mock()
+def test_stream_file_content(openai_mock: OpenAIMock):
+    openai_mock.files.content.chunk_size = 8
+    client = openai.Client(api_key="sk-fake123")
+
+    file = client.files.create(
+        file=open("examples/example.json", "rb"),
+        purpose="fine-tune",
+    )
+    with client.files.with_streaming_response.content(file.id) as res:
+        chunks = list(res.iter_bytes())
+
+    assert b"".join(chunks) == b'{\n  "foo": "bar",\n  "fizz": "buzz"\n}'
+    assert len(chunks) == 5
+
+
+@openai_responses.mock()
+def test_retrieve_file_content_range(openai_mock: OpenAIMock):
+    client = openai.Client(api_key="sk-fake123")
+
+    file = client.files.create(
+        file=open("examples/example.json", "rb"),
+        purpose="fine-tune",
+    )
+    with client.files.with_streaming_response.content(
+        file.id,
+        extra_headers={"Range": "bytes=4-8"},
+    ) as res:
+        assert res.status_code == 206
+        assert res.headers["content-range"] == "bytes 4-8/36"
+        assert res.read() == b'"foo"'
+
+
+@pytest.mark.asyncio
+@openai_responses.mock(state=StateStore(spill_threshold=16))
+async def test_async_stream_spilled_file_content_range(openai_mock: OpenAIMock):
+    client = openai.AsyncClient(api_key="sk-fake123")
+
+    file = await client.files.create(
+        file=open("examples/example.json", "rb"),
+        purpose="fine-tune",
+    )
+    async with client.files.with_streaming_response.content(
+        file.id,
+        extra_headers={"Range": "bytes=-8"},
+    ) as res:
+        assert res.status_code == 206
+        assert await res.read() == b'"buzz"\n}'
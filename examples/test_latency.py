@@ -0,0 +1,92 @@
+import pytest
+
+import openai
+
+import openai_responses
+from openai_responses import OpenAIMock
+from openai_responses.latency import Empirical, Normal, VirtualClock
+
+clock = VirtualClock(start=0)
+
+
+@openai_responses.mock(clock=clock)
+def test_route_latency(openai_mock: OpenAIMock):
+    openai_mock.models.list.latency = 0.25
+
+    client = openai.Client(api_key="sk-fake123")
+    start = openai_mock.clock.now()
+    client.models.list()
+    client.models.list()
+
+    assert openai_mock.clock.now() - start == 0.5
+
+
+@pytest.mark.asyncio
+@openai_responses.mock(clock=VirtualClock(), seed=1)
+async def test_route_latency_async(openai_mock: OpenAIMock):
+    openai_mock.beta.assistants.create.latency = Normal(0.2, 0.05, minimum=0.1)
+    openai_mock.models.list.latency = Empirical([0.1, 0.3])
+
+    client = openai.AsyncClient(api_key="sk-fake123")
+    start = openai_mock.clock.now()
+    await client.beta.assistants.create(model="gpt-4o")
+    await client.models.list()
+
+    assert openai_mock.clock.now() - start >= 0.2
+
+
+@openai_responses.mock(clock=VirtualClock())
+def test_stream_time_to_first_token(openai_mock: OpenAIMock):
+    openai_mock.chat.completions.create.response = {
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"content": "Hello! How can I help?", "role": "assistant"},
+            }
+        ]
+    }
+    openai_mock.chat.completions.create.time_to_first_token = 0.5
+    openai_mock.chat.completions.create.inter_token_delay = 0.01
+
+    client = openai.Client(api_key="sk-fake123")
+    stream = client.chat.completions.create(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "Hello!"}],
+        stream=True,
+    )
+
+    start = openai_mock.clock.now()
+    chunks = list(stream)
+
+    # NOTE: first chunk with the role, 6 content deltas, and the finish chunk
+    assert len(chunks) == 8
+    assert openai_mock.clock.now() - start == pytest.approx(0.5 + 7 * 0.01)
+
+
+@openai_responses.mock(clock=VirtualClock(start=1_700_000_000))
+def test_virtual_clock_timestamps(openai_mock: OpenAIMock):
+    client = openai.Client(api_key="sk-fake123")
+
+    thread = client.beta.threads.create()
+    assert thread.created_at == 1_700_000_000
+
+    clock = openai_mock.clock
+    assert isinstance(clock, VirtualClock)
+    clock.advance(3 * 60 * 60)
+
+    message = client.beta.threads.messages.create(
+        thread.id,
+        role="user",
+        content="Hello!",
+    )
+    assert message.created_at - thread.created_at == 3 * 60 * 60
+
+
+@openai_responses.mock(clock=VirtualClock(start=0, tick=1))
+def test_virtual_clock_tick(openai_mock: OpenAIMock):
+    client = openai.Client(api_key="sk-fake123")
+
+    assistants = [client.beta.assistants.create(model="gpt-4o") for _ in range(5)]
+
+    assert [a.created_at for a in assistants] == [0, 1, 2, 3, 4]
@@ -44,6 +44,25 @@ def test_list_messages(openai_mock: OpenAIMock):
     assert openai_mock.beta.threads.messages.list.route.call_count == 2
 
 
+@openai_responses.mock()
+def test_list_messages_auto_paging(openai_mock: OpenAIMock):
+    client = openai.Client(api_key="sk-fake123")
+    thread = client.beta.threads.create()
+
+    for i in range(10):
+        client.beta.threads.messages.create(
+            thread.id,
+            content=f"Hello, {i}!",
+            role="user",
+        )
+
+    messages = list(client.beta.threads.messages.list(thread.id, limit=4))
+
+    assert len(messages) == 10
+    assert len({message.id for message in messages}) == 10
+    assert openai_mock.beta.threads.messages.list.route.call_count == 3
+
+
 @openai_responses.mock()
 def test_retrieve_message(openai_mock: OpenAIMock):
     client = openai.Client(api_key="sk-fake123")
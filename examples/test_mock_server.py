@@ -0,0 +1,67 @@
+import pytest
+
+import openai
+
+from openai_responses import OpenAIMock
+from openai_responses.server import MockServer
+
+
+def test_serve_over_http():
+    openai_mock = OpenAIMock()
+    openai_mock.chat.completions.create.response = {
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {
+                    "content": "Hello! How can I help?",
+                    "role": "assistant",
+                },
+            }
+        ]
+    }
+
+    with MockServer(openai_mock) as server:
+        client = openai.Client(api_key="sk-fake123", base_url=server.url)
+
+        assistant = client.beta.assistants.create(model="gpt-4o")
+        found = client.beta.assistants.retrieve(assistant.id)
+        assert found.id == assistant.id
+
+        completion = client.chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=[{"role": "user", "content": "Hello!"}],
+        )
+        assert completion.choices[0].message.content == "Hello! How can I help?"
+
+        stream = client.chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=[{"role": "user", "content": "Hello!"}],
+            stream=True,
+        )
+        content = "".join(
+            chunk.choices[0].delta.content or "" for chunk in stream if chunk.choices
+        )
+        assert content == "Hello! How can I help?"
+
+        with pytest.raises(openai.NotFoundError):
+            client.beta.assistants.retrieve("asst_missing")
+
+    assert openai_mock.state.beta.assistants.get(assistant.id) is not None
+    assert openai_mock.chat.completions.create.route.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_serve_over_http():
+    async with MockServer() as server:
+        client = openai.AsyncClient(api_key="sk-fake123", base_url=server.url)
+
+        thread = await client.beta.threads.create()
+        await client.beta.threads.messages.create(
+            thread.id,
+            role="user",
+            content="Hello!",
+        )
+        messages = await client.beta.threads.messages.list(thread.id)
+
+    assert len(messages.data) == 1
@@ -0,0 +1,27 @@
+from typing import List
+
+import openai
+
+import openai_responses
+from openai_responses import OpenAIMock
+
+
+def create_threads(n: int) -> List[str]:
+    client = openai.Client(api_key="sk-fake123")
+    return [client.beta.threads.create().id for _ in range(n)]
+
+
+@openai_responses.mock(seed=1234)
+def test_seeded_ids(openai_mock: OpenAIMock):
+    ids = create_threads(3)
+
+    openai_mock.reset()
+    assert create_threads(3) == ids
+
+
+@openai_responses.mock(sequential_ids=True)
+def test_sequential_ids(openai_mock: OpenAIMock):
+    ids = create_threads(3)
+
+    assert ids == sorted(ids)
+    assert openai_mock.beta.threads.create.route.call_count == 3
@@ -0,0 +1,29 @@
+import openai
+
+from openai_responses import OpenAIMock
+
+
+def test_create_assistant(shared_openai_mock: OpenAIMock):
+    shared_openai_mock.beta.assistants.create.response = {"name": "Math Tutor"}
+
+    client = openai.Client(api_key="sk-fake123")
+    assistant = client.beta.assistants.create(model="gpt-4o")
+
+    assert assistant.name == "Math Tutor"
+    assert shared_openai_mock.beta.assistants.create.route.call_count == 1
+
+
+def test_state_is_reset(shared_openai_mock: OpenAIMock):
+    client = openai.Client(api_key="sk-fake123")
+    assistant = client.beta.assistants.create(model="gpt-4o")
+
+    assert assistant.name is None
+    assert len(client.beta.assistants.list().data) == 1
+    assert shared_openai_mock.beta.assistants.create.route.call_count == 1
+
+
+def test_reuses_session_mock(
+    shared_openai_mock: OpenAIMock,
+    openai_mock_session: OpenAIMock,
+):
+    assert shared_openai_mock is openai_mock_session
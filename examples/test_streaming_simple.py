@@ -94,3 +94,34 @@ def test_create_chat_completion_stream(openai_mock: OpenAIMock):
         assert chunk.id
 
     assert received_chunks == 3
+
+
+class CoalescedEventStream(CreateChatCompletionEventStream):
+    coalesce_events = 2
+    chunk_size = 7
+
+
+def create_coalesced_response(request: Request) -> Response:
+    stream = CoalescedEventStream()
+    return Response(201, content=stream, request=request)
+
+
+@openai_responses.mock()
+def test_create_chat_completion_stream_odd_chunks(openai_mock: OpenAIMock):
+    openai_mock.chat.completions.create.response = create_coalesced_response
+
+    client = openai.Client(api_key="sk-fake123")
+    completion = client.chat.completions.create(
+        model="gpt-4o",
+        messages=[
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": "Hello!"},
+        ],
+        stream=True,
+    )
+
+    assert [chunk.choices[0].delta.content for chunk in completion] == [
+        "",
+        "Hello",
+        None,
+    ]
@@ -0,0 +1,31 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import openai
+
+import openai_responses
+from openai_responses import OpenAIMock
+from openai_responses.stores import StateStore
+
+
+@openai_responses.mock(state=StateStore(thread_safe=True))
+def test_create_messages_from_threads(openai_mock: OpenAIMock):
+    client = openai.Client(api_key="sk-fake123")
+    thread = client.beta.threads.create()
+
+    def create_message(i: int) -> str:
+        message = client.beta.threads.messages.create(
+            thread.id,
+            role="user",
+            content=f"Message {i}",
+        )
+        return message.id
+
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        ids = set(executor.map(create_message, range(256)))
+
+    messages = client.beta.threads.messages.list(thread.id, limit=100)
+    listed = {message.id for message in messages}
+
+    assert len(ids) == 256
+    assert listed == ids
+    assert openai_mock.beta.threads.messages.create.route.call_count == 256
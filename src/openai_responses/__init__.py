@@ -3,7 +3,8 @@ from ._mock import OpenAIMock
 
 from . import ext
 from . import helpers
+from . import latency
 from . import stores
 from . import streaming
 
-__all__ = ["mock", "OpenAIMock", "ext", "helpers", "stores", "streaming"]
+__all__ = ["mock", "OpenAIMock", "ext", "helpers", "latency", "stores", "streaming"]
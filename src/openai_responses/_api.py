@@ -1,6 +1,7 @@
 from typing import Any, Awaitable, Callable, Optional, Union
 
 from ._mock import OpenAIMock
+from .latency import Clock
 from .stores import StateStore
 
 WrappedFn = Callable[..., Union[Callable[..., Any], Awaitable[Callable[..., Any]]]]
@@ -10,11 +11,26 @@ def mock(
     *,
     base_url: Optional[str] = None,
     state: Optional[StateStore] = None,
+    seed: Optional[int] = None,
+    sequential_ids: bool = False,
+    clock: Optional[Clock] = None,
+    offload: bool = False,
 ) -> WrappedFn:
     """
     Args:
         base_url (Optional[str], optional): Override base URL. Defaults to None.
         state (Optional[StateStore], optional): Override default empty state. Defaults to None.
+        seed (Optional[int], optional): Seed for reproducible resource IDs. Defaults to None.
+        sequential_ids (bool, optional): Generate monotonic counter-based IDs. Defaults to False.
+        clock (Optional[Clock], optional): Clock for object timestamps like `created` and `created_at` and for simulated latency, including streaming time to first token and inter-token delays, while the mock is active. A `VirtualClock` freezes timestamps and skips the delays. Defaults to the system clock.
+        offload (bool, optional): Build responses for async clients in a thread pool instead of on the event loop. Use a thread-safe state store with it. Defaults to False.
     """
-    openai_mock = OpenAIMock(base_url, state)
+    openai_mock = OpenAIMock(
+        base_url,
+        state,
+        seed=seed,
+        sequential_ids=sequential_ids,
+        clock=clock,
+        offload=offload,
+    )
     return openai_mock._start_mock()
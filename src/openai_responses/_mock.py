@@ -1,6 +1,6 @@
 import inspect
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 import respx
 
@@ -12,7 +12,13 @@ from ._routes import (
     ModelRoutes,
     ModerationsRoutes,
     VectorStoreRoutes,
+    iter_routes,
 )
+from ._routes._base import Route, StatefulRoute
+from ._router import Router
+from ._utils import time
+from ._utils.faker import Faker
+from .latency import Clock, Latency
 from .stores import StateStore
 
 
@@ -23,24 +29,63 @@ class OpenAIMock:
     files: FileRoutes
     models: ModelRoutes
     moderations: ModerationsRoutes
+    vector_stores: VectorStoreRoutes
 
     def __init__(
         self,
         base_url: Optional[str] = None,
         state: Optional[StateStore] = None,
+        *,
+        seed: Optional[int] = None,
+        sequential_ids: bool = False,
+        clock: Optional[Clock] = None,
+        offload: bool = False,
     ) -> None:
-        self._router = respx.mock(
+        self._base_url = base_url or "https://api.openai.com/v1"
+        self._router = Router(
             assert_all_called=False,
-            base_url=base_url or "https://api.openai.com/v1",
+            base_url=self._base_url,
         )
         self._state = state or StateStore()
+        self._seed = seed
+        self._faker = Faker(seed, sequential=sequential_ids)
+        self._router.add_hooks(self._faker.activate, self._faker.deactivate)
+        self._router.rng.seed(seed)
+        if clock is not None:
+            self._router.clock = clock
+        self._router.offload = offload
+        self._initial_clock = self._router.clock
+        self._active_clock: Optional[Clock] = None
+        self._router.add_hooks(self._activate_clock, self._deactivate_clock)
         self._init_routes()
 
     @property
-    def router(self) -> respx.MockRouter:
+    def router(self) -> Router:
         """[RESPX](https://lundberg.github.io/respx) router with patched OpenAI routes"""
         return self._router
 
+    @property
+    def base_url(self) -> str:
+        """Base URL of the mocked API"""
+        return self._base_url
+
+    @property
+    def faker(self) -> Faker:
+        """ID factory used by the routes while the mock is active"""
+        return self._faker
+
+    @property
+    def clock(self) -> Clock:
+        """Clock for object timestamps and simulated latency while the mock is active"""
+        return self._router.clock
+
+    @clock.setter
+    def clock(self, value: Clock) -> None:
+        self._router.clock = value
+        if self._active_clock is not None:
+            self._deactivate_clock()
+            self._activate_clock()
+
     @property
     def state(self) -> StateStore:
         """State store for API resources"""
@@ -50,10 +95,54 @@ class OpenAIMock:
     def state(self, value: StateStore) -> None:
         assert isinstance(value, StateStore), "Object is not an instance of StateStore"
         self._state = value
-        self._init_routes()
+        for route in self._routes:
+            if isinstance(route, StatefulRoute):
+                route._state = value
+                route.route.side_effect = route._side_effect
+
+    def reset(self, state: Optional[StateStore] = None) -> None:
+        """Reset the mock to the same condition as a newly constructed one
+
+        Replaces the state store, clears call history, restarts the ID sequence,
+        restores the clock given on construction, and restores the default response
+        of every route without rebuilding the routes.
+
+        Args:
+            state (Optional[StateStore], optional): State to reset to. Defaults to an empty state configured like the current one, e.g. thread-safe. A SQLite state is reset to an empty in-memory database so a database file is never wiped.
+        """
+        self.state = state or self._state._empty()
+        self.clock = self._initial_clock
+        self._faker.reseed()
+        self._router.rng.seed(self._seed)
+        self._router.reset()
+        for route in self._routes:
+            route._reset()
+
+    def _activate_clock(self) -> None:
+        self._active_clock = self._router.clock
+        time.activate(self._active_clock)
+
+    def _deactivate_clock(self) -> None:
+        if self._active_clock is not None:
+            time.deactivate(self._active_clock)
+            self._active_clock = None
+
+    @property
+    def _routes(self) -> Iterator[Route[Any, Any]]:
+        groups: List[object] = [
+            self.beta,
+            self.chat,
+            self.embeddings,
+            self.files,
+            self.models,
+            self.moderations,
+            self.vector_stores,
+        ]
+        for group in groups:
+            yield from iter_routes(group)
 
     def _init_routes(self) -> None:
-        """Called on construction and anytime that either `router` or `state` values are changed"""
+        """Called on construction"""
         self.beta = BetaRoutes(self._router, self._state)
         self.chat = ChatRoutes(self._router)
         self.embeddings = EmbeddingsRoutes(self._router)
@@ -61,12 +150,15 @@ class OpenAIMock:
         self.models = ModelRoutes(self._router, self._state)
         self.moderations = ModerationsRoutes(self._router)
         self.vector_stores = VectorStoreRoutes(self._router, self._state)
+        self._router.compile(route.route for route in self._routes)
 
-        # NOTE: need to sort routes to avoid match conflicts
-        self._router.routes._routes.sort(
-            key=lambda r: len(repr(r._pattern)),  # type: ignore
-            reverse=True,
-        )
+        routes: Dict[int, Route[Any, Any]] = {id(r.route): r for r in self._routes}
+
+        def _latency(route: respx.Route) -> Optional[Latency]:
+            match = routes.get(id(route))
+            return match.latency if match is not None else None
+
+        self._router.set_latency(_latency)
 
     def _start_mock(self):
         def wrapper(fn: Callable[..., Any]):
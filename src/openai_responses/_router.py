@@ -0,0 +1,341 @@
+import asyncio
+import inspect
+import random
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
+
+import httpx
+import respx
+from respx.models import ResolvedRoute, SideEffectError
+from respx.patterns import Lookup
+from respx.types import ResolvedResponseTypes, RouteResultTypes
+
+from .latency import SYSTEM_CLOCK, Clock, Latency
+from .streaming import EventStream
+
+__all__ = ["Router"]
+
+Dispatched = Tuple[respx.Route, Dict[str, Any]]
+LatencyLookup = Callable[[respx.Route], Optional[Latency]]
+
+
+def _next(chunks: Iterator[bytes]) -> Optional[bytes]:
+    return next(chunks, None)
+
+
+class AsyncIteratorStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Makes a sync response stream, like an `EventStream`, readable by async clients
+
+    Chunks are produced one at a time as the client reads them. Each chunk is
+    either produced on the event loop, yielding to other tasks in between, or in a
+    worker thread when `offload` is set. On the event loop, the delays of an
+    `EventStream` are awaited rather than slept.
+    """
+
+    def __init__(self, stream: Iterable[bytes], offload: bool = False) -> None:
+        self._stream = stream
+        self._offload = offload
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        if not self._offload:
+            if isinstance(self._stream, EventStream):
+                # NOTE: wait on the event loop instead of blocking it in `clock.sleep`
+                clock = self._stream.clock
+                for delay, chunk in self._stream._paced():
+                    await clock.asleep(delay)
+                    yield chunk
+                    await asyncio.sleep(0)
+                return
+
+            for chunk in self._stream:
+                yield chunk
+                await asyncio.sleep(0)
+            return
+
+        chunks = iter(self._stream)
+
+        loop = asyncio.get_running_loop()
+        while True:
+            part = await loop.run_in_executor(None, _next, chunks)
+            if part is None:
+                return
+            yield part
+
+    def close(self) -> None:
+        close = getattr(self._stream, "close", None)
+        if close is not None:
+            close()
+
+
+def _run_sync(awaitable: Awaitable[Any]) -> Any:
+    """Run an async side effect for a sync client"""
+
+    async def _main() -> Any:
+        return await awaitable
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_main())
+
+    # NOTE: a sync client called from async code, the loop of this thread is busy
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, _main()).result()
+
+
+class Dispatcher:
+    """Matches requests to routes with a single regex search per HTTP method
+
+    The URL regexes of all routes for a method are compiled into one alternation
+    that is anchored to the end of the request path. Each alternative is wrapped in
+    a named group so the matched route is known from `Match.lastgroup` without
+    trying the routes one by one.
+    """
+
+    def __init__(self, routes: Iterable[respx.Route]) -> None:
+        by_method: Dict[str, List[Tuple["re.Pattern[str]", respx.Route]]] = {}
+        for route in routes:
+            method: Optional[str] = None
+            regex: Optional["re.Pattern[str]"] = None
+            for pattern in route.pattern or ():
+                if pattern.key == "method":
+                    method = pattern.value
+                elif pattern.key == "url" and pattern.lookup is Lookup.REGEX:
+                    regex = pattern.value
+
+            if method and regex:
+                by_method.setdefault(method, []).append((regex, route))
+
+        self._patterns: Dict[str, "re.Pattern[str]"] = {}
+        self._targets: Dict[str, Tuple[respx.Route, Dict[str, str]]] = {}
+
+        for method, candidates in by_method.items():
+            # NOTE: literal path segments win over path parameters, e.g. `/threads/runs`
+            candidates.sort(key=lambda candidate: candidate[0].groups)
+
+            alternatives: List[str] = []
+            for i, (regex, route) in enumerate(candidates):
+                tag = f"_{method}{i}"
+                params: Dict[str, str] = {}
+
+                def _rename(match: "re.Match[str]") -> str:
+                    alias = f"{tag}_{match.group(1)}"
+                    params[alias] = match.group(1)
+                    return f"(?P<{alias}>"
+
+                source = re.sub(r"\(\?P<(\w+)>", _rename, regex.pattern)
+                alternatives.append(f"(?P<{tag}>{source})")
+                self._targets[tag] = (route, params)
+
+            self._patterns[method] = re.compile(f"(?:{'|'.join(alternatives)})$")
+
+    def dispatch(self, request: httpx.Request) -> Optional[Dispatched]:
+        pattern = self._patterns.get(request.method)
+        if pattern is None:
+            return None
+
+        match = pattern.search(request.url.path)
+        if match is None or match.lastgroup is None:
+            return None
+
+        route, params = self._targets[match.lastgroup]
+        return route, {name: match.group(alias) for alias, name in params.items()}
+
+
+class Router(respx.MockRouter):
+    """RESPX mock router that resolves compiled routes with a `Dispatcher`
+
+    Requests that are not dispatched, like those for routes added by the user, fall
+    back to the default RESPX behavior of trying every route in order.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._dispatcher = Dispatcher([])
+        self._hooks: List[Tuple[Callable[[], None], Callable[[], None]]] = []
+        self._latency: Optional[LatencyLookup] = None
+        self.clock: Clock = SYSTEM_CLOCK
+        self.rng = random.Random()
+        self.offload = False
+
+    def add_hooks(
+        self,
+        on_start: Callable[[], None],
+        on_stop: Callable[[], None],
+    ) -> None:
+        """Register callbacks to run when the router starts and stops mocking
+
+        Args:
+            on_start (Callable[[], None]): Called after the router starts
+            on_stop (Callable[[], None]): Called before the router stops, in reverse order of registration
+        """
+        self._hooks.append((on_start, on_stop))
+
+    def start(self) -> None:
+        super().start()
+        self.activate()
+
+    def stop(self, clear: bool = True, reset: bool = True, quiet: bool = False) -> None:
+        try:
+            self.deactivate()
+        finally:
+            super().stop(clear=clear, reset=reset, quiet=quiet)
+
+    def activate(self) -> None:
+        """Run the start hooks without patching HTTPX, e.g. to serve the routes"""
+        for on_start, _ in self._hooks:
+            on_start()
+
+    def deactivate(self) -> None:
+        for _, on_stop in reversed(self._hooks):
+            on_stop()
+
+    def compile(self, routes: Iterable[respx.Route]) -> None:
+        """Compile routes into a single-pass dispatcher
+
+        Args:
+            routes (Iterable[respx.Route]): Routes registered with URL regex patterns
+        """
+        self._dispatcher = Dispatcher(routes)
+
+    def set_latency(self, lookup: Optional[LatencyLookup]) -> None:
+        """Simulate latency for resolved routes
+
+        Args:
+            lookup (Optional[LatencyLookup]): Returns the latency of a route, read on every request
+        """
+        self._latency = lookup
+
+    def _delay(self, route: Optional[respx.Route]) -> float:
+        if route is None or self._latency is None:
+            return 0.0
+        latency = self._latency(route)
+        return latency.sample(self.rng) if latency else 0.0
+
+    def _dispatch(self, request: httpx.Request) -> Optional[Dispatched]:
+        for base in self._bases.values():
+            if not base.match(request):
+                return None
+        return self._dispatcher.dispatch(request)
+
+    @staticmethod
+    def _prospect(
+        route: respx.Route,
+        request: httpx.Request,
+        context: Dict[str, Any],
+    ) -> RouteResultTypes:
+        if route.is_pass_through:
+            return request
+        return route.resolve(request, **context)
+
+    def resolve(self, request: httpx.Request) -> ResolvedRoute:
+        with self.resolver(request) as resolved:
+            prospect: RouteResultTypes = None
+
+            dispatched = self._dispatch(request)
+            if dispatched is not None:
+                route, context = dispatched
+                prospect = self._prospect(route, request, context)
+                if inspect.isawaitable(prospect):
+                    prospect = self._wait(route, prospect)
+                if prospect is not None:
+                    resolved.route = route
+
+            if prospect is None:
+                for route in self.routes:
+                    # NOTE: the side effect of a dispatched route already ran once
+                    if dispatched is not None and route is dispatched[0]:
+                        continue
+                    prospect = route.match(request)
+                    if inspect.isawaitable(prospect):
+                        prospect = self._wait(route, prospect)
+                    if prospect is not None:
+                        resolved.route = route
+                        break
+
+            resolved.response = cast(ResolvedResponseTypes, prospect)
+
+        if resolved.response:
+            self.clock.sleep(self._delay(resolved.route))
+
+        if resolved.response and isinstance(resolved.response.stream, httpx.ByteStream):
+            resolved.response.read()  # Pre-read stream
+
+        return resolved
+
+    async def aresolve(self, request: httpx.Request) -> ResolvedRoute:
+        with self.resolver(request) as resolved:
+            prospect: RouteResultTypes = None
+
+            dispatched = self._dispatch(request)
+            if dispatched is not None:
+                route, context = dispatched
+                if self.offload:
+                    # NOTE: build and serialize in a worker thread, off the event loop
+                    loop = asyncio.get_running_loop()
+                    prospect = await loop.run_in_executor(
+                        None, partial(self._prospect, route, request, context)
+                    )
+                else:
+                    prospect = self._prospect(route, request, context)
+                prospect = await self._await(route, prospect)
+                if prospect is not None:
+                    resolved.route = route
+
+            if prospect is None:
+                for route in self.routes:
+                    if dispatched is not None and route is dispatched[0]:
+                        continue
+                    prospect = await self._await(route, route.match(request))
+                    if prospect is not None:
+                        resolved.route = route
+                        break
+
+            resolved.response = cast(ResolvedResponseTypes, prospect)
+
+        if resolved.response:
+            await self.clock.asleep(self._delay(resolved.route))
+
+        if resolved.response and isinstance(resolved.response.stream, httpx.ByteStream):
+            await resolved.response.aread()  # Pre-read stream
+        elif isinstance(resolved.response, httpx.Response) and not isinstance(
+            resolved.response.stream, httpx.AsyncByteStream
+        ):
+            stream = cast(Iterable[bytes], resolved.response.stream)
+            resolved.response.stream = AsyncIteratorStream(stream, self.offload)
+
+        return resolved
+
+    @staticmethod
+    def _wait(route: respx.Route, prospect: Awaitable[Any]) -> RouteResultTypes:
+        try:
+            return _run_sync(prospect)
+        except Exception as error:
+            raise SideEffectError(route, origin=error) from error
+
+    @staticmethod
+    async def _await(route: respx.Route, prospect: Any) -> RouteResultTypes:
+        # NOTE: await async side effects and wrap errors the same way RESPX does
+        if inspect.isawaitable(prospect):
+            try:
+                prospect = await prospect
+            except Exception as error:
+                raise SideEffectError(route, origin=error) from error
+        return prospect
@@ -1,7 +1,11 @@
+from typing import Any, Iterator
+
 import respx
 
 from ..stores import StateStore
 
+from ._base import Route
+
 from .chat import ChatCompletionsCreateRoute
 from .embeddings import EmbeddingsCreateRoute
 from .files import (
@@ -45,9 +49,19 @@ __all__ = [
     "ModelRoutes",
     "ModerationsRoutes",
     "VectorStoreRoutes",
+    "iter_routes",
 ]
 
 
+def iter_routes(obj: object) -> Iterator[Route[Any, Any]]:
+    """Recursively yield every route of a route group"""
+    for value in vars(obj).values():
+        if isinstance(value, Route):
+            yield value
+        elif type(value).__module__.startswith(__name__):
+            yield from iter_routes(value)
+
+
 class ChatRoutes:
     def __init__(self, router: respx.MockRouter) -> None:
         self.completions = ChatCompletionRoutes(router)
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from functools import partial
 import inspect
-from typing import Any, Callable, Generic, Union
+from typing import Any, Awaitable, Callable, Dict, Generic, Iterable, Optional, Union
 from typing_extensions import override
 
 import httpx
@@ -9,12 +9,16 @@ import respx
 
 from openai import BaseModel
 
+from ..latency import Latency, as_latency
 from ..stores import StateStore
 from .._types.generics import M, P
-from .._utils.serde import model_dict
+from .._utils.serde import json_response, model_dict, model_json
+from .._utils.template import VOLATILE_FIELDS, ResponseTemplate
 
 __all__ = ["StatelessRoute", "StatefulRoute"]
 
+Handler = Callable[..., Union[httpx.Response, Awaitable[httpx.Response]]]
+
 
 class Route(ABC, Generic[M, P]):
     def __init__(
@@ -24,55 +28,117 @@ class Route(ABC, Generic[M, P]):
     ) -> None:
         self._route = route
         self._status_code = status_code
-        self._response: Union[httpx.Response, M, P, Callable[..., httpx.Response]] = (
-            self._handler
-        )
+        self._response: Union[httpx.Response, M, P, Handler] = self._handler
         self._route.side_effect = self._response
+        self._cache_response = False
+        self._template: Optional[ResponseTemplate] = None
+        self._latency: Optional[Latency] = None
 
     @property
     def route(self) -> respx.Route:
         return self._route
 
     @property
-    def response(self) -> Union[httpx.Response, M, P, Callable[..., httpx.Response]]:
+    def response(self) -> Union[httpx.Response, M, P, Handler]:
         return self._response
 
     @response.setter
     def response(
         self,
-        value: Union[httpx.Response, M, P, Callable[..., httpx.Response]],
+        value: Union[httpx.Response, M, P, Handler],
     ) -> None:
         """
         Sets the value of route response. See docs for more details and examples.
 
         Args:
-            value: Either an HTTPX response, an OpenAI model, a partial model, or a callable that returns an HTTPX response
+            value: Either an HTTPX response, an OpenAI model, a partial model, or a sync or async callable that returns an HTTPX response
         """
         self._response = value
+        self._template = None
         self._route.side_effect = self._side_effect
 
     @property
-    def _side_effect(self) -> Callable[..., httpx.Response]:
+    def cache_response(self) -> bool:
+        return self._cache_response
+
+    @cache_response.setter
+    def cache_response(self, value: bool) -> None:
+        """
+        Serialize a model or partial response once and reuse the encoded body for
+        every call. Only the top-level `id`, `created`, and `created_at` fields are
+        regenerated per call, and only when they are not set by a partial.
+
+        Args:
+            value (bool): Whether to cache the serialized response
+        """
+        self._cache_response = value
+        self._template = None
+
+    @property
+    def latency(self) -> Optional[Latency]:
+        return self._latency
+
+    @latency.setter
+    def latency(self, value: Union[Latency, float, None]) -> None:
+        """
+        Delay every response from this route. Async clients wait with `asyncio.sleep`
+        and the mock clock decides whether the wait is real. See docs for details.
+
+        Args:
+            value (Union[Latency, float, None]): Latency distribution, fixed delay in seconds, or None for no delay
+        """
+        self._latency = as_latency(value)
+
+    def _reset(self) -> None:
+        """Restore the default response handler"""
+        self._response = self._handler
+        self._cache_response = False
+        self._template = None
+        self._latency = None
+        self._route.return_value = None
+        self._route.side_effect = self._response
+
+    def _cached(
+        self,
+        build: Callable[[], Dict[str, Any]],
+        volatile: Iterable[str] = (),
+    ) -> httpx.Response:
+        if self._template is None:
+            self._template = ResponseTemplate(build(), volatile)
+        return httpx.Response(
+            status_code=self._status_code,
+            content=self._template.render(),
+            headers={"content-type": "application/json"},
+        )
+
+    @property
+    def _side_effect(self) -> Handler:
         if callable(self._response):
             return self._response
 
         def _handler(request: httpx.Request, route: respx.Route, **kwargs: Any):
             if isinstance(self._response, BaseModel):
-                return httpx.Response(
-                    status_code=self._status_code,
-                    json=model_dict(self._response),
-                )
+                if self._cache_response:
+                    response = self._response
+                    return self._cached(lambda: model_dict(response))
+
+                return json_response(self._status_code, self._response)
 
             elif isinstance(self._response, httpx.Response):
                 return self._response
 
             else:
                 assert not callable(self._response)
-                return httpx.Response(
-                    status_code=self._status_code,
-                    json=model_dict(
-                        self._build(self._response, request), by_alias=True
-                    ),
+                if self._cache_response:
+                    value = self._response
+                    return self._cached(
+                        lambda: model_dict(self._build(value, request), by_alias=True),
+                        volatile=(f for f in VOLATILE_FIELDS if f not in value),
+                    )
+
+                return json_response(
+                    self._status_code,
+                    model_json(self._build(self._response, request), by_alias=True),
                 )
 
         return _handler
@@ -94,10 +160,7 @@ class Route(ABC, Generic[M, P]):
         self._route = route
         empty: Any = {}  # NOTE: avoids mypy complaint
         model = self._build(empty, request)
-        return httpx.Response(
-            status_code=self._status_code,
-            json=model_dict(model),
-        )
+        return json_response(self._status_code, model)
 
     @staticmethod
     @abstractmethod
@@ -132,7 +195,7 @@ class StatefulRoute(Route[M, P]):
 
     @property
     @override
-    def _side_effect(self) -> Callable[..., httpx.Response]:
+    def _side_effect(self) -> Handler:
         if callable(self._response):
             argspec = inspect.getfullargspec(self._response)
             needs_store = (
@@ -146,10 +209,11 @@ class StatefulRoute(Route[M, P]):
         def _handler(request: httpx.Request, route: respx.Route, **kwargs: Any):
             if isinstance(self._response, BaseModel):
                 self._state._blind_put(self._response)
-                return httpx.Response(
-                    status_code=self._status_code,
-                    json=model_dict(self._response),
-                )
+                if self._cache_response:
+                    response = self._response
+                    return self._cached(lambda: model_dict(response))
+
+                return json_response(self._status_code, self._response)
 
             elif isinstance(self._response, httpx.Response):
                 return self._response
@@ -159,10 +223,7 @@ class StatefulRoute(Route[M, P]):
                 try:
                     model = self._build(self._response, request)
                     self._state._blind_put(model)
-                    return httpx.Response(
-                        status_code=self._status_code,
-                        json=model_dict(model),
-                    )
+                    return json_response(self._status_code, model)
                 except NotImplementedError:
                     import warnings
 
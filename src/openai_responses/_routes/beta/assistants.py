@@ -1,4 +1,3 @@
-import json
 from typing import Any, List, Literal
 from typing_extensions import override
 
@@ -24,7 +23,13 @@ from ..._types.partials.sync_cursor_page import PartialSyncCursorPage
 from ..._types.partials.assistants import PartialAssistant
 
 from ..._utils.faker import faker
-from ..._utils.serde import json_loads, model_dict, model_parse
+from ..._utils.serde import (
+    json_dumps,
+    json_loads,
+    json_response,
+    model_dict,
+    model_parse,
+)
 from ..._utils.time import utcnow_unix_timestamp_s
 
 __all__ = [
@@ -58,7 +63,7 @@ class AssistantCreateRoute(StatefulRoute[Assistant, PartialAssistant]):
                 if vector_stores:
                     vector_store_ids: List[str] = []
                     for vector_store_create_params in vector_stores:
-                        encoded = json.dumps(vector_store_create_params)
+                        encoded = json_dumps(vector_store_create_params)
                         create_req = httpx.Request("", "", content=encoded)
                         vector_store = vector_store_from_create_request(create_req)
                         vector_store_ids.append(vector_store.id)
@@ -67,7 +72,7 @@ class AssistantCreateRoute(StatefulRoute[Assistant, PartialAssistant]):
                             found_file = self._state.files.get(file_id)
                             if not found_file:
                                 return httpx.Response(404)
-                            encoded = json.dumps({"file_id": found_file.id})
+                            encoded = json_dumps({"file_id": found_file.id})
                             create_file_req = httpx.Request("", "", content=encoded)
                             vector_store_file = vector_store_file_from_create_request(
                                 create_file_req,
@@ -87,10 +92,7 @@ class AssistantCreateRoute(StatefulRoute[Assistant, PartialAssistant]):
                     )
 
         self._state.beta.assistants.put(model)
-        return httpx.Response(
-            status_code=self._status_code,
-            json=model_dict(model),
-        )
+        return json_response(self._status_code, model)
 
     @staticmethod
     def _build(partial: PartialAssistant, request: httpx.Request) -> Assistant:
@@ -123,18 +125,16 @@ class AssistantListRoute(
         after = request.url.params.get("after")
         before = request.url.params.get("before")
 
-        data = self._state.beta.assistants.list(limit, order, after, before)
-        result_count = len(data)
-        total_count = len(self._state.beta.assistants.list())
-        has_data = bool(result_count)
-        has_more = total_count != result_count
-        first_id = data[0].id if has_data else None
-        last_id = data[-1].id if has_data else None
-        model = SyncCursorPage[Assistant](data=data)
-        return httpx.Response(
-            status_code=200,
-            json=model_dict(model)
-            | {"first_id": first_id, "last_id": last_id, "has_more": has_more},
+        page = self._state.beta.assistants.list(limit, order, after, before)
+        model = SyncCursorPage[Assistant](data=page)
+        return json_response(
+            200,
+            model_dict(model)
+            | {
+                "first_id": page.first_id,
+                "last_id": page.last_id,
+                "has_more": page.has_more,
+            },
         )
 
     @staticmethod
@@ -168,7 +168,7 @@ class AssistantRetrieveRoute(StatefulRoute[Assistant, PartialAssistant]):
         if not found:
             return httpx.Response(404)
 
-        return httpx.Response(status_code=200, json=model_dict(found))
+        return json_response(200, found)
 
     @staticmethod
     def _build(partial: PartialAssistant, request: httpx.Request) -> Assistant:
@@ -203,7 +203,7 @@ class AssistantUpdateRoute(StatefulRoute[Assistant, PartialAssistant]):
         updated = model_parse(Assistant, deserialized | content)
         self._state.beta.assistants.put(updated)
 
-        return httpx.Response(status_code=200, json=model_dict(updated))
+        return json_response(200, updated)
 
     @staticmethod
     def _build(partial: PartialAssistant, request: httpx.Request) -> Assistant:
@@ -234,12 +234,10 @@ class AssistantDeleteRoute(
         self._route = route
         assistant_id = kwargs["assistant_id"]
         deleted = self._state.beta.assistants.delete(assistant_id)
-        return httpx.Response(
-            status_code=200,
-            json=model_dict(
-                AssistantDeleted(
-                    id=assistant_id, deleted=deleted, object="assistant.deleted"
-                )
+        return json_response(
+            200,
+            AssistantDeleted(
+                id=assistant_id, deleted=deleted, object="assistant.deleted"
             ),
         )
 
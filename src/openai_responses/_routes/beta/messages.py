@@ -16,7 +16,7 @@ from ..._types.partials.sync_cursor_page import PartialSyncCursorPage
 from ..._types.partials.messages import PartialMessage, PartialMessageDeleted
 
 from ..._utils.faker import faker
-from ..._utils.serde import json_loads, model_dict, model_parse
+from ..._utils.serde import json_loads, json_response, model_dict, model_parse
 from ..._utils.time import utcnow_unix_timestamp_s
 
 __all__ = [
@@ -54,10 +54,7 @@ class MessageCreateRoute(StatefulRoute[Message, PartialMessage]):
 
         model = self._build({"thread_id": thread_id}, request)
         self._state.beta.threads.messages.put(model)
-        return httpx.Response(
-            status_code=self._status_code,
-            json=model_dict(model),
-        )
+        return json_response(self._status_code, model)
 
     @staticmethod
     def _build(partial: PartialMessage, request: httpx.Request) -> Message:
@@ -129,7 +126,7 @@ class MessageListRoute(
         before = request.url.params.get("before")
         run_id = request.url.params.get("run_id")
 
-        data = self._state.beta.threads.messages.list(
+        page = self._state.beta.threads.messages.list(
             thread_id,
             limit,
             order,
@@ -137,17 +134,15 @@ class MessageListRoute(
             before,
             run_id,
         )
-        result_count = len(data)
-        total_count = len(self._state.beta.threads.messages.list(thread_id))
-        has_data = bool(result_count)
-        has_more = total_count != result_count
-        first_id = data[0].id if has_data else None
-        last_id = data[-1].id if has_data else None
-        model = SyncCursorPage[Message](data=data)
-        return httpx.Response(
-            status_code=200,
-            json=model_dict(model)
-            | {"first_id": first_id, "last_id": last_id, "has_more": has_more},
+        model = SyncCursorPage[Message](data=page)
+        return json_response(
+            200,
+            model_dict(model)
+            | {
+                "first_id": page.first_id,
+                "last_id": page.last_id,
+                "has_more": page.has_more,
+            },
         )
 
     @staticmethod
@@ -187,7 +182,7 @@ class MessageRetrieveRoute(StatefulRoute[Message, PartialMessage]):
         if not found_message:
             return httpx.Response(404)
 
-        return httpx.Response(status_code=200, json=model_dict(found_message))
+        return json_response(200, found_message)
 
     @staticmethod
     def _build(partial: PartialMessage, request: httpx.Request) -> Message:
@@ -228,7 +223,7 @@ class MessageUpdateRoute(StatefulRoute[Message, PartialMessage]):
         updated = model_parse(Message, deserialized | content)
         self._state.beta.threads.messages.put(updated)
 
-        return httpx.Response(status_code=200, json=model_dict(updated))
+        return json_response(200, updated)
 
     @staticmethod
     def _build(partial: PartialMessage, request: httpx.Request) -> Message:
@@ -261,12 +256,10 @@ class MessageDeleteRoute(StatefulRoute[MessageDeleted, PartialMessageDeleted]):
 
         message_id = kwargs["message_id"]
         deleted = self._state.beta.threads.messages.delete(message_id)
-        return httpx.Response(
-            status_code=200,
-            json=model_dict(
-                MessageDeleted(
-                    id=message_id, deleted=deleted, object="thread.message.deleted"
-                )
+        return json_response(
+            200,
+            MessageDeleted(
+                id=message_id, deleted=deleted, object="thread.message.deleted"
             ),
         )
 
@@ -13,7 +13,7 @@ from ...stores import StateStore
 from ..._types.partials.run_steps import PartialRunStep
 from ..._types.partials.sync_cursor_page import PartialSyncCursorPage
 
-from ..._utils.serde import model_dict
+from ..._utils.serde import json_response, model_dict
 
 
 __all__ = ["RunStepListRoute", "RunStepRetrieveRoute"]
@@ -55,7 +55,7 @@ class RunStepListRoute(
         after = request.url.params.get("after")
         before = request.url.params.get("before")
 
-        data = self._state.beta.threads.runs.steps.list(
+        page = self._state.beta.threads.runs.steps.list(
             thread_id,
             run_id,
             limit,
@@ -63,17 +63,15 @@ class RunStepListRoute(
             after,
             before,
         )
-        result_count = len(data)
-        total_count = len(self._state.beta.threads.runs.steps.list(thread_id, run_id))
-        has_data = bool(result_count)
-        has_more = total_count != result_count
-        first_id = data[0].id if has_data else None
-        last_id = data[-1].id if has_data else None
-        model = SyncCursorPage[RunStep](data=data)
-        return httpx.Response(
-            status_code=200,
-            json=model_dict(model)
-            | {"first_id": first_id, "last_id": last_id, "has_more": has_more},
+        model = SyncCursorPage[RunStep](data=page)
+        return json_response(
+            200,
+            model_dict(model)
+            | {
+                "first_id": page.first_id,
+                "last_id": page.last_id,
+                "has_more": page.has_more,
+            },
         )
 
     @staticmethod
@@ -118,7 +116,7 @@ class RunStepRetrieveRoute(StatefulRoute[RunStep, PartialRunStep]):
         if not found_run_step:
             return httpx.Response(404)
 
-        return httpx.Response(status_code=200, json=model_dict(found_run_step))
+        return json_response(200, found_run_step)
 
     @staticmethod
     def _build(partial: PartialRunStep, request: httpx.Request) -> RunStep:
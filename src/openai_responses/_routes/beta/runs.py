@@ -1,11 +1,11 @@
-import json
-from typing import Any
+from typing import Any, List
 from typing_extensions import override
 
 import httpx
 import respx
 
 from openai.pagination import SyncCursorPage
+from openai.types.beta.threads.message import Message
 from openai.types.beta.threads.run import Run
 from openai.types.beta.threads.run_create_params import RunCreateParams
 from openai.types.beta.threads.run_update_params import RunUpdateParams
@@ -22,7 +22,13 @@ from ..._types.partials.runs import PartialRun
 
 from ..._utils.copy import model_copy
 from ..._utils.faker import faker
-from ..._utils.serde import json_loads, model_dict, model_parse
+from ..._utils.serde import (
+    json_dumps,
+    json_loads,
+    json_response,
+    model_dict,
+    model_parse,
+)
 from ..._utils.time import utcnow_unix_timestamp_s
 
 
@@ -77,10 +83,7 @@ class RunCreateRoute(StatefulRoute[Run, PartialRun]):
             request,
         )
         self._state.beta.threads.runs.put(model)
-        return httpx.Response(
-            status_code=self._status_code,
-            json=model_dict(model),
-        )
+        return json_response(self._status_code, model)
 
     @staticmethod
     def _build(partial: PartialRun, request: httpx.Request) -> Run:
@@ -115,16 +118,15 @@ class ThreadCreateAndRun(StatefulRoute[Run, PartialRun]):
             return httpx.Response(404)
 
         thread_create_params = content.get("thread", {})
-        encoded = json.dumps(thread_create_params).encode("utf-8")
+        encoded = json_dumps(thread_create_params)
         thread_create_req = httpx.Request("", "", content=encoded)
         thread = thread_from_create_request(thread_create_req)
-        self._state.beta.threads.put(thread)
 
+        messages: List[Message] = []
         for message_create_params in thread_create_params.get("messages", []):
-            encoded = json.dumps(message_create_params).encode("utf-8")
+            encoded = json_dumps(message_create_params)
             create_message_req = httpx.Request(method="", url="", content=encoded)
-            message = message_from_create_request(thread.id, create_message_req)
-            self._state.beta.threads.messages.put(message)
+            messages.append(message_from_create_request(thread.id, create_message_req))
 
         model = self._build(
             {
@@ -135,11 +137,15 @@ class ThreadCreateAndRun(StatefulRoute[Run, PartialRun]):
             },
             request,
         )
-        self._state.beta.threads.runs.put(model)
-        return httpx.Response(
-            status_code=self._status_code,
-            json=model_dict(model),
-        )
+
+        with self._state.transaction():
+            for message in messages:
+                self._state.beta.threads.messages.put(message)
+            self._state.beta.threads.runs.put(model)
+            # NOTE: stored last so readers never find the thread without its messages
+            self._state.beta.threads.put(thread)
+
+        return json_response(self._status_code, model)
 
     @staticmethod
     def _build(partial: PartialRun, request: httpx.Request) -> Run:
@@ -179,24 +185,22 @@ class RunListRoute(
         after = request.url.params.get("after")
         before = request.url.params.get("before")
 
-        data = self._state.beta.threads.runs.list(
+        page = self._state.beta.threads.runs.list(
             thread_id,
             limit,
             order,
             after,
             before,
         )
-        result_count = len(data)
-        total_count = len(self._state.beta.threads.runs.list(thread_id))
-        has_data = bool(result_count)
-        has_more = total_count != result_count
-        first_id = data[0].id if has_data else None
-        last_id = data[-1].id if has_data else None
-        model = SyncCursorPage[Run](data=data)
-        return httpx.Response(
-            status_code=200,
-            json=model_dict(model)
-            | {"first_id": first_id, "last_id": last_id, "has_more": has_more},
+        model = SyncCursorPage[Run](data=page)
+        return json_response(
+            200,
+            model_dict(model)
+            | {
+                "first_id": page.first_id,
+                "last_id": page.last_id,
+                "has_more": page.has_more,
+            },
         )
 
     @staticmethod
@@ -236,7 +240,7 @@ class RunRetrieveRoute(StatefulRoute[Run, PartialRun]):
         if not found_run:
             return httpx.Response(404)
 
-        return httpx.Response(status_code=200, json=model_dict(found_run))
+        return json_response(200, found_run)
 
     @staticmethod
     def _build(partial: PartialRun, request: httpx.Request) -> Run:
@@ -277,7 +281,7 @@ class RunUpdateRoute(StatefulRoute[Run, PartialRun]):
         updated = model_parse(Run, deserialized | content)
         self._state.beta.threads.runs.put(updated)
 
-        return httpx.Response(status_code=200, json=model_dict(updated))
+        return json_response(200, updated)
 
     @staticmethod
     def _build(partial: PartialRun, request: httpx.Request) -> Run:
@@ -314,7 +318,7 @@ class RunSubmitToolOutputsRoute(StatefulRoute[Run, PartialRun]):
         if not found_run:
             return httpx.Response(404)
 
-        return httpx.Response(status_code=200, json=model_dict(found_run))
+        return json_response(200, found_run)
 
     @staticmethod
     def _build(partial: PartialRun, request: httpx.Request) -> Run:
@@ -351,12 +355,13 @@ class RunCancelRoute(StatefulRoute[Run, PartialRun]):
         if not found_run:
             return httpx.Response(404)
 
-        found_run.status = "cancelled"
-        self._state.beta.threads.runs.put(found_run)
-        copy = model_copy(found_run)
+        cancelled = model_copy(found_run)
+        cancelled.status = "cancelled"
+        self._state.beta.threads.runs.put(cancelled)
+        copy = model_copy(cancelled)
         copy.status = "cancelling"
 
-        return httpx.Response(status_code=200, json=model_dict(copy))
+        return json_response(200, copy)
 
     @staticmethod
     def _build(partial: PartialRun, request: httpx.Request) -> Run:
@@ -1,4 +1,3 @@
-import json
 from typing import Any, List, Literal
 from typing_extensions import override
 
@@ -6,9 +5,12 @@ import httpx
 import respx
 
 from openai.types.beta.thread import Thread
+from openai.types.beta.threads.message import Message
 from openai.types.beta.thread_create_params import ThreadCreateParams
 from openai.types.beta.thread_update_params import ThreadUpdateParams
 from openai.types.beta.thread_deleted import ThreadDeleted
+from openai.types.vector_store import VectorStore
+from openai.types.vector_stores.vector_store_file import VectorStoreFile
 
 from .._base import StatefulRoute
 
@@ -22,7 +24,13 @@ from ..._types.partials.deleted import PartialResourceDeleted
 from ..._types.partials.threads import PartialThread
 
 from ..._utils.faker import faker
-from ..._utils.serde import json_loads, model_dict, model_parse
+from ..._utils.serde import (
+    json_dumps,
+    json_loads,
+    json_response,
+    model_dict,
+    model_parse,
+)
 from ..._utils.time import utcnow_unix_timestamp_s
 
 
@@ -47,59 +55,71 @@ class ThreadCreateRoute(StatefulRoute[Thread, PartialThread]):
         self._route = route
 
         content: ThreadCreateParams = json_loads(request.content)
-        model = self._build({}, request)
-        self._state.beta.threads.put(model)
-
-        for message_create_params in content.get("messages", []):
-            encoded = json.dumps(message_create_params).encode("utf-8")
-            create_message_req = httpx.Request(method="", url="", content=encoded)
-            message = message_from_create_request(model.id, create_message_req)
-            self._state.beta.threads.messages.put(message)
 
+        vector_store_params: List[Any] = []
         tool_resources = content.get("tool_resources")
         if tool_resources:
             file_search = tool_resources.get("file_search")
             if file_search:
-                vector_stores = file_search.get("vector_stores")
-                if vector_stores:
-                    vector_store_ids: List[str] = []
-                    for vector_store_create_params in vector_stores:
-                        encoded = json.dumps(vector_store_create_params)  # type: ignore
-                        create_req = httpx.Request("", "", content=encoded)
-                        vector_store = vector_store_from_create_request(create_req)
-                        vector_store_ids.append(vector_store.id)
-                        self._state.vector_stores.put(vector_store)
-                        for file_id in vector_store_create_params.get("file_ids", []):
-                            found_file = self._state.files.get(file_id)
-                            if not found_file:
-                                return httpx.Response(404)
-                            encoded = json.dumps({"file_id": found_file.id})  # type: ignore
-                            create_file_req = httpx.Request("", "", content=encoded)
-                            vector_store_file = vector_store_file_from_create_request(
-                                create_file_req,
-                                extra={"vector_store_id": vector_store.id},
-                            )
-                            self._state.vector_stores.files.put(vector_store_file)
-
-                    model = merge_thread_with_partial(
-                        model,
-                        {
-                            "tool_resources": {
-                                "file_search": {
-                                    "vector_store_ids": vector_store_ids,
-                                }
-                            }
-                        },
-                    )
-
-        return httpx.Response(
-            status_code=self._status_code,
-            json=model_dict(model),
-        )
+                vector_store_params = list(file_search.get("vector_stores") or [])
+
+        # NOTE: validate before building anything so a missing file writes nothing
+        for vector_store_create_params in vector_store_params:
+            for file_id in vector_store_create_params.get("file_ids", []):
+                if not self._state.files.get(file_id):
+                    return httpx.Response(404)
+
+        model = self._build({}, request)
+
+        messages: List[Message] = []
+        for message_create_params in content.get("messages", []):
+            encoded = json_dumps(message_create_params)
+            create_message_req = httpx.Request(method="", url="", content=encoded)
+            messages.append(message_from_create_request(model.id, create_message_req))
+
+        vector_stores: List[VectorStore] = []
+        vector_store_files: List[VectorStoreFile] = []
+        for vector_store_create_params in vector_store_params:
+            encoded = json_dumps(vector_store_create_params)
+            create_req = httpx.Request("", "", content=encoded)
+            vector_store = vector_store_from_create_request(create_req)
+            vector_stores.append(vector_store)
+            for file_id in vector_store_create_params.get("file_ids", []):
+                encoded = json_dumps({"file_id": file_id})
+                create_file_req = httpx.Request("", "", content=encoded)
+                vector_store_file = vector_store_file_from_create_request(
+                    create_file_req,
+                    extra={"vector_store_id": vector_store.id},
+                )
+                vector_store_files.append(vector_store_file)
+
+        if vector_stores:
+            model = merge_thread_with_partial(
+                model,
+                {
+                    "tool_resources": {
+                        "file_search": {
+                            "vector_store_ids": [v.id for v in vector_stores],
+                        }
+                    }
+                },
+            )
+
+        with self._state.transaction():
+            for vector_store in vector_stores:
+                self._state.vector_stores.put(vector_store)
+            for vector_store_file in vector_store_files:
+                self._state.vector_stores.files.put(vector_store_file)
+            for message in messages:
+                self._state.beta.threads.messages.put(message)
+            # NOTE: stored last so readers never find the thread without its messages
+            self._state.beta.threads.put(model)
+
+        return json_response(self._status_code, model)
 
     @staticmethod
     def _build(partial: PartialThread, request: httpx.Request) -> Thread:
-        content = json.loads(request.content)
+        content = json_loads(request.content)
         if content.get("messages"):
             del content["messages"]
         if content.get("tool_resources"):
@@ -133,7 +153,7 @@ class ThreadRetrieveRoute(StatefulRoute[Thread, PartialThread]):
         if not found:
             return httpx.Response(404)
 
-        return httpx.Response(status_code=200, json=model_dict(found))
+        return json_response(200, found)
 
     @staticmethod
     def _build(partial: PartialThread, request: httpx.Request) -> Thread:
@@ -163,12 +183,12 @@ class ThreadUpdateRoute(StatefulRoute[Thread, PartialThread]):
         if not found:
             return httpx.Response(404)
 
-        content: ThreadUpdateParams = json.loads(request.content)
+        content: ThreadUpdateParams = json_loads(request.content)
         deserialized = model_dict(found)
         updated = model_parse(Thread, deserialized | content)
         self._state.beta.threads.put(updated)
 
-        return httpx.Response(status_code=200, json=model_dict(updated))
+        return json_response(200, updated)
 
     @staticmethod
     def _build(partial: PartialThread, request: httpx.Request) -> Thread:
@@ -195,11 +215,8 @@ class ThreadDeleteRoute(
         self._route = route
         thread_id = kwargs["thread_id"]
         deleted = self._state.beta.threads.delete(thread_id)
-        return httpx.Response(
-            status_code=200,
-            json=model_dict(
-                ThreadDeleted(id=thread_id, deleted=deleted, object="thread.deleted")
-            ),
+        return json_response(
+            200, ThreadDeleted(id=thread_id, deleted=deleted, object="thread.deleted")
         )
 
     @staticmethod
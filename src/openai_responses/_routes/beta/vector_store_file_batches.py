@@ -1,4 +1,3 @@
-import json
 from typing import Any
 from typing_extensions import override
 
@@ -22,8 +21,15 @@ from ..._types.partials.sync_cursor_page import PartialSyncCursorPage
 from ..._types.partials.vector_store_files import PartialVectorStoreFile
 from ..._types.partials.vector_store_file_batches import PartialVectorStoreFileBatch
 
+from ..._utils.copy import model_copy
 from ..._utils.faker import faker
-from ..._utils.serde import json_loads, model_dict, model_parse
+from ..._utils.serde import (
+    json_dumps,
+    json_loads,
+    json_response,
+    model_dict,
+    model_parse,
+)
 from ..._utils.time import utcnow_unix_timestamp_s
 
 __all__ = [
@@ -66,7 +72,7 @@ class VectorStoreFileBatchCreateRoute(
             found_file = self._state.files.get(file_id)
             if not found_file:
                 return httpx.Response(404)
-            encoded = json.dumps({"file_id": found_file.id})
+            encoded = json_dumps({"file_id": found_file.id})
             create_file_req = httpx.Request(method="", url="", content=encoded)
             vector_store_file = vector_store_file_from_create_request(
                 create_file_req,
@@ -79,7 +85,7 @@ class VectorStoreFileBatchCreateRoute(
             )
 
         self._state.vector_stores.file_batches.put(model)
-        return httpx.Response(status_code=self._status_code, json=model_dict(model))
+        return json_response(self._status_code, model)
 
     @staticmethod
     def _build(
@@ -134,7 +140,7 @@ class VectorStoreFileBatchRetrieveRoute(
         if not found:
             return httpx.Response(404)
 
-        return httpx.Response(status_code=self._status_code, json=model_dict(found))
+        return json_response(self._status_code, found)
 
     @staticmethod
     def _build(
@@ -175,10 +181,11 @@ class VectorStoreFileBatchCancelRoute(
         if not found:
             return httpx.Response(404)
 
-        found.status = "cancelled"
-        self._state.vector_stores.file_batches.put(found)
+        cancelled = model_copy(found)
+        cancelled.status = "cancelled"
+        self._state.vector_stores.file_batches.put(cancelled)
 
-        return httpx.Response(status_code=self._status_code, json=model_dict(found))
+        return json_response(self._status_code, cancelled)
 
     @staticmethod
     def _build(
@@ -227,7 +234,7 @@ class VectorStoreFileBatchListFilesRoute(
         before = request.url.params.get("before")
         filter = request.url.params.get("filter")
 
-        data = self._state.vector_stores.list_files_for_batch(
+        page = self._state.vector_stores.list_files_for_batch(
             vector_store_id,
             batch_id,
             limit,
@@ -236,22 +243,15 @@ class VectorStoreFileBatchListFilesRoute(
             before,
             filter,
         )
-        result_count = len(data)
-        total_count = len(
-            self._state.vector_stores.list_files_for_batch(
-                vector_store_id,
-                batch_id,
-            )
-        )
-        has_data = bool(result_count)
-        has_more = total_count != result_count
-        first_id = data[0].id if has_data else None
-        last_id = data[-1].id if has_data else None
-        model = SyncCursorPage[VectorStoreFile](data=data)
-        return httpx.Response(
-            status_code=200,
-            json=model_dict(model)
-            | {"first_id": first_id, "last_id": last_id, "has_more": has_more},
+        model = SyncCursorPage[VectorStoreFile](data=page)
+        return json_response(
+            200,
+            model_dict(model)
+            | {
+                "first_id": page.first_id,
+                "last_id": page.last_id,
+                "has_more": page.has_more,
+            },
         )
 
     @staticmethod
@@ -17,7 +17,7 @@ from ..._types.partials.deleted import PartialResourceDeleted
 from ..._types.partials.sync_cursor_page import PartialSyncCursorPage
 from ..._types.partials.vector_store_files import PartialVectorStoreFile
 
-from ..._utils.serde import json_loads, model_dict, model_parse
+from ..._utils.serde import json_loads, json_response, model_dict, model_parse
 from ..._utils.time import utcnow_unix_timestamp_s
 
 __all__ = [
@@ -60,7 +60,7 @@ class VectorStoreFileCreateRoute(
             return httpx.Response(404)
 
         self._state.vector_stores.files.put(model)
-        return httpx.Response(status_code=self._status_code, json=model_dict(model))
+        return json_response(self._status_code, model)
 
     @staticmethod
     def _build(
@@ -112,7 +112,7 @@ class VectorStoreFileListRoute(
         before = request.url.params.get("before")
         filter = request.url.params.get("filter")
 
-        data = self._state.vector_stores.files.list(
+        page = self._state.vector_stores.files.list(
             vector_store_id,
             limit,
             order,
@@ -120,17 +120,15 @@ class VectorStoreFileListRoute(
             before,
             filter,
         )
-        result_count = len(data)
-        total_count = len(self._state.vector_stores.files.list(vector_store_id))
-        has_data = bool(result_count)
-        has_more = total_count != result_count
-        first_id = data[0].id if has_data else None
-        last_id = data[-1].id if has_data else None
-        model = SyncCursorPage[VectorStoreFile](data=data)
-        return httpx.Response(
-            status_code=200,
-            json=model_dict(model)
-            | {"first_id": first_id, "last_id": last_id, "has_more": has_more},
+        model = SyncCursorPage[VectorStoreFile](data=page)
+        return json_response(
+            200,
+            model_dict(model)
+            | {
+                "first_id": page.first_id,
+                "last_id": page.last_id,
+                "has_more": page.has_more,
+            },
         )
 
     @staticmethod
@@ -171,7 +169,7 @@ class VectorStoreFileRetrieveRoute(
         if not found:
             return httpx.Response(404)
 
-        return httpx.Response(status_code=self._status_code, json=model_dict(found))
+        return json_response(self._status_code, found)
 
     @staticmethod
     def _build(
@@ -216,14 +214,12 @@ class VectorStoreFileDeleteRoute(
 
         deleted = self._state.vector_stores.files.delete(file_id)
 
-        return httpx.Response(
-            status_code=200,
-            json=model_dict(
-                VectorStoreFileDeleted(
-                    id=file_id,
-                    deleted=deleted,
-                    object="vector_store.file.deleted",
-                )
+        return json_response(
+            200,
+            VectorStoreFileDeleted(
+                id=file_id,
+                deleted=deleted,
+                object="vector_store.file.deleted",
             ),
         )
 
@@ -1,4 +1,3 @@
-import json
 from typing import Any
 from typing_extensions import override
 
@@ -24,7 +23,13 @@ from ..._types.partials.vector_stores import (
 )
 
 from ..._utils.faker import faker
-from ..._utils.serde import json_loads, model_dict, model_parse
+from ..._utils.serde import (
+    json_dumps,
+    json_loads,
+    json_response,
+    model_dict,
+    model_parse,
+)
 from ..._utils.time import utcnow_unix_timestamp_s
 
 __all__ = [
@@ -55,7 +60,7 @@ class VectorStoreCreateRoute(StatefulRoute[VectorStore, PartialVectorStore]):
             found_file = self._state.files.get(file_id)
             if not found_file:
                 return httpx.Response(404)
-            encoded = json.dumps({"file_id": found_file.id})
+            encoded = json_dumps({"file_id": found_file.id})
             create_file_req = httpx.Request(method="", url="", content=encoded)
             vector_store_file = vector_store_file_from_create_request(
                 create_file_req,
@@ -63,7 +68,7 @@ class VectorStoreCreateRoute(StatefulRoute[VectorStore, PartialVectorStore]):
             )
             self._state.vector_stores.files.put(vector_store_file)
 
-        return httpx.Response(status_code=self._status_code, json=model_dict(model))
+        return json_response(self._status_code, model)
 
     @staticmethod
     def _build(partial: PartialVectorStore, request: httpx.Request) -> VectorStore:
@@ -109,18 +114,16 @@ class VectorStoreListRoute(
         after = request.url.params.get("after")
         before = request.url.params.get("before")
 
-        data = self._state.vector_stores.list(limit, order, after, before)
-        result_count = len(data)
-        total_count = len(self._state.vector_stores.list())
-        has_data = bool(result_count)
-        has_more = total_count != result_count
-        first_id = data[0].id if has_data else None
-        last_id = data[-1].id if has_data else None
-        model = SyncCursorPage[VectorStore](data=data)
-        return httpx.Response(
-            status_code=200,
-            json=model_dict(model)
-            | {"first_id": first_id, "last_id": last_id, "has_more": has_more},
+        page = self._state.vector_stores.list(limit, order, after, before)
+        model = SyncCursorPage[VectorStore](data=page)
+        return json_response(
+            200,
+            model_dict(model)
+            | {
+                "first_id": page.first_id,
+                "last_id": page.last_id,
+                "has_more": page.has_more,
+            },
         )
 
     @staticmethod
@@ -154,7 +157,7 @@ class VectorStoreRetrieveRoute(StatefulRoute[VectorStore, PartialVectorStore]):
         if not found:
             return httpx.Response(404)
 
-        return httpx.Response(status_code=self._status_code, json=model_dict(found))
+        return json_response(self._status_code, found)
 
     @staticmethod
     def _build(partial: PartialVectorStore, request: httpx.Request) -> VectorStore:
@@ -187,7 +190,7 @@ class VectorStoreUpdateRoute(StatefulRoute[VectorStore, PartialVectorStore]):
         content: VectorStoreUpdateParams = json_loads(request.content)
         deserialized = model_dict(found)
         updated = model_parse(VectorStore, deserialized | content)
-        return httpx.Response(status_code=self._status_code, json=model_dict(updated))
+        return json_response(self._status_code, updated)
 
     @staticmethod
     def _build(partial: PartialVectorStore, request: httpx.Request) -> VectorStore:
@@ -216,14 +219,12 @@ class VectorStoreDeleteRoute(
         self._route = route
         vector_store_id = kwargs["vector_store_id"]
         deleted = self._state.vector_stores.delete(vector_store_id)
-        return httpx.Response(
-            status_code=200,
-            json=model_dict(
-                VectorStoreDeleted(
-                    id=vector_store_id,
-                    deleted=deleted,
-                    object="vector_store.deleted",
-                )
+        return json_response(
+            200,
+            VectorStoreDeleted(
+                id=vector_store_id,
+                deleted=deleted,
+                object="vector_store.deleted",
             ),
         )
 
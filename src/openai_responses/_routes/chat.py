@@ -1,9 +1,12 @@
+from typing import Any, Dict, Optional, Union
+
 import httpx
 import respx
 
+from openai import BaseModel
 from openai.types.chat.chat_completion import ChatCompletion
 
-from ._base import StatelessRoute
+from ._base import Handler, StatelessRoute
 
 from .._types.partials.chat import PartialChatCompletion
 
@@ -11,6 +14,9 @@ from .._utils.faker import faker
 from .._utils.serde import json_loads, model_parse
 from .._utils.time import utcnow_unix_timestamp_s
 
+from ..latency import SYSTEM_CLOCK, Latency
+from ..streaming import ChatCompletionEventStream
+
 __all__ = ["ChatCompletionsCreateRoute"]
 
 
@@ -20,16 +26,99 @@ class ChatCompletionsCreateRoute(StatelessRoute[ChatCompletion, PartialChatCompl
             route=router.post(url__regex="/chat/completions"),
             status_code=201,
         )
+        self._router = router
+        self.stream_delta_size = 4
+        """Characters of content per chunk when streaming the built completion"""
+
+        self.time_to_first_token: Union[Latency, float, None] = None
+        """Delay before the first streamed chunk"""
+
+        self.inter_token_delay: Union[Latency, float, None] = None
+        """Delay before each streamed chunk after the first"""
+
+    def _reset(self) -> None:
+        super()._reset()
+        self.stream_delta_size = 4
+        self.time_to_first_token = None
+        self.inter_token_delay = None
+
+    @property
+    def _side_effect(self) -> Handler:
+        side_effect = super()._side_effect
+        if callable(self._response) or isinstance(self._response, httpx.Response):
+            return side_effect
+
+        def _handler(request: httpx.Request, route: respx.Route, **kwargs: Any):
+            content = _stream_content(request)
+            if content is None:
+                return side_effect(request, route, **kwargs)
+
+            if isinstance(self._response, BaseModel):
+                completion = self._response
+            else:
+                assert not callable(self._response)
+                assert not isinstance(self._response, httpx.Response)
+                completion = _completion(self._response, content)
+            return self._stream(completion, content)
+
+        return _handler
+
+    def _handler(
+        self,
+        request: httpx.Request,
+        route: respx.Route,
+    ) -> httpx.Response:
+        content = _stream_content(request)
+        if content is None:
+            return super()._handler(request, route)
+
+        self._route = route
+        return self._stream(_completion({}, content), content)
+
+    def _stream(
+        self,
+        completion: ChatCompletion,
+        content: Dict[str, Any],
+    ) -> httpx.Response:
+        stream_options = content.get("stream_options") or {}
+        stream = ChatCompletionEventStream(
+            completion,
+            delta_size=self.stream_delta_size,
+            include_usage=bool(stream_options.get("include_usage")),
+        )
+        stream.time_to_first_token = self.time_to_first_token
+        stream.inter_token_delay = self.inter_token_delay
+        stream.clock = getattr(self._router, "clock", SYSTEM_CLOCK)
+        stream.rng = getattr(self._router, "rng", None)
+        return httpx.Response(
+            status_code=self._status_code,
+            stream=stream,
+            headers={"content-type": "text/event-stream"},
+        )
 
     @staticmethod
     def _build(
         partial: PartialChatCompletion,
         request: httpx.Request,
     ) -> ChatCompletion:
-        content = json_loads(request.content)
-        defaults: PartialChatCompletion = {
-            "id": partial.get("id", faker.chat.completion.id()),
-            "created": partial.get("created", utcnow_unix_timestamp_s()),
-            "object": "chat.completion",
-        }
-        return model_parse(ChatCompletion, defaults | partial | content)
+        return _completion(partial, json_loads(request.content))
+
+
+def _completion(
+    partial: PartialChatCompletion,
+    content: Dict[str, Any],
+) -> ChatCompletion:
+    defaults: PartialChatCompletion = {
+        "id": partial.get("id", faker.chat.completion.id()),
+        "created": partial.get("created", utcnow_unix_timestamp_s()),
+        "object": "chat.completion",
+    }
+    return model_parse(ChatCompletion, defaults | partial | content)
+
+
+def _stream_content(request: httpx.Request) -> Optional[Dict[str, Any]]:
+    """Parsed body of a request that asks for a stream, None for any other request"""
+    if not request.content:
+        return None
+    content: Dict[str, Any] = json_loads(request.content)
+    return content if content.get("stream") is True else None
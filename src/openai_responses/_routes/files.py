@@ -1,10 +1,8 @@
-import sys
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Iterable, Iterator, Optional, Tuple, Union
 from typing_extensions import override
 
 import httpx
 import respx
-from requests_toolbelt.multipart import decoder
 
 from openai.pagination import SyncPage
 from openai.types.file_object import FileObject
@@ -13,6 +11,7 @@ from openai.types.file_deleted import FileDeleted
 from ._base import StatefulRoute
 
 from ..stores import StateStore
+from ..stores.content_store import SpilledContent, iter_chunks
 from .._types.partials.files import (
     PartialFileObject,
     PartialFileList,
@@ -20,13 +19,78 @@ from .._types.partials.files import (
 )
 
 from .._utils.faker import faker
-from .._utils.serde import model_dict
+from .._utils.multipart import MultipartError, boundary_from_content_type, iter_parts
+from .._utils.serde import json_response
 from .._utils.time import utcnow_unix_timestamp_s
 
 
 __all__ = ["FileCreateRoute", "FileListRoute", "FileRetrieveRoute", "FileDeleteRoute"]
 
 
+class ContentStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Response body that reads stored file content in chunks
+
+    The stream can be iterated more than once, e.g. to read a recorded call's
+    response after the client consumed it.
+    """
+
+    def __init__(
+        self,
+        content: Union[bytes, SpilledContent],
+        chunk_size: int,
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> None:
+        self._content = content
+        self._chunk_size = chunk_size
+        self._start = start
+        self._end = end
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from iter_chunks(self._content, self._chunk_size, self._start, self._end)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in iter_chunks(
+            self._content, self._chunk_size, self._start, self._end
+        ):
+            yield chunk
+
+
+def _byte_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """Half-open byte range of a single-range `Range` header
+
+    Returns None when there is no header or it is not a single byte range, in which
+    case the full content is served.
+
+    Raises:
+        ValueError: Range is not satisfiable
+    """
+    if not header:
+        return None
+
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    first, sep, last = spec.strip().partition("-")
+    if not sep or not (first or last):
+        return None
+    if not (first or "0").isdigit() or not (last or "0").isdigit():
+        return None
+
+    if not first:  # NOTE: suffix range, e.g. `bytes=-500`
+        length = int(last)
+        if not length or not size:
+            raise ValueError("Range not satisfiable")
+        return max(size - length, 0), size
+
+    start = int(first)
+    end = min(int(last) + 1, size) if last else size
+    if start >= size or start >= end:
+        raise ValueError("Range not satisfiable")
+    return start, end
+
+
 class FileCreateRoute(StatefulRoute[FileObject, PartialFileObject]):
     def __init__(self, router: respx.MockRouter, state: StateStore) -> None:
         super().__init__(
@@ -39,46 +103,50 @@ class FileCreateRoute(StatefulRoute[FileObject, PartialFileObject]):
     def _handler(self, request: httpx.Request, route: respx.Route) -> httpx.Response:
         self._route = route
 
+        file_id = faker.file.id()
         filename: Optional[str] = None
         purpose: Optional[str] = None
-        file_content: Optional[bytes] = None
-
-        multipart_data = decoder.MultipartDecoder(
-            request.content, request.headers.get("content-type")
-        )
-        for part in multipart_data.parts:  # type: ignore
-            content_disposition = part.headers.get(b"Content-Disposition", b"").decode()  # type: ignore
-            if 'name="purpose"' in content_disposition:
-                purpose = part.text  # type: ignore
-            elif 'name="file"' in content_disposition:
-                filename = (  # type: ignore
-                    part.headers.get(b"Content-Disposition", b"")  # type: ignore
-                    .decode()
-                    .split("filename=")[1]
-                    .strip('"')
-                )
-                file_content = part.content  # type: ignore
-
-        assert filename
-        assert purpose
-        assert file_content
+        size = 0
+        stored = False
+
+        try:
+            boundary = boundary_from_content_type(
+                request.headers.get("content-type", "")
+            )
+            for part in iter_parts(self._body(request), boundary):
+                if part.name == "purpose":
+                    purpose = part.text()
+                elif part.name == "file":
+                    filename = part.filename
+                    size = self._state.files.content.put_chunks(file_id, part.data)
+                    stored = True
+        except MultipartError:
+            filename = None
+
+        if not filename or not purpose:
+            # NOTE: never leave content behind without a file object pointing at it
+            if stored:
+                self._state.files.content.delete(file_id)
+            return httpx.Response(400)
 
         model = FileObject(
-            id=faker.file.id(),
-            bytes=sys.getsizeof(file_content),  # type: ignore
+            id=file_id,
+            bytes=size,
             created_at=utcnow_unix_timestamp_s(),
-            filename=filename,  # type: ignore
+            filename=filename,
             object="file",
             purpose=purpose,  # type: ignore
             status="uploaded",
             status_details=None,
         )
         self._state.files.put(model)
-        self._state.files.content.put(model.id, file_content)  # type: ignore
-        return httpx.Response(
-            status_code=self._status_code,
-            json=model_dict(model),
-        )
+        return json_response(self._status_code, model)
+
+    @staticmethod
+    def _body(request: httpx.Request) -> Iterable[bytes]:
+        if isinstance(request.stream, httpx.SyncByteStream):
+            return request.stream
+        return (request.content,)
 
     @staticmethod
     def _build(partial: PartialFileObject, request: httpx.Request) -> FileObject:
@@ -101,7 +169,7 @@ class FileListRoute(StatefulRoute[SyncPage[FileObject], PartialFileList]):
             object="list",
             data=self._state.files.list(purpose=purpose),
         )
-        return httpx.Response(status_code=200, json=model_dict(files))
+        return json_response(200, files)
 
     @staticmethod
     def _build(
@@ -132,7 +200,7 @@ class FileRetrieveRoute(StatefulRoute[FileObject, PartialFileObject]):
         if not found:
             return httpx.Response(404)
 
-        return httpx.Response(status_code=200, json=model_dict(found))
+        return json_response(200, found)
 
     @staticmethod
     def _build(
@@ -160,9 +228,8 @@ class FileDeleteRoute(StatefulRoute[FileObject, PartialFileDeleted]):
         self._route = route
         file_id = kwargs["file_id"]
         deleted = self._state.files.delete(file_id)
-        return httpx.Response(
-            status_code=200,
-            json=model_dict(FileDeleted(id=file_id, deleted=deleted, object="file")),
+        return json_response(
+            200, FileDeleted(id=file_id, deleted=deleted, object="file")
         )
 
     @staticmethod
@@ -180,6 +247,7 @@ class FileRetrieveContentRoute(StatefulRoute[FileObject, PartialFileObject]):
             status_code=200,
             state=state,
         )
+        self.chunk_size = SpilledContent.CHUNK_SIZE
 
     @override
     def _handler(
@@ -194,9 +262,30 @@ class FileRetrieveContentRoute(StatefulRoute[FileObject, PartialFileObject]):
         if not found:
             return httpx.Response(404)
 
-        content = self._state.files.content.get(found.id)
-        assert content
-        return httpx.Response(status_code=200, content=content)
+        content = self._state.files.content.raw(found.id)
+        assert content is not None
+
+        size = len(content)
+        headers = {"accept-ranges": "bytes"}
+        try:
+            byte_range = _byte_range(request.headers.get("range"), size)
+        except ValueError:
+            headers["content-range"] = f"bytes */{size}"
+            return httpx.Response(status_code=416, headers=headers)
+
+        status_code = 200
+        start, end = 0, size
+        if byte_range is not None:
+            status_code = 206
+            start, end = byte_range
+            headers["content-range"] = f"bytes {start}-{end - 1}/{size}"
+
+        headers["content-length"] = str(end - start)
+        return httpx.Response(
+            status_code=status_code,
+            headers=headers,
+            stream=ContentStream(content, self.chunk_size, start, end),
+        )
 
     @staticmethod
     def _build(partial: PartialFileObject, request: httpx.Request) -> FileObject:
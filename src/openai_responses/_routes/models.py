@@ -13,7 +13,7 @@ from ..stores import StateStore
 from .._types.partials.models import PartialModel
 from .._types.partials.sync_cursor_page import PartialSyncCursorPage
 
-from .._utils.serde import model_dict
+from .._utils.serde import json_response
 
 
 class ModelListRoute(
@@ -31,7 +31,7 @@ class ModelListRoute(
         self._route = route
         data = self._state.models.list()
         model = SyncCursorPage[Model](data=data)
-        return httpx.Response(status_code=200, json=model_dict(model), request=request)
+        return json_response(200, model, request=request)
 
     @staticmethod
     def _build(
@@ -62,7 +62,7 @@ class ModelRetrieveRoute(StatefulRoute[Model, PartialModel]):
         if not found:
             return httpx.Response(404)
 
-        return httpx.Response(status_code=200, json=model_dict(found), request=request)
+        return json_response(200, found, request=request)
 
     @staticmethod
     def _build(partial: PartialModel, request: httpx.Request) -> Model:
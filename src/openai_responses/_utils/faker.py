@@ -1,121 +1,280 @@
+import itertools
+import os
 import random
+import weakref
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Optional, Protocol
 
-__all__ = ["faker"]
+__all__ = ["Faker", "IdPool", "SequentialIds", "faker"]
 
 
 class Base62:
     BASE = 62
     CHARSET = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    TABLE = bytes.maketrans(bytes(range(256)), (CHARSET * 5)[:256].encode())
 
     def encode(self, b: bytes) -> str:
-        encoded: list[str] = []
-        for byte in b:
-            i = byte % self.BASE
-            encoded.append(self.CHARSET[i])
+        return self.encode_bulk(b)[::-1]
 
-        return "".join(reversed(encoded))
+    def encode_bulk(self, b: bytes) -> str:
+        """Map every byte to a Base62 character with a single table lookup"""
+        return b.translate(self.TABLE).decode("ascii")
 
 
 base62 = Base62()
 
 
+class IdSource(Protocol):
+    def take(self, prefix: str = "") -> str: ...
+
+    def reseed(self) -> None: ...
+
+
+class IdPool:
+    """Queues of pre-generated IDs, one per prefix
+
+    Suffixes are generated in bulk from one large random buffer. The batch size for
+    a prefix doubles on every refill so prefixes that are used a lot, like when
+    seeding a store with many objects, refill rarely. With a seed the IDs are the
+    same from run to run as long as they are requested in the same order.
+    """
+
+    SIZE = 24
+    MIN_BATCH = 64
+    MAX_BATCH = 8192
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        self._seed = seed
+        self._random = random.Random(seed)
+        self._queues: Dict[str, Deque[str]] = {}
+        self._batches: Dict[str, int] = {}
+        if seed is None:
+            _unseeded.add(self)
+
+    def take(self, prefix: str = "") -> str:
+        queue = self._queues.get(prefix)
+        if queue is None:
+            queue = self._queues.setdefault(prefix, deque())
+
+        while True:
+            try:
+                return queue.popleft()
+            except IndexError:
+                self._refill(prefix, queue)
+
+    def reseed(self) -> None:
+        self._random.seed(self._seed)
+        self._queues.clear()
+        self._batches.clear()
+
+    def _refill(self, prefix: str, queue: Deque[str]) -> None:
+        batch = self._batches.get(prefix, self.MIN_BATCH)
+        self._batches[prefix] = min(batch * 2, self.MAX_BATCH)
+
+        size = self.SIZE
+        encoded = base62.encode_bulk(self._random.randbytes(size * batch))
+        queue.extend(
+            prefix + encoded[i : i + size] for i in range(0, len(encoded), size)
+        )
+
+
+# NOTE: processes forked from the same parent would otherwise hand out the same IDs
+_unseeded: "weakref.WeakSet[IdPool]" = weakref.WeakSet()
+
+
+def _reseed_unseeded() -> None:
+    for pool in list(_unseeded):
+        pool.reseed()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_unseeded)
+
+
+class SequentialIds:
+    """Counter per prefix that yields monotonic, zero-padded IDs"""
+
+    SIZE = 24
+
+    def __init__(self) -> None:
+        self._counters: Dict[str, Iterator[int]] = {}
+
+    def take(self, prefix: str = "") -> str:
+        counter = self._counters.get(prefix)
+        if counter is None:
+            counter = self._counters.setdefault(prefix, itertools.count(1))
+        return prefix + str(next(counter)).zfill(self.SIZE)
+
+    def reseed(self) -> None:
+        self._counters.clear()
+
+
+# NOTE: a plain list instead of a context variable so that threads started while a
+# mock is active, like a server thread, draw IDs from the same source
+_sources: List[IdSource] = [IdPool()]
+
+
+def activate(source: IdSource) -> None:
+    """Draw IDs from `source` until it is deactivated"""
+    _sources.append(source)
+
+
+def deactivate(source: IdSource) -> None:
+    for i in range(len(_sources) - 1, 0, -1):
+        if _sources[i] is source:
+            del _sources[i]
+            return
+
+
 def gen_id_suffix() -> str:
-    b = random.randbytes(24)
-    return base62.encode(b)
+    return _sources[-1].take()
 
 
 def gen_id(prefix: str, *, sep: str = "_") -> str:
-    return prefix + sep + gen_id_suffix()
+    return _sources[-1].take(prefix + sep)
+
 
+class ActiveIds:
+    """ID source that delegates to the most recently activated source"""
 
-class AssistantProvider:
+    def take(self, prefix: str = "") -> str:
+        return _sources[-1].take(prefix)
+
+    def reseed(self) -> None:
+        _sources[-1].reseed()
+
+
+class Provider:
+    def __init__(self, ids: IdSource) -> None:
+        self._ids = ids
+
+    def _gen_id(self, prefix: str, *, sep: str = "_") -> str:
+        return self._ids.take(prefix + sep)
+
+
+class AssistantProvider(Provider):
     def id(self) -> str:
-        return gen_id("asst")
+        return self._gen_id("asst")
 
 
-class ChatProvider:
-    def __init__(self) -> None:
-        self.completion = ChatProvider.CompletionProvider()
+class ChatProvider(Provider):
+    def __init__(self, ids: IdSource) -> None:
+        super().__init__(ids)
+        self.completion = ChatProvider.CompletionProvider(ids)
 
-    class CompletionProvider:
+    class CompletionProvider(Provider):
         def id(self) -> str:
-            return gen_id("chatcmpl")
+            return self._gen_id("chatcmpl")
 
 
-class FileProvider:
+class FileProvider(Provider):
     def id(self) -> str:
-        return gen_id("file", sep="-")
+        return self._gen_id("file", sep="-")
 
 
-class ThreadProvider:
-    def __init__(self) -> None:
-        self.message = ThreadProvider.MessageProvider()
-        self.run = ThreadProvider.RunProvider()
+class ThreadProvider(Provider):
+    def __init__(self, ids: IdSource) -> None:
+        super().__init__(ids)
+        self.message = ThreadProvider.MessageProvider(ids)
+        self.run = ThreadProvider.RunProvider(ids)
 
     def id(self) -> str:
-        return gen_id("thread")
+        return self._gen_id("thread")
 
-    class MessageProvider:
+    class MessageProvider(Provider):
         def id(self) -> str:
-            return gen_id("msg")
+            return self._gen_id("msg")
 
-    class RunProvider:
-        def __init__(self) -> None:
-            self.step = ThreadProvider.RunProvider.StepProvider()
+    class RunProvider(Provider):
+        def __init__(self, ids: IdSource) -> None:
+            super().__init__(ids)
+            self.step = ThreadProvider.RunProvider.StepProvider(ids)
 
         def id(self) -> str:
-            return gen_id("run")
+            return self._gen_id("run")
 
-        class StepProvider:
-            def __init__(self) -> None:
+        class StepProvider(Provider):
+            def __init__(self, ids: IdSource) -> None:
+                super().__init__(ids)
                 self.step_details = (
-                    ThreadProvider.RunProvider.StepProvider.StepDetailsProvider()
+                    ThreadProvider.RunProvider.StepProvider.StepDetailsProvider(ids)
                 )
 
             def id(self) -> str:
-                return gen_id("step")
+                return self._gen_id("step")
 
-            class StepDetailsProvider:
+            class StepDetailsProvider(Provider):
 
-                def __init__(self) -> None:
-                    self.tool_call = (
-                        ThreadProvider.RunProvider.StepProvider.StepDetailsProvider.ToolCallProvider()
+                def __init__(self, ids: IdSource) -> None:
+                    super().__init__(ids)
+                    self.tool_call = ThreadProvider.RunProvider.StepProvider.StepDetailsProvider.ToolCallProvider(
+                        ids
                     )
 
-                class ToolCallProvider:
+                class ToolCallProvider(Provider):
                     def id(self) -> str:
-                        return gen_id("call")
+                        return self._gen_id("call")
 
 
-class VectorStoreProvider:
-    def __init__(self) -> None:
-        self.file_batch = VectorStoreProvider.VectorStoreFileBatchProvider()
+class VectorStoreProvider(Provider):
+    def __init__(self, ids: IdSource) -> None:
+        super().__init__(ids)
+        self.file_batch = VectorStoreProvider.VectorStoreFileBatchProvider(ids)
 
     def id(self) -> str:
-        return gen_id("vs")
+        return self._gen_id("vs")
 
-    class VectorStoreFileBatchProvider:
+    class VectorStoreFileBatchProvider(Provider):
         def id(self) -> str:
-            return gen_id("vsfb")
+            return self._gen_id("vsfb")
 
 
-class ModerationProvider:
+class ModerationProvider(Provider):
     def id(self) -> str:
-        return gen_id(prefix="modr", sep="-")
+        return self._gen_id(prefix="modr", sep="-")
 
 
 class Faker:
-    def __init__(self) -> None:
-        self.chat = ChatProvider()
-        self.file = FileProvider()
-        self.moderation = ModerationProvider()
-        self.beta = Faker.BetaProviders()
+    """Fake ID factory
+
+    Args:
+        seed (Optional[int], optional): Seed for reproducible random IDs. Defaults to None.
+        sequential (bool, optional): Generate monotonic counter-based IDs instead of random ones. Defaults to False.
+        ids (Optional[IdSource], optional): Explicit ID source, overrides `seed` and `sequential`. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        *,
+        sequential: bool = False,
+        ids: Optional[IdSource] = None,
+    ) -> None:
+        if ids is None:
+            ids = SequentialIds() if sequential else IdPool(seed)
+
+        self.ids = ids
+        self.chat = ChatProvider(ids)
+        self.file = FileProvider(ids)
+        self.moderation = ModerationProvider(ids)
+        self.beta = Faker.BetaProviders(ids)
+
+    def activate(self) -> None:
+        """Make IDs generated by routes come from this faker"""
+        activate(self.ids)
+
+    def deactivate(self) -> None:
+        deactivate(self.ids)
+
+    def reseed(self) -> None:
+        """Restart the ID sequence from the beginning"""
+        self.ids.reseed()
 
     class BetaProviders:
-        def __init__(self) -> None:
-            self.assistant = AssistantProvider()
-            self.thread = ThreadProvider()
-            self.vector_store = VectorStoreProvider()
+        def __init__(self, ids: IdSource) -> None:
+            self.assistant = AssistantProvider(ids)
+            self.thread = ThreadProvider(ids)
+            self.vector_store = VectorStoreProvider(ids)
 
 
-faker = Faker()
+faker = Faker(ids=ActiveIds())
@@ -0,0 +1,163 @@
+import re
+from typing import Dict, Iterable, Iterator, Optional, Union
+
+__all__ = ["MultipartError", "Part", "boundary_from_content_type", "iter_parts"]
+
+Chunk = Union[bytes, bytearray, memoryview]
+Buffer = Union[bytes, bytearray]
+
+_PARAM = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+HEADERS_END = b"\r\n\r\n"
+
+
+class MultipartError(ValueError):
+    pass
+
+
+class Part:
+    """Part of a multipart body
+
+    The part data is a lazy iterator of memoryview slices into the received chunks.
+    Slices are only valid until the next one is requested, so consume or copy them
+    right away. Parts must be read in order.
+    """
+
+    def __init__(self, headers: Dict[str, str], data: Iterator[memoryview]) -> None:
+        self.headers = headers
+        self.data = data
+
+        disposition = _PARAM.findall(headers.get("content-disposition", ""))
+        params = {key.lower(): value for key, value in disposition}
+        self.name: Optional[str] = params.get("name")
+        self.filename: Optional[str] = params.get("filename")
+
+    def read(self) -> bytes:
+        return b"".join(self.data)
+
+    def text(self, encoding: str = "utf-8") -> str:
+        return self.read().decode(encoding)
+
+
+def boundary_from_content_type(content_type: str) -> bytes:
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.strip().partition("=")
+        if key.lower() == "boundary":
+            return value.strip('"').encode("latin-1")
+    raise MultipartError(f"No boundary in content type: {content_type}")
+
+
+def _parse_headers(raw: memoryview) -> Dict[str, str]:
+    headers: Dict[str, str] = {}
+    for line in bytes(raw).decode("latin-1").split("\r\n"):
+        key, sep, value = line.partition(":")
+        if sep:
+            headers[key.strip().lower()] = value.strip()
+    return headers
+
+
+class _Parser:
+    """Incremental multipart parser fed with chunks of the body
+
+    A chunk is only copied when it has to be joined with the unparsed tail of the
+    previous one, which is at most one delimiter long while reading part data. A
+    body that arrives in a single chunk is parsed without copying it.
+    """
+
+    def __init__(self, chunks: Iterable[Chunk], boundary: bytes) -> None:
+        self._chunks = iter(chunks)
+        self._buffer: Buffer = b""
+        self._pos = 0
+        self._delimiter = b"\r\n--" + boundary
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the unparsed tail, False when there are no more"""
+        for chunk in self._chunks:
+            if not chunk:
+                continue
+            if isinstance(chunk, memoryview):
+                chunk = chunk.tobytes()
+            if self._pos < len(self._buffer):
+                self._buffer = self._buffer[self._pos :] + chunk
+            else:
+                self._buffer = chunk
+            self._pos = 0
+            return True
+        return False
+
+    def _find(self, needle: bytes) -> int:
+        return self._buffer.find(needle, self._pos)
+
+    def _view(self, start: int, end: int) -> memoryview:
+        return memoryview(self._buffer)[start:end]
+
+    def _skip_delimiter(self, size: int) -> bool:
+        """Move past the delimiter at the current position, False on the final one"""
+        while len(self._buffer) - self._pos < size + 2:
+            if not self._fill():
+                raise MultipartError("Unexpected end of multipart body")
+
+        self._pos += size
+        end = self._view(self._pos, self._pos + 2).tobytes()
+        self._pos += 2
+        if end == b"--":
+            return False
+        if end != b"\r\n":
+            raise MultipartError("Malformed multipart delimiter")
+        return True
+
+    def _read_headers(self) -> Dict[str, str]:
+        while (end := self._find(HEADERS_END)) < 0:
+            if not self._fill():
+                raise MultipartError("Unexpected end of multipart headers")
+        headers = _parse_headers(self._view(self._pos, end))
+        self._pos = end + len(HEADERS_END)
+        return headers
+
+    def _read_data(self) -> Iterator[memoryview]:
+        keep = len(self._delimiter) - 1
+        while True:
+            end = self._find(self._delimiter)
+            if end >= 0:
+                if end > self._pos:
+                    yield self._view(self._pos, end)
+                self._pos = end
+                return
+
+            # NOTE: hold back a tail that may be the start of a split delimiter
+            safe = len(self._buffer) - keep
+            if safe > self._pos:
+                yield self._view(self._pos, safe)
+                self._pos = safe
+
+            if not self._fill():
+                raise MultipartError("Unexpected end of multipart data")
+
+    def parts(self) -> Iterator[Part]:
+        # NOTE: the first delimiter has no leading CRLF when there is no preamble
+        first = self._delimiter[2:]
+        while (start := self._find(first)) < 0:
+            if not self._fill():
+                raise MultipartError("No multipart delimiter found")
+        self._pos = start
+
+        size = len(first)
+        while self._skip_delimiter(size):
+            data = self._read_data()
+            yield Part(self._read_headers(), data)
+            for _ in data:  # NOTE: drain whatever the consumer did not read
+                pass
+            size = len(self._delimiter)
+
+
+def iter_parts(chunks: Iterable[Chunk], boundary: bytes) -> Iterator[Part]:
+    """Parse a multipart body incrementally
+
+    Args:
+        chunks (Iterable[Chunk]): Body chunks, e.g. a request stream
+        boundary (bytes): Multipart boundary
+
+    Returns:
+        Iterator[Part]: Parts in the order they appear in the body
+    """
+    return _Parser(chunks, boundary).parts()
@@ -1,15 +1,105 @@
 import json
-from typing import Any, Type
+import os
+from typing import Any, Callable, Dict, Optional, Type, Union
+
+import httpx
 
 from openai import BaseModel
 
 from .._types.generics import M
 
-__all__ = ["json_loads", "model_dict", "model_parse"]
+__all__ = [
+    "JSONBackend",
+    "json_backend",
+    "json_dumps",
+    "json_loads",
+    "json_response",
+    "model_dict",
+    "model_json",
+    "model_parse",
+]
+
+
+class JSONBackend:
+    """JSON encoder and decoder pair
+
+    Args:
+        name (str): Name of the backing library
+        dumps (Callable[[Any], bytes]): Encode an object to compact UTF-8 JSON
+        loads (Callable[[Union[bytes, str]], Any]): Decode JSON
+    """
+
+    def __init__(
+        self,
+        name: str,
+        dumps: Callable[[Any], bytes],
+        loads: Callable[[Union[bytes, str]], Any],
+    ) -> None:
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self) -> str:
+        return f"JSONBackend(name={self.name!r})"
+
+
+def _orjson() -> Optional[JSONBackend]:
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return JSONBackend("orjson", orjson.dumps, orjson.loads)
+
+
+def _msgspec() -> Optional[JSONBackend]:
+    try:
+        import msgspec
+    except ImportError:
+        return None
+    return JSONBackend("msgspec", msgspec.json.encode, msgspec.json.decode)
+
+
+def _stdlib() -> JSONBackend:
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    return JSONBackend("json", dumps, json.loads)
+
+
+_BACKENDS: Dict[str, Callable[[], Optional[JSONBackend]]] = {
+    "orjson": _orjson,
+    "msgspec": _msgspec,
+    "json": _stdlib,
+}
+
+
+def _select_backend(preferred: Optional[str] = None) -> JSONBackend:
+    if preferred:
+        if preferred not in _BACKENDS:
+            raise ValueError(f"Unknown JSON backend: {preferred}")
+        backend = _BACKENDS[preferred]()
+        if backend is None:
+            raise ImportError(f"JSON backend {preferred} is not installed")
+        return backend
+
+    for load in _BACKENDS.values():
+        backend = load()
+        if backend is not None:
+            return backend
+
+    return _stdlib()
+
+
+# NOTE: prefer the fastest installed backend, override with OPENAI_RESPONSES_JSON
+json_backend = _select_backend(os.environ.get("OPENAI_RESPONSES_JSON"))
+
+
+def json_dumps(obj: Any) -> bytes:
+    return json_backend.dumps(obj)
 
 
 def json_loads(b: bytes) -> Any:
-    d = json.loads(b)
+    d = json_backend.loads(b)
     return {k: v for k, v in d.items() if v is not None}
 
 
@@ -20,8 +110,44 @@ def model_dict(m: BaseModel, **kwargs: Any) -> dict[str, Any]:
         return getattr(m, "dict")(**kwargs)
 
 
+def model_json(m: BaseModel, **kwargs: Any) -> bytes:
+    if hasattr(m, "model_dump_json"):
+        return getattr(m, "model_dump_json")(**kwargs).encode()
+    else:
+        return json_dumps(model_dict(m, **kwargs))
+
+
 def model_parse(m: Type[M], d: object, **kwargs: Any) -> M:
     if hasattr(m, "model_validate"):
         return getattr(m, "model_validate")(d, **kwargs)
     else:
         return getattr(m, "parse_obj")(d, **kwargs)
+
+
+def json_response(
+    status_code: int,
+    content: Union[BaseModel, Dict[str, Any], bytes],
+    **kwargs: Any,
+) -> httpx.Response:
+    """Create an HTTPX response from a model, a dict, or already encoded JSON
+
+    Args:
+        status_code (int): Response status code
+        content (Union[BaseModel, Dict[str, Any], bytes]): Response body
+        **kwargs: Extra arguments passed to `httpx.Response`
+
+    Returns:
+        httpx.Response: Response with a JSON body
+    """
+    if isinstance(content, BaseModel):
+        content = model_json(content)
+    elif not isinstance(content, bytes):
+        content = json_dumps(content)
+
+    headers = {"content-type": "application/json"} | kwargs.pop("headers", {})
+    return httpx.Response(
+        status_code=status_code,
+        content=content,
+        headers=headers,
+        **kwargs,
+    )
@@ -0,0 +1,64 @@
+import re
+from typing import Any, Dict, Iterable, List
+
+from .faker import gen_id_suffix
+from .serde import json_dumps
+from .time import utcnow_unix_timestamp_s
+
+__all__ = ["ResponseTemplate", "VOLATILE_FIELDS"]
+
+VOLATILE_FIELDS = ("id", "created", "created_at")
+
+_PLACEHOLDER = re.compile(rb'"__openai_responses_(\w+)__"')
+_ID_PREFIX = re.compile(r"^(.*[_-])")
+
+
+class ResponseTemplate:
+    """JSON body serialized once with its volatile fields patched per render
+
+    The body is split around placeholders for the volatile top-level fields so
+    each render only joins byte segments with freshly generated values.
+    """
+
+    def __init__(self, body: Dict[str, Any], volatile: Iterable[str] = ()) -> None:
+        fields = [
+            field
+            for field in volatile
+            if isinstance(body.get(field), (str, int))
+            and not isinstance(body.get(field), bool)
+        ]
+
+        self._prefixes: Dict[str, str] = {}
+        for field in fields:
+            if isinstance(body[field], str):
+                prefix = _ID_PREFIX.match(body[field])
+                self._prefixes[field] = prefix.group(1) if prefix else ""
+
+        placeholders = {field: f"__openai_responses_{field}__" for field in fields}
+        encoded = json_dumps(body | placeholders)
+
+        self._segments: List[bytes] = []
+        self._fields: List[str] = []
+
+        pos = 0
+        for placeholder in _PLACEHOLDER.finditer(encoded):
+            self._segments.append(encoded[pos : placeholder.start()])
+            self._fields.append(placeholder.group(1).decode())
+            pos = placeholder.end()
+        self._segments.append(encoded[pos:])
+
+    def render(self) -> bytes:
+        if not self._fields:
+            return self._segments[0]
+
+        parts = [self._segments[0]]
+        for field, segment in zip(self._fields, self._segments[1:]):
+            parts.append(self._value(field))
+            parts.append(segment)
+        return b"".join(parts)
+
+    def _value(self, field: str) -> bytes:
+        prefix = self._prefixes.get(field)
+        if prefix is not None:
+            return f'"{prefix}{gen_id_suffix()}"'.encode()
+        return str(utcnow_unix_timestamp_s()).encode()
@@ -1,5 +1,28 @@
-import datetime as dt
+from typing import List
+
+from ..latency import SYSTEM_CLOCK, Clock
+
+__all__ = ["activate", "deactivate", "utcnow", "utcnow_unix_timestamp_s"]
+
+# NOTE: a plain list like the faker ID sources, so threads see the active clock too
+_clocks: List[Clock] = [SYSTEM_CLOCK]
+
+
+def activate(clock: Clock) -> None:
+    """Read the time from `clock` until it is deactivated"""
+    _clocks.append(clock)
+
+
+def deactivate(clock: Clock) -> None:
+    for i in range(len(_clocks) - 1, 0, -1):
+        if _clocks[i] is clock:
+            del _clocks[i]
+            return
+
+
+def utcnow() -> float:
+    return _clocks[-1].now()
 
 
 def utcnow_unix_timestamp_s() -> int:
-    return int(dt.datetime.now().timestamp())
+    return int(_clocks[-1].now())
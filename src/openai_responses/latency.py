@@ -0,0 +1,172 @@
+import asyncio
+import random
+import time
+from abc import ABC, abstractmethod
+from typing import Iterator, Optional, Sequence, Union
+
+__all__ = [
+    "Latency",
+    "Fixed",
+    "Normal",
+    "Empirical",
+    "Clock",
+    "SystemClock",
+    "VirtualClock",
+]
+
+
+class Latency(ABC):
+    """Distribution of delays in seconds"""
+
+    @abstractmethod
+    def sample(self, rng: Optional[random.Random] = None) -> float:
+        """Draw a delay
+
+        Args:
+            rng (Optional[random.Random], optional): Random number generator. Defaults to the global one.
+
+        Returns:
+            float: Delay in seconds, never negative
+        """
+        raise NotImplementedError
+
+
+class Fixed(Latency):
+    """Always the same delay
+
+    Args:
+        seconds (float): Delay in seconds
+    """
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = max(seconds, 0.0)
+
+    def sample(self, rng: Optional[random.Random] = None) -> float:
+        return self.seconds
+
+    def __repr__(self) -> str:
+        return f"Fixed({self.seconds})"
+
+
+class Normal(Latency):
+    """Normally distributed delay, clipped at a minimum
+
+    Args:
+        mean (float): Mean delay in seconds
+        stddev (float): Standard deviation in seconds
+        minimum (float, optional): Smallest delay. Defaults to 0.
+    """
+
+    def __init__(self, mean: float, stddev: float, minimum: float = 0.0) -> None:
+        self.mean = mean
+        self.stddev = stddev
+        self.minimum = max(minimum, 0.0)
+
+    def sample(self, rng: Optional[random.Random] = None) -> float:
+        value = (rng or random).gauss(self.mean, self.stddev)
+        return max(value, self.minimum)
+
+    def __repr__(self) -> str:
+        return f"Normal({self.mean}, {self.stddev}, minimum={self.minimum})"
+
+
+class Empirical(Latency):
+    """Delay drawn from observed samples, e.g. latencies recorded against the API
+
+    Args:
+        samples (Sequence[float]): Observed delays in seconds
+    """
+
+    def __init__(self, samples: Sequence[float]) -> None:
+        if not samples:
+            raise ValueError("Empirical latency needs at least one sample")
+        self.samples = [max(sample, 0.0) for sample in samples]
+
+    def sample(self, rng: Optional[random.Random] = None) -> float:
+        return (rng or random).choice(self.samples)
+
+    def __repr__(self) -> str:
+        return f"Empirical({len(self.samples)} samples)"
+
+
+def as_latency(value: Union[Latency, float, None]) -> Optional[Latency]:
+    if value is None or isinstance(value, Latency):
+        return value
+    return Fixed(value)
+
+
+def delays(
+    first: Optional[Latency],
+    then: Optional[Latency],
+    rng: Optional[random.Random] = None,
+) -> Iterator[float]:
+    """Delay before the first item followed by the delay before each next one"""
+    yield first.sample(rng) if first else 0.0
+    while True:
+        yield then.sample(rng) if then else 0.0
+
+
+class Clock(ABC):
+    """Source of time and waiting for simulated latency"""
+
+    @abstractmethod
+    def now(self) -> float:
+        """Current time as a Unix timestamp in seconds"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def sleep(self, seconds: float) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def asleep(self, seconds: float) -> None:
+        raise NotImplementedError
+
+
+class SystemClock(Clock):
+    """Wall clock that really waits"""
+
+    def now(self) -> float:
+        return time.time()
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+
+    async def asleep(self, seconds: float) -> None:
+        if seconds > 0:
+            await asyncio.sleep(seconds)
+
+
+class VirtualClock(Clock):
+    """Clock that moves forward when waited on instead of blocking
+
+    Every wait advances the clock by its full duration, so waits add up even when
+    they come from concurrent tasks. Async waits still yield to the event loop once.
+
+    Args:
+        start (Optional[float], optional): Starting Unix timestamp. Defaults to the current time.
+        tick (float, optional): Seconds to advance every time the clock is read, e.g. 1 to give objects created one after another increasing `created_at` values. Defaults to 0.
+    """
+
+    def __init__(self, start: Optional[float] = None, tick: float = 0.0) -> None:
+        self._now = time.time() if start is None else start
+        self.tick = max(tick, 0.0)
+
+    def now(self) -> float:
+        value = self._now
+        self._now += self.tick
+        return value
+
+    def advance(self, seconds: float) -> None:
+        self._now += max(seconds, 0.0)
+
+    def sleep(self, seconds: float) -> None:
+        self.advance(seconds)
+
+    async def asleep(self, seconds: float) -> None:
+        self.advance(seconds)
+        await asyncio.sleep(0)
+
+
+SYSTEM_CLOCK = SystemClock()
@@ -1,3 +1,5 @@
+from typing import Generator
+
 import pytest
 
 from . import OpenAIMock
@@ -13,3 +15,23 @@ def pytest_configure(config: pytest.Config):
 @pytest.fixture()
 def openai_mock() -> OpenAIMock:
     return OpenAIMock()
+
+
+@pytest.fixture(scope="session")
+def openai_mock_session() -> OpenAIMock:
+    """OpenAI API mocker shared by every test in the session
+
+    With pytest-xdist every worker runs its own session so each worker gets its own
+    instance. Request `shared_openai_mock` instead to get it reset and active.
+    """
+    return OpenAIMock()
+
+
+@pytest.fixture()
+def shared_openai_mock(
+    openai_mock_session: OpenAIMock,
+) -> Generator[OpenAIMock, None, None]:
+    """Session OpenAI API mocker, reset and active for the duration of the test"""
+    openai_mock_session.reset()
+    with openai_mock_session.router:
+        yield openai_mock_session
@@ -0,0 +1,330 @@
+"""Serve an `OpenAIMock` over a real local HTTP server
+
+Clients in other processes, or clients that cannot be patched, can then use the
+mock by pointing their base URL at the server:
+
+```
+OPENAI_BASE_URL=http://127.0.0.1:8000/v1 pytest
+```
+"""
+
+import argparse
+import asyncio
+import threading
+from http import HTTPStatus
+from typing import Any, Iterable, List, Optional, Set, Tuple
+
+import httpx
+from respx.models import AllMockedAssertionError
+
+from ._mock import OpenAIMock
+from ._utils.serde import json_dumps
+from .stores import SQLiteStateStore, StateStore
+
+__all__ = ["MockServer"]
+
+_HOP_BY_HOP = {b"connection", b"content-length", b"keep-alive", b"transfer-encoding"}
+
+
+class _BadRequest(Exception):
+    pass
+
+
+class MockServer:
+    """Asyncio HTTP/1.1 server for the routes and state of a mock
+
+    Connections are kept alive between requests. Streaming responses, like server
+    sent events, are sent with chunked transfer encoding as they are produced.
+    HTTPX is not patched while the server runs, so clients in the same process
+    also go through the socket.
+
+    The server can be run in a background thread with `with MockServer(...)`, or on
+    the running event loop with `async with MockServer(...)`.
+
+    Args:
+        openai_mock (Optional[OpenAIMock], optional): Mock to serve. Defaults to a new mock.
+        host (str, optional): Interface to bind. Defaults to "127.0.0.1".
+        port (int, optional): Port to bind, 0 for any free port. Defaults to 0.
+        keep_alive_timeout (float, optional): Seconds to wait for the next request on an idle connection. Defaults to 5.
+    """
+
+    def __init__(
+        self,
+        openai_mock: Optional[OpenAIMock] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        keep_alive_timeout: float = 5.0,
+    ) -> None:
+        self.openai_mock = openai_mock or OpenAIMock()
+        self.host = host
+        self.port = port
+        self.keep_alive_timeout = keep_alive_timeout
+
+        self._base_url = httpx.URL(self.openai_mock.base_url)
+        self._server: Optional[asyncio.Server] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._writers: Set[asyncio.StreamWriter] = set()
+
+    @property
+    def url(self) -> str:
+        """Base URL for clients, e.g. `http://127.0.0.1:8000/v1`"""
+        return f"http://{self.host}:{self.port}{self._base_url.path.rstrip('/')}"
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.openai_mock.router.activate()
+
+    async def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        for writer in self._writers:
+            writer.close()  # NOTE: idle keep-alive connections would hold up shutdown
+        await self._server.wait_closed()
+        self._server = None
+        self.openai_mock.router.deactivate()
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def __aenter__(self) -> "MockServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.stop()
+
+    def __enter__(self) -> "MockServer":
+        loop = asyncio.new_event_loop()
+        self._loop = loop
+        self._thread = threading.Thread(
+            target=loop.run_forever,
+            name="openai-responses-server",
+            daemon=True,
+        )
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.start(), loop).result()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        assert self._loop is not None and self._thread is not None
+        try:
+            asyncio.run_coroutine_threadsafe(self.stop(), self._loop).result()
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = None
+            self._thread = None
+
+    async def _serve(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        self._writers.add(writer)
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(
+                        reader.readuntil(b"\r\n\r\n"),
+                        self.keep_alive_timeout,
+                    )
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError):
+                    return
+
+                try:
+                    request, keep_alive = await self._read_request(head, reader)
+                except (_BadRequest, asyncio.IncompleteReadError, ValueError):
+                    await self._write_error(writer, 400, "Malformed request", False)
+                    return
+
+                keep_alive = await self._respond(request, writer, keep_alive)
+                if not keep_alive:
+                    return
+        except (asyncio.LimitOverrunError, ConnectionError):
+            return
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _read_request(
+        self,
+        head: bytes,
+        reader: asyncio.StreamReader,
+    ) -> Tuple[httpx.Request, bool]:
+        request_line, *header_lines = head[:-4].split(b"\r\n")
+        try:
+            method, target, version = request_line.split(b" ")
+        except ValueError:
+            raise _BadRequest()
+
+        headers: List[Tuple[bytes, bytes]] = []
+        for line in header_lines:
+            name, sep, value = line.partition(b":")
+            if not sep:
+                raise _BadRequest()
+            headers.append((name.strip(), value.strip()))
+
+        fields = {name.lower(): value.lower() for name, value in headers}
+        if fields.get(b"transfer-encoding") == b"chunked":
+            body = await self._read_chunked(reader)
+            headers = [
+                (name, value)
+                for name, value in headers
+                if name.lower() != b"transfer-encoding"
+            ]
+            headers.append((b"Content-Length", str(len(body)).encode()))
+        else:
+            body = await reader.readexactly(int(fields.get(b"content-length", 0)))
+
+        connection = fields.get(b"connection")
+        if version == b"HTTP/1.0":
+            keep_alive = connection == b"keep-alive"
+        else:
+            keep_alive = connection != b"close"
+
+        # NOTE: routes match the mocked base URL, not the address of the server
+        url = self._base_url.copy_with(raw_path=target)
+        request = httpx.Request(method.decode(), url, headers=headers, content=body)
+        return request, keep_alive
+
+    @staticmethod
+    async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+        parts: List[bytes] = []
+        while True:
+            size_line = await reader.readuntil(b"\r\n")
+            size = int(size_line.split(b";")[0], 16)
+            if size == 0:
+                # NOTE: skip trailers
+                while await reader.readuntil(b"\r\n") != b"\r\n":
+                    pass
+                return b"".join(parts)
+            parts.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+
+    async def _respond(
+        self,
+        request: httpx.Request,
+        writer: asyncio.StreamWriter,
+        keep_alive: bool,
+    ) -> bool:
+        try:
+            resolved = await self.openai_mock.router.aresolve(request)
+        except AllMockedAssertionError:
+            path = request.url.path
+            await self._write_error(writer, 404, f"No route for {path}", keep_alive)
+            return keep_alive
+        except Exception as exc:
+            await self._write_error(writer, 500, repr(exc), keep_alive)
+            return keep_alive
+
+        response = resolved.response
+        assert isinstance(response, httpx.Response)
+
+        head_only = request.method == "HEAD"
+        chunked = not isinstance(response.stream, httpx.ByteStream)
+        headers = self._headers(response.headers.raw)
+        if chunked:
+            headers.append((b"Transfer-Encoding", b"chunked"))
+        else:
+            headers.append((b"Content-Length", str(len(response.content)).encode()))
+        headers.append((b"Connection", b"keep-alive" if keep_alive else b"close"))
+
+        writer.write(self._head(response.status_code, headers))
+        try:
+            if head_only:
+                pass
+            elif chunked:
+                async for chunk in response.aiter_raw():
+                    if chunk:
+                        writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                        await writer.drain()
+                writer.write(b"0\r\n\r\n")
+            else:
+                writer.write(response.content)
+            await writer.drain()
+        finally:
+            await response.aclose()
+
+        return keep_alive
+
+    async def _write_error(
+        self,
+        writer: asyncio.StreamWriter,
+        status_code: int,
+        message: str,
+        keep_alive: bool,
+    ) -> None:
+        body = json_dumps({"error": {"message": message, "type": "mock_server_error"}})
+        headers = [
+            (b"Content-Type", b"application/json"),
+            (b"Content-Length", str(len(body)).encode()),
+            (b"Connection", b"keep-alive" if keep_alive else b"close"),
+        ]
+        writer.write(self._head(status_code, headers) + body)
+        await writer.drain()
+
+    @staticmethod
+    def _headers(raw: Iterable[Tuple[bytes, bytes]]) -> List[Tuple[bytes, bytes]]:
+        return [(name, value) for name, value in raw if name.lower() not in _HOP_BY_HOP]
+
+    @staticmethod
+    def _head(status_code: int, headers: List[Tuple[bytes, bytes]]) -> bytes:
+        try:
+            reason = HTTPStatus(status_code).phrase
+        except ValueError:
+            reason = ""
+        lines = [f"HTTP/1.1 {status_code} {reason}".encode()]
+        lines.extend(name + b": " + value for name, value in headers)
+        return b"\r\n".join(lines) + b"\r\n\r\n"
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run a mock server until interrupted"""
+    parser = argparse.ArgumentParser(
+        prog="python -m openai_responses.server",
+        description="Serve the OpenAI mock over HTTP",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--base-url",
+        default=None,
+        help="mocked API base URL, defaults to https://api.openai.com/v1",
+    )
+    parser.add_argument(
+        "--state",
+        default=None,
+        help="path to a SQLite state database, defaults to an in-memory state",
+    )
+    args = parser.parse_args(argv)
+
+    state = SQLiteStateStore(args.state) if args.state else StateStore()
+    server = MockServer(
+        OpenAIMock(base_url=args.base_url, state=state),
+        host=args.host,
+        port=args.port,
+    )
+
+    async def _main() -> None:
+        await server.start()
+        print(f"Serving OpenAI mock on {server.url}", flush=True)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(_main())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 from .content_store import ContentStore
-from .state_store import StateStore
+from .sqlite_store import SQLiteStateStore
+from .state_store import CursorPage, StateStore
 
-__all__ = ["StateStore", "ContentStore"]
+__all__ = ["StateStore", "SQLiteStateStore", "ContentStore", "CursorPage"]
@@ -0,0 +1,79 @@
+from bisect import bisect_left, insort
+from typing import Dict, Iterator, List, Optional, Tuple
+
+__all__ = ["OrderedIndex"]
+
+Key = Tuple[int, int, str]
+
+
+class OrderedIndex:
+    """Object IDs kept sorted by creation time
+
+    Objects created in the same second are ordered by a sequence number that the
+    owning collection assigns, so the order does not depend on which index an
+    object was added to first. Cursor lookups are a binary search and iterating a
+    page only touches the IDs in that page.
+    """
+
+    def __init__(self) -> None:
+        self._keys: List[Key] = []
+        self._key_of: Dict[str, Key] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, id: str) -> bool:
+        return id in self._key_of
+
+    def add(self, id: str, created_at: int, seq: int) -> None:
+        key = (created_at, seq, id)
+        old = self._key_of.get(id)
+        if old is not None:
+            if old == key:
+                return
+            del self._keys[bisect_left(self._keys, old)]
+
+        insort(self._keys, key)
+        self._key_of[id] = key
+
+    def copy(self) -> "OrderedIndex":
+        index = OrderedIndex()
+        index._keys = self._keys.copy()
+        index._key_of = self._key_of.copy()
+        return index
+
+    def remove(self, id: str) -> None:
+        key = self._key_of.pop(id, None)
+        if key is not None:
+            del self._keys[bisect_left(self._keys, key)]
+
+    def position(self, id: str) -> Optional[int]:
+        key = self._key_of.get(id)
+        if key is None:
+            return None
+        return bisect_left(self._keys, key)
+
+    def iter(
+        self,
+        order: str = "desc",
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Iterate IDs in order, exclusive of the `after` and `before` cursors
+
+        Cursors that are not in the index are ignored.
+        """
+        after_ix = self.position(after) if after else None
+        before_ix = self.position(before) if before else None
+
+        if order == "asc":
+            start = after_ix + 1 if after_ix is not None else 0
+            stop = before_ix if before_ix is not None else len(self._keys)
+            ixs = range(start, stop)
+        else:
+            start = after_ix - 1 if after_ix is not None else len(self._keys) - 1
+            stop = before_ix if before_ix is not None else -1
+            ixs = range(start, stop, -1)
+
+        for ix in ixs:
+            yield self._keys[ix][2]
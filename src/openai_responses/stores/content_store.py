@@ -1,15 +1,174 @@
-from typing import Dict, Union
+import itertools
+import mmap
+import os
+import tempfile
+import weakref
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict, Iterable, Iterator, Optional, Union
+
+__all__ = ["ContentStore", "SpilledContent", "iter_chunks"]
+
+
+class SpilledContent:
+    """File content kept in a temporary file instead of in memory
+
+    The file is removed once the last reference to this object is gone, so forks of
+    a store can share it safely.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        chunks: Iterable[Union[bytes, bytearray, memoryview]],
+        dir: Optional[str] = None,
+    ) -> None:
+        fd, self.path = tempfile.mkstemp(prefix="openai-responses-", dir=dir)
+        self._finalizer = weakref.finalize(self, _unlink, self.path)
+        self.size = 0
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                self.size += f.write(chunk)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def read(self) -> bytes:
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def iter_chunks(
+        self,
+        chunk_size: int = CHUNK_SIZE,
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> Iterator[bytes]:
+        """Iterate a byte range of the content in chunks read through a memory map"""
+        end = self.size if end is None else min(end, self.size)
+        if start >= end:
+            return
+
+        with open(self.path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for offset in range(start, end, chunk_size):
+                    yield mm[offset : min(offset + chunk_size, end)]
+
+
+def iter_chunks(
+    content: Union[bytes, SpilledContent],
+    chunk_size: int = SpilledContent.CHUNK_SIZE,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> Iterator[bytes]:
+    """Iterate a byte range of stored content in chunks
+
+    Args:
+        content (Union[bytes, SpilledContent]): Content as returned by `ContentStore.raw`
+        chunk_size (int, optional): Maximum chunk size. Defaults to 64 KiB.
+        start (int, optional): First byte. Defaults to 0.
+        end (Optional[int], optional): Byte after the last one. Defaults to the end of the content.
+    """
+    if isinstance(content, SpilledContent):
+        yield from content.iter_chunks(chunk_size, start, end)
+        return
+
+    view = memoryview(content)
+    end = len(content) if end is None else min(end, len(content))
+    for offset in range(start, end, chunk_size):
+        yield view[offset : min(offset + chunk_size, end)].tobytes()
+
+
+def _unlink(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
 
 
 class ContentStore:
-    def __init__(self) -> None:
-        self._data: Dict[str, bytes] = {}
+    """File contents by file ID
+
+    Args:
+        spill_threshold (Optional[int], optional): Size in bytes above which content is written to a temporary file. Defaults to None, keeping everything in memory.
+        spill_dir (Optional[str], optional): Directory for spilled content. Defaults to the system temporary directory.
+    """
+
+    _lock: ContextManager[Any] = nullcontext()
+
+    def __init__(
+        self,
+        spill_threshold: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+    ) -> None:
+        self._data: Dict[str, Union[bytes, SpilledContent]] = {}
+        self._shared = False
+        self.spill_threshold = spill_threshold
+        self.spill_dir = spill_dir
 
     def put(self, id: str, content: bytes) -> None:
-        self._data[id] = content
+        value: Union[bytes, SpilledContent] = content
+        if self.spill_threshold is not None and len(content) > self.spill_threshold:
+            value = SpilledContent((content,), self.spill_dir)
+        self._set(id, value)
+
+    def put_chunks(
+        self,
+        id: str,
+        chunks: Iterable[Union[bytes, bytearray, memoryview]],
+    ) -> int:
+        """Store content that arrives in chunks, like an upload being parsed
+
+        Chunks are buffered until the spill threshold is crossed and then written
+        straight to a temporary file, so spilled content is never joined in memory.
+
+        Args:
+            id (str): File ID
+            chunks (Iterable[Union[bytes, bytearray, memoryview]]): Content chunks, only read once
+
+        Returns:
+            int: Size of the content in bytes
+        """
+        if self.spill_threshold is None:
+            content = b"".join(chunks)
+            self._set(id, content)
+            return len(content)
+
+        buffer = bytearray()
+        chunks = iter(chunks)
+        for chunk in chunks:
+            buffer += chunk
+            if len(buffer) > self.spill_threshold:
+                spilled = SpilledContent(
+                    itertools.chain((buffer,), chunks), self.spill_dir
+                )
+                self._set(id, spilled)
+                return spilled.size
+
+        self._set(id, bytes(buffer))
+        return len(buffer)
 
     def get(self, id: str) -> Union[bytes, None]:
+        content = self._data.get(id)
+        if isinstance(content, SpilledContent):
+            return content.read()
+        return content
+
+    def raw(self, id: str) -> Union[bytes, SpilledContent, None]:
+        """Stored content without reading spilled content back into memory"""
         return self._data.get(id)
 
     def delete(self, id: str) -> None:
-        del self._data[id]
+        with self._lock:
+            self._own()
+            del self._data[id]
+
+    def _set(self, id: str, content: Union[bytes, SpilledContent]) -> None:
+        # NOTE: content is read before taking the lock so uploads do not block each other
+        with self._lock:
+            self._own()
+            self._data[id] = content
+
+    def _own(self) -> None:
+        if self._shared:
+            self._data = dict(self._data)
+            self._shared = False
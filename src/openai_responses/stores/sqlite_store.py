@@ -0,0 +1,537 @@
+import os
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager, nullcontext
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from openai.types import FileObject, Model
+
+from openai.types.beta.assistant import Assistant
+from openai.types.beta.thread import Thread
+from openai.types.beta.threads.message import Message
+from openai.types.beta.threads.run import Run
+from openai.types.beta.threads.runs.run_step import RunStep
+
+from openai.types.vector_store import VectorStore
+from openai.types.vector_stores.vector_store_file import VectorStoreFile
+from openai.types.vector_stores.vector_store_file_batch import VectorStoreFileBatch
+
+from .content_store import ContentStore
+from .state_store import (
+    M,
+    AssistantStore,
+    BaseStore,
+    Beta,
+    CursorPage,
+    FileStore,
+    MessageStore,
+    ModelStore,
+    RunStepStore,
+    RunStore,
+    StateStore,
+    ThreadStore,
+    VectorStoreFileBatchStore,
+    VectorStoreFileStore,
+    VectorStoreStore,
+    _system_models,
+)
+from .._utils.serde import json_backend, model_json, model_parse
+
+__all__ = ["SQLiteStateStore"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    kind TEXT NOT NULL,
+    id TEXT NOT NULL,
+    scope TEXT,
+    created_at INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (kind, id)
+);
+CREATE INDEX IF NOT EXISTS objects_scope ON objects (kind, scope, created_at);
+CREATE TABLE IF NOT EXISTS content (
+    id TEXT PRIMARY KEY,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS related_files (
+    batch_id TEXT NOT NULL,
+    file_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS related_files_batch ON related_files (batch_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+Row = Tuple[Any, ...]
+
+
+class _Holder:
+    """Connection of a single thread"""
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+
+def _release(
+    conn: sqlite3.Connection,
+    conns: List[sqlite3.Connection],
+    lock: threading.Lock,
+) -> None:
+    with lock:
+        if conn in conns:
+            conns.remove(conn)
+    conn.close()
+
+
+class Database:
+    """SQLite connection shared by all stores of a state
+
+    Connections are in autocommit mode unless a `transaction` is open. An
+    in-memory database has a single connection guarded by a lock so it can be
+    used from server threads. A database file is opened in WAL mode with a
+    connection per thread, so it can be shared by many threads and processes:
+    reads run concurrently and never block, and writes are serialized by SQLite.
+    The connection of a thread is closed when the thread exits.
+    """
+
+    CHUNK_SIZE = 256
+
+    def __init__(self, path: str = ":memory:", timeout: float = 5.0) -> None:
+        self.path = path
+        self.timeout = timeout
+        self._memory = path == ":memory:"
+        self._pid = os.getpid()
+        self._closed = False
+        self._local = threading.local()
+        self._conns: List[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
+        self._lock: ContextManager[Any] = (
+            threading.RLock() if self._memory else nullcontext()
+        )
+        if self._memory:
+            self._main = self._connect()
+        self._conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.timeout,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        if not self._memory:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conns_lock:
+            self._conns.append(conn)
+        return conn
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        if self._closed:
+            raise sqlite3.ProgrammingError(f"Database {self.path} is closed")
+        if self._memory:
+            return self._main
+        if self._pid != os.getpid():
+            # NOTE: connections must not be used across a fork, so a forked child
+            # leaves those of its parent alone and opens its own
+            self._pid = os.getpid()
+            self._local = threading.local()
+            self._conns = []
+            self._conns_lock = threading.Lock()
+        holder: Optional[_Holder] = getattr(self._local, "holder", None)
+        if holder is None:
+            conn = self._connect()
+            holder = self._local.holder = _Holder(conn)
+            # NOTE: thread-locals are dropped when their thread exits
+            weakref.finalize(holder, _release, conn, self._conns, self._conns_lock)
+        return holder.conn
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> List[Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def rowcount(self, sql: str, params: Sequence[Any] = ()) -> int:
+        with self._lock:
+            return self._conn.execute(sql, params).rowcount
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        with self._lock:
+            conn = self._conn
+            if conn.in_transaction:
+                yield
+                return
+
+            # NOTE: take the write lock up front, a read transaction that later
+            # writes fails right away instead of waiting when another one commits
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            else:
+                conn.execute("COMMIT")
+
+    def copy(self, target: Optional["Database"] = None) -> "Database":
+        """Copy the whole database, into a new in-memory one by default"""
+        target = target or Database()
+        with self._lock, target._lock:
+            self._conn.backup(target._conn)
+        return target
+
+    def close(self) -> None:
+        """Close every connection, the database cannot be used afterwards"""
+        self._closed = True
+        # NOTE: dropping the thread-locals releases their connections, which takes
+        # the lock of the connection list
+        self._local = threading.local()
+        with self._conns_lock:
+            for conn in self._conns:
+                conn.close()
+            self._conns.clear()
+
+
+def _encode_scope(scope: Hashable) -> Optional[str]:
+    if scope is None:
+        return None
+    if isinstance(scope, tuple):
+        return "\x1f".join(str(part) for part in scope)
+    return str(scope)
+
+
+class SQLiteBacked(BaseStore[M], Generic[M]):
+    """Store mixin that keeps objects as JSON rows in a SQLite table
+
+    Objects of a store share the `objects` table and are told apart by kind. Rows
+    are ordered by creation time and then by insertion order, which a re-put of an
+    existing object keeps.
+    """
+
+    _model: Type[M]
+
+    def __init__(self, db: Database) -> None:
+        super().__init__()
+        self._db = db
+        self._kind = self._model.__name__
+
+    def put(self, obj: M) -> None:
+        self._db.execute(
+            "INSERT INTO objects (kind, id, scope, created_at, data) "
+            "VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (kind, id) DO UPDATE SET "
+            "scope = excluded.scope, created_at = excluded.created_at, "
+            "data = excluded.data",
+            (
+                self._kind,
+                obj.id,
+                _encode_scope(self._scope(obj)),
+                self._created_at(obj),
+                model_json(obj),
+            ),
+        )
+
+    def get(self, id: str) -> Optional[M]:
+        rows = self._db.execute(
+            "SELECT data FROM objects WHERE kind = ? AND id = ?",
+            (self._kind, id),
+        )
+        return self._parse(rows[0][0]) if rows else None
+
+    def delete(self, id: str) -> bool:
+        deleted = self._db.rowcount(
+            "DELETE FROM objects WHERE kind = ? AND id = ?",
+            (self._kind, id),
+        )
+        return deleted > 0
+
+    def _values(self) -> Iterable[M]:
+        rows = self._db.execute(
+            "SELECT data FROM objects WHERE kind = ? ORDER BY created_at, rowid",
+            (self._kind,),
+        )
+        return [self._parse(data) for data, in rows]
+
+    def _list(
+        self,
+        scope: Hashable,
+        limit: Optional[str] = None,
+        order: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        where: Optional[Callable[[Any], bool]] = None,
+    ) -> CursorPage[Any]:
+        objs: Iterable[M] = map(
+            self._parse,
+            self._iter(_encode_scope(scope), order or "desc", after, before),
+        )
+        if where is not None:
+            objs = (obj for obj in objs if where(obj))
+
+        # NOTE: fetch one extra object to know if there is a next page
+        n = int(limit or "20")
+        data = list(islice(objs, n + 1))
+        return CursorPage(data[:n], has_more=len(data) > n)
+
+    def _iter(
+        self,
+        scope: Optional[str],
+        order: str,
+        after: Optional[str],
+        before: Optional[str],
+    ) -> Iterator[bytes]:
+        """Iterate rows in order with keyset pagination, exclusive of the cursors"""
+        desc = order != "asc"
+        start = self._key(after) if after else None
+        stop = self._key(before) if before else None
+
+        sql = (
+            "SELECT created_at, rowid, data FROM objects WHERE kind = ? AND scope IS ?"
+        )
+        forward, backward = ("<", ">") if desc else (">", "<")
+        direction = "DESC" if desc else "ASC"
+
+        while True:
+            clauses = [sql]
+            params: List[Any] = [self._kind, scope]
+            if start is not None:
+                clauses.append(f"AND (created_at, rowid) {forward} (?, ?)")
+                params.extend(start)
+            if stop is not None:
+                clauses.append(f"AND (created_at, rowid) {backward} (?, ?)")
+                params.extend(stop)
+            clauses.append(
+                f"ORDER BY created_at {direction}, rowid {direction} LIMIT ?"
+            )
+            params.append(self._db.CHUNK_SIZE)
+
+            rows = self._db.execute(" ".join(clauses), params)
+            for _, _, data in rows:
+                yield data
+
+            if len(rows) < self._db.CHUNK_SIZE:
+                return
+            start = (rows[-1][0], rows[-1][1])
+
+    def _key(self, id: str) -> Optional[Tuple[int, int]]:
+        rows = self._db.execute(
+            "SELECT created_at, rowid FROM objects WHERE kind = ? AND id = ?",
+            (self._kind, id),
+        )
+        return (rows[0][0], rows[0][1]) if rows else None
+
+    def _parse(self, data: Union[bytes, str]) -> M:
+        return model_parse(self._model, json_backend.loads(data))
+
+    @staticmethod
+    def _created_at(obj: M) -> int:
+        if isinstance(obj, Model):
+            return obj.created
+        return obj.created_at
+
+
+class SQLiteContentStore(ContentStore):
+    def __init__(self, db: Database) -> None:
+        super().__init__()
+        self._db = db
+
+    def put(self, id: str, content: bytes) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO content (id, data) VALUES (?, ?)",
+            (id, content),
+        )
+
+    def put_chunks(
+        self,
+        id: str,
+        chunks: Iterable[Union[bytes, bytearray, memoryview]],
+    ) -> int:
+        content = b"".join(chunks)
+        self.put(id, content)
+        return len(content)
+
+    def get(self, id: str) -> Union[bytes, None]:
+        rows = self._db.execute("SELECT data FROM content WHERE id = ?", (id,))
+        return rows[0][0] if rows else None
+
+    def raw(self, id: str) -> Union[bytes, None]:
+        return self.get(id)
+
+    def delete(self, id: str) -> None:
+        if not self._db.rowcount("DELETE FROM content WHERE id = ?", (id,)):
+            raise KeyError(id)
+
+
+class SQLiteFileStore(SQLiteBacked[FileObject], FileStore):
+    _model = FileObject
+
+    def __init__(self, db: Database) -> None:
+        super().__init__(db)
+        self.content = SQLiteContentStore(db)
+
+
+class SQLiteModelStore(SQLiteBacked[Model], ModelStore):
+    _model = Model
+
+    def __init__(self, db: Database) -> None:
+        super().__init__(db)
+        # NOTE: the system catalog is only added once so deletes are persisted
+        with db.transaction():
+            if not db.execute("SELECT 1 FROM meta WHERE key = 'models'"):
+                for model in _system_models().values():
+                    self.put(model)
+                db.execute("INSERT INTO meta (key, value) VALUES ('models', '1')")
+
+
+class SQLiteAssistantStore(SQLiteBacked[Assistant], AssistantStore):
+    _model = Assistant
+
+
+class SQLiteThreadStore(SQLiteBacked[Thread], ThreadStore):
+    _model = Thread
+
+    def __init__(self, db: Database) -> None:
+        super().__init__(db)
+        self.messages = SQLiteMessageStore(db)
+        self.runs = SQLiteRunStore(db)
+
+
+class SQLiteMessageStore(SQLiteBacked[Message], MessageStore):
+    _model = Message
+
+
+class SQLiteRunStore(SQLiteBacked[Run], RunStore):
+    _model = Run
+
+    def __init__(self, db: Database) -> None:
+        super().__init__(db)
+        self.steps = SQLiteRunStepStore(db)
+
+
+class SQLiteRunStepStore(SQLiteBacked[RunStep], RunStepStore):
+    _model = RunStep
+
+
+class SQLiteVectorStoreStore(SQLiteBacked[VectorStore], VectorStoreStore):
+    _model = VectorStore
+
+    def __init__(self, db: Database) -> None:
+        super().__init__(db)
+        self.files = SQLiteVectorStoreFileStore(db)
+        self.file_batches = SQLiteVectorStoreFileBatchStore(db)
+
+
+class SQLiteVectorStoreFileStore(SQLiteBacked[VectorStoreFile], VectorStoreFileStore):
+    _model = VectorStoreFile
+
+
+class SQLiteVectorStoreFileBatchStore(
+    SQLiteBacked[VectorStoreFileBatch],
+    VectorStoreFileBatchStore,
+):
+    _model = VectorStoreFileBatch
+
+    def get_related_files(self, batch_id: str) -> List[str]:
+        rows = self._db.execute(
+            "SELECT file_id FROM related_files WHERE batch_id = ? ORDER BY rowid",
+            (batch_id,),
+        )
+        return [file_id for file_id, in rows]
+
+    def add_related_file(self, batch_id: str, file_id: str) -> None:
+        self._db.execute(
+            "INSERT INTO related_files (batch_id, file_id) VALUES (?, ?)",
+            (batch_id, file_id),
+        )
+
+
+class SQLiteBeta(Beta):
+    def __init__(self, db: Database) -> None:
+        self.assistants = SQLiteAssistantStore(db)
+        self.threads = SQLiteThreadStore(db)
+
+
+class SQLiteStateStore(StateStore):
+    """State store kept in a SQLite database instead of in memory
+
+    Objects are stored as JSON rows indexed by ID, parent ID, and creation time,
+    so a large state can be built once, saved to a file, and reused without
+    loading it into memory. A database file can also be opened by several
+    processes at once to share one state between them.
+
+    Args:
+        path (str, optional): Database file. Defaults to an in-memory database.
+        timeout (float, optional): Seconds a write waits for another connection to finish writing. Defaults to 5.
+    """
+
+    # NOTE: every statement goes through the database lock or its own connection
+    _thread_safe = True
+
+    def __init__(self, path: str = ":memory:", timeout: float = 5.0) -> None:
+        self._init(Database(path, timeout))
+
+    def _init(self, db: Database) -> None:
+        self._db = db
+        self.files = SQLiteFileStore(db)
+        self.models = SQLiteModelStore(db)
+        self.vector_stores = SQLiteVectorStoreStore(db)
+        self.beta = SQLiteBeta(db)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group writes into a single transaction, much faster for bulk loading"""
+        with self._db.transaction():
+            yield
+
+    def _empty(self) -> "SQLiteStateStore":
+        # NOTE: never wipe a database file, it may be shared with other processes
+        return SQLiteStateStore(timeout=self._db.timeout)
+
+    def fork(self) -> "SQLiteStateStore":
+        """Copy the database into a new in-memory state store
+
+        Unlike the in-memory store this copies every row.
+
+        Returns:
+            SQLiteStateStore: New state store with the same contents
+        """
+        fork = SQLiteStateStore.__new__(SQLiteStateStore)
+        fork._init(self._db.copy())
+        return fork
+
+    def snapshot(self) -> "SQLiteStateStore":
+        return self.fork()
+
+    def restore(self, snapshot: StateStore) -> None:
+        """Replace the contents of the database with those of a snapshot
+
+        Args:
+            snapshot (StateStore): SQLite snapshot to restore, left unchanged
+        """
+        if not isinstance(snapshot, SQLiteStateStore):
+            raise TypeError("Can only restore a SQLite state store snapshot")
+        snapshot._db.copy(self._db)
+
+    def close(self) -> None:
+        self._db.close()
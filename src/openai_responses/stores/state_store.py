@@ -1,4 +1,25 @@
-from typing import Any, Dict, Generic, List, Literal, Optional, TypeVar, Union
+import copy
+import threading
+from contextlib import ExitStack, contextmanager, nullcontext
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from openai.types import FileObject, Model
 
@@ -12,11 +33,13 @@ from openai.types.vector_store import VectorStore
 from openai.types.vector_stores.vector_store_file import VectorStoreFile
 from openai.types.vector_stores.vector_store_file_batch import VectorStoreFileBatch
 
+from ._index import OrderedIndex
 from .content_store import ContentStore
 from .._constants import SYSTEM_MODELS
+from .._utils.copy import model_copy
 from .._utils.serde import model_parse
 
-__all__ = ["StateStore"]
+__all__ = ["CursorPage", "StateStore"]
 
 AnyModel = Union[
     FileObject,
@@ -33,14 +56,102 @@ AnyModel = Union[
 
 
 M = TypeVar("M", bound=AnyModel)
+IM = TypeVar(
+    "IM",
+    bound=Union[Assistant, Message, Run, RunStep, VectorStore, VectorStoreFile],
+)
+T = TypeVar("T")
+
+# NOTE: shared no-op lock of collections that are not thread-safe
+_NO_LOCK: ContextManager[Any] = nullcontext()
 
 
 class StateStore:
-    def __init__(self) -> None:
-        self.files = FileStore()
+    """In-memory store for API resources
+
+    Args:
+        spill_threshold (Optional[int], optional): Size in bytes above which uploaded file content is kept in a temporary file instead of in memory. Defaults to None.
+        thread_safe (bool, optional): Guard every collection with its own lock so the mock can be called from many threads at once. Defaults to False.
+    """
+
+    _thread_safe = False
+
+    def __init__(
+        self,
+        spill_threshold: Optional[int] = None,
+        *,
+        thread_safe: bool = False,
+    ) -> None:
+        self.files = FileStore(spill_threshold)
         self.models = ModelStore()
         self.vector_stores = VectorStoreStore()
         self.beta = Beta()
+        if thread_safe:
+            self._thread_safe = True
+            _add_locks(self)
+
+    @property
+    def thread_safe(self) -> bool:
+        return self._thread_safe
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Run a group of operations without other threads interleaving
+
+        Holds the lock of every collection, so only use it for compound operations
+        that have to be atomic. Single operations like `put` are atomic already.
+        Writes are not rolled back on error. Does nothing unless the store is
+        thread-safe.
+        """
+        with ExitStack() as stack:
+            for collection in _collections(self):
+                stack.enter_context(collection._lock)
+            yield
+
+    def fork(self) -> "StateStore":
+        """Create a copy of the state that is isolated from this one
+
+        Forking does not copy any objects. Both stores share their collections
+        until either one writes to a collection, at which point only that
+        collection is copied by the writer. Stored objects are shared and should
+        be replaced with `put` rather than mutated in place.
+
+        Returns:
+            StateStore: New state store with the same contents
+        """
+        with self.transaction():
+            return _fork(self)
+
+    def snapshot(self) -> "StateStore":
+        """Capture the current state so it can be restored or forked later
+
+        Returns:
+            StateStore: Copy of the state that later writes to this store do not affect
+        """
+        with self.transaction():
+            return _fork(self)
+
+    def restore(self, snapshot: "StateStore") -> None:
+        """Reset this store in place to the contents of a snapshot
+
+        Args:
+            snapshot (StateStore): Snapshot to restore, left unchanged
+        """
+        with snapshot.transaction():
+            restored = _fork(snapshot)
+        restored._thread_safe = self._thread_safe
+        if self._thread_safe:
+            _add_locks(restored)
+
+        with self.transaction():
+            vars(self).update(vars(restored))
+
+    def _empty(self) -> "StateStore":
+        """New empty store with the same configuration as this one"""
+        return StateStore(
+            self.files.content.spill_threshold,
+            thread_safe=self._thread_safe,
+        )
 
     def _blind_put(self, resource: Union[AnyModel, Any]) -> None:
         if isinstance(resource, FileObject):
@@ -74,27 +185,195 @@ class Beta:
 
 
 class BaseStore(Generic[M]):
+    # NOTE: writes hold the lock, reads do not since a collection that is copied on
+    # write is swapped in with a single assignment
+    _lock: ContextManager[Any] = _NO_LOCK
+
     def __init__(self) -> None:
         self._data: Dict[str, M] = {}
+        self._shared = False
 
     def put(self, obj: M) -> None:
-        self._data[obj.id] = obj
+        with self._lock:
+            self._own()
+            self._data[obj.id] = obj
 
     def get(self, id: str) -> Optional[M]:
         return self._data.get(id)
 
+    @staticmethod
+    def _scope(obj: M) -> Hashable:
+        """Key of the parent resource that an object belongs to"""
+        return None
+
+    def _values(self) -> Iterable[M]:
+        return self._data.values()
+
+    def delete(self, id: str) -> bool:
+        with self._lock:
+            if self._data.get(id):
+                self._own()
+                del self._data[id]
+                return True
+            else:
+                return False
+
+    def _own(self) -> None:
+        """Copy collections shared with a fork before the first write"""
+        if self._shared:
+            self._copy()
+            self._shared = False
+
+    def _copy(self) -> None:
+        self._data = dict(self._data)
+
+
+def _fork(obj: T) -> T:
+    clone = copy.copy(obj)
+    if isinstance(obj, (BaseStore, ContentStore)):
+        obj._shared = True
+        setattr(clone, "_shared", True)
+        if obj._lock is not _NO_LOCK:
+            setattr(clone, "_lock", threading.RLock())
+
+    for name, value in list(vars(clone).items()):
+        if isinstance(value, (BaseStore, ContentStore, Beta)):
+            setattr(clone, name, _fork(value))
+
+    return clone
+
+
+def _collections(obj: object) -> Iterator[Union[BaseStore[Any], ContentStore]]:
+    """Collections of a state store in a fixed order"""
+    for value in vars(obj).values():
+        if isinstance(value, (BaseStore, ContentStore)):
+            yield value
+        if isinstance(value, (BaseStore, Beta)):
+            yield from _collections(value)
+
+
+def _add_locks(state: StateStore) -> None:
+    for collection in _collections(state):
+        collection._lock = threading.RLock()
+
+
+class CursorPage(List[IM]):
+    """Objects of a single list page along with its pagination cursors"""
+
+    def __init__(self, data: Iterable[IM] = (), has_more: bool = False) -> None:
+        super().__init__(data)
+        self.has_more = has_more
+
+    @property
+    def first_id(self) -> Optional[str]:
+        return self[0].id if self else None
+
+    @property
+    def last_id(self) -> Optional[str]:
+        return self[-1].id if self else None
+
+
+class IndexedStore(BaseStore[IM]):
+    """Store that keeps object IDs ordered by creation time per parent resource
+
+    Listing objects for a single parent (e.g. messages for a thread) only touches
+    the objects that belong to that parent, and cursors are resolved with a binary
+    search instead of a scan of the whole collection.
+
+    Objects with the same `created_at` are ordered by a sequence number that is
+    assigned once per object by the collection. Updating an object or moving it to
+    another parent keeps its place.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._index: Dict[Hashable, OrderedIndex] = {}
+        # NOTE: scope and sequence number of every indexed object
+        self._slots: Dict[str, Tuple[Hashable, int]] = {}
+        self._seq = 0
+        # NOTE: scopes whose index was copied since the last fork, None if all are
+        self._owned: Optional[Set[Hashable]] = None
+
+    def put(self, obj: IM) -> None:
+        with self._lock:
+            self._own()
+            scope = self._scope(obj)
+            slot = self._slots.get(obj.id)
+            if slot is None:
+                seq = self._seq
+                self._seq += 1
+            else:
+                seq = slot[1]
+                if slot[0] != scope:
+                    self._unindex(obj.id)
+            super().put(obj)
+            self._writable_index(scope).add(obj.id, obj.created_at, seq)
+            self._slots[obj.id] = (scope, seq)
+
     def delete(self, id: str) -> bool:
-        if self._data.get(id):
-            del self._data[id]
-            return True
+        with self._lock:
+            self._own()
+            self._unindex(id)
+            return super().delete(id)
+
+    def _copy(self) -> None:
+        super()._copy()
+        self._index = dict(self._index)
+        self._slots = dict(self._slots)
+        self._owned = set()
+
+    def _writable_index(self, scope: Hashable) -> OrderedIndex:
+        index = self._index.get(scope)
+        if index is None:
+            index = self._index[scope] = OrderedIndex()
+        elif self._owned is not None and scope not in self._owned:
+            index = self._index[scope] = index.copy()
         else:
-            return False
+            return index
+
+        if self._owned is not None:
+            self._owned.add(scope)
+        return index
+
+    def _unindex(self, id: str) -> None:
+        slot = self._slots.pop(id, None)
+        if slot is None:
+            return
+        index = self._writable_index(slot[0])
+        index.remove(id)
+        if not index:
+            del self._index[slot[0]]
+
+    def _list(
+        self,
+        scope: Hashable,
+        limit: Optional[str] = None,
+        order: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        where: Optional[Callable[[IM], bool]] = None,
+    ) -> CursorPage[IM]:
+        # NOTE: the index is walked in place, so hold off writers to this collection
+        with self._lock:
+            index = self._index.get(scope)
+            if index is None:
+                return CursorPage()
+
+            ids = index.iter(order or "desc", after, before)
+            objs = (self._data[id] for id in ids)
+            if where is not None:
+                objs = (obj for obj in objs if where(obj))
+
+            # NOTE: fetch one extra object to know if there is a next page
+            n = int(limit or "20")
+            data = list(islice(objs, n + 1))
+        return CursorPage(data[:n], has_more=len(data) > n)
 
 
 class FileStore(BaseStore[FileObject]):
-    def __init__(self) -> None:
+    def __init__(self, spill_threshold: Optional[int] = None) -> None:
         super().__init__()
-        self.content = ContentStore()
+        self.content = ContentStore(spill_threshold)
 
     def list(
         self,
@@ -107,48 +386,49 @@ class FileStore(BaseStore[FileObject]):
             ]
         ] = None,
     ) -> List[FileObject]:
-        files = list(self._data.values())
+        files = list(self._values())
         if purpose:
             files = [file for file in files if file.purpose == purpose]
         return files
 
 
+@lru_cache(maxsize=None)
+def _system_models() -> Dict[str, Model]:
+    """System model catalog, parsed once per process and never mutated"""
+    return {str(model["id"]): model_parse(Model, model) for model in SYSTEM_MODELS}
+
+
 class ModelStore(BaseStore[Model]):
     def __init__(self) -> None:
         super().__init__()
-        for model in SYSTEM_MODELS:
-            self._data[str(model["id"])] = model_parse(Model, model)
+        # NOTE: shares the system catalog until the first write
+        self._data = _system_models()
+        self._shared = True
+
+    def get(self, id: str) -> Optional[Model]:
+        model = super().get(id)
+        return self._private(model) if model else None
 
     def list(self) -> List[Model]:
-        return list(self._data.values())
+        return [self._private(model) for model in self._values()]
 
+    @staticmethod
+    def _private(model: Model) -> Model:
+        """Copy of a catalog entry, so editing it does not leak into other mocks"""
+        if _system_models().get(model.id) is model:
+            return model_copy(model)
+        return model
 
-class AssistantStore(BaseStore[Assistant]):
+
+class AssistantStore(IndexedStore[Assistant]):
     def list(
         self,
         limit: Optional[str] = None,
         order: Optional[str] = None,
         after: Optional[str] = None,
         before: Optional[str] = None,
-    ) -> List[Assistant]:
-        limit = limit or "20"
-        objs = list(self._data.values())
-        objs = list(reversed(objs)) if (order or "desc") == "desc" else objs
-
-        start_ix = 0
-        if after:
-            obj = self._data.get(after)
-            if obj:
-                start_ix = objs.index(obj) + 1
-
-        end_ix = None
-        if before:
-            obj = self._data.get(before)
-            if obj:
-                end_ix = objs.index(obj)
-
-        objs = objs[start_ix:end_ix]
-        return objs[: int(limit)]
+    ) -> CursorPage[Assistant]:
+        return self._list(None, limit, order, after, before)
 
 
 class ThreadStore(BaseStore[Thread]):
@@ -158,7 +438,11 @@ class ThreadStore(BaseStore[Thread]):
         self.runs = RunStore()
 
 
-class MessageStore(BaseStore[Message]):
+class MessageStore(IndexedStore[Message]):
+    @staticmethod
+    def _scope(obj: Message) -> Hashable:
+        return obj.thread_id
+
     def list(
         self,
         thread_id: str,
@@ -167,34 +451,26 @@ class MessageStore(BaseStore[Message]):
         after: Optional[str] = None,
         before: Optional[str] = None,
         run_id: Optional[str] = None,
-    ) -> List[Message]:
-        limit = limit or "20"
-        objs = [m for m in list(self._data.values()) if m.thread_id == thread_id]
-        if run_id:
-            objs = [obj for obj in objs if obj.run_id == run_id]
-        objs = list(reversed(objs)) if (order or "desc") == "desc" else objs
-
-        start_ix = 0
-        if after:
-            obj = self._data.get(after)
-            if obj:
-                start_ix = objs.index(obj) + 1
-
-        end_ix = None
-        if before:
-            obj = self._data.get(before)
-            if obj:
-                end_ix = objs.index(obj)
-
-        objs = objs[start_ix:end_ix]
-        return objs[: int(limit)]
-
-
-class RunStore(BaseStore[Run]):
+    ) -> CursorPage[Message]:
+        return self._list(
+            thread_id,
+            limit,
+            order,
+            after,
+            before,
+            (lambda obj: obj.run_id == run_id) if run_id else None,
+        )
+
+
+class RunStore(IndexedStore[Run]):
     def __init__(self) -> None:
         super().__init__()
         self.steps = RunStepStore()
 
+    @staticmethod
+    def _scope(obj: Run) -> Hashable:
+        return obj.thread_id
+
     def list(
         self,
         thread_id: str,
@@ -202,28 +478,15 @@ class RunStore(BaseStore[Run]):
         order: Optional[str] = None,
         after: Optional[str] = None,
         before: Optional[str] = None,
-    ) -> List[Run]:
-        limit = limit or "20"
-        objs = [m for m in list(self._data.values()) if m.thread_id == thread_id]
-        objs = list(reversed(objs)) if (order or "desc") == "desc" else objs
-
-        start_ix = 0
-        if after:
-            obj = self._data.get(after)
-            if obj:
-                start_ix = objs.index(obj) + 1
+    ) -> CursorPage[Run]:
+        return self._list(thread_id, limit, order, after, before)
 
-        end_ix = None
-        if before:
-            obj = self._data.get(before)
-            if obj:
-                end_ix = objs.index(obj)
 
-        objs = objs[start_ix:end_ix]
-        return objs[: int(limit)]
+class RunStepStore(IndexedStore[RunStep]):
+    @staticmethod
+    def _scope(obj: RunStep) -> Hashable:
+        return (obj.thread_id, obj.run_id)
 
-
-class RunStepStore(BaseStore[RunStep]):
     def list(
         self,
         thread_id: str,
@@ -232,32 +495,11 @@ class RunStepStore(BaseStore[RunStep]):
         order: Optional[str] = None,
         after: Optional[str] = None,
         before: Optional[str] = None,
-    ) -> List[RunStep]:
-        limit = limit or "20"
-        objs = [
-            m
-            for m in list(self._data.values())
-            if m.thread_id == thread_id and m.run_id == run_id
-        ]
-        objs = list(reversed(objs)) if (order or "desc") == "desc" else objs
-
-        start_ix = 0
-        if after:
-            obj = self._data.get(after)
-            if obj:
-                start_ix = objs.index(obj) + 1
-
-        end_ix = None
-        if before:
-            obj = self._data.get(before)
-            if obj:
-                end_ix = objs.index(obj)
-
-        objs = objs[start_ix:end_ix]
-        return objs[: int(limit)]
-
-
-class VectorStoreStore(BaseStore[VectorStore]):
+    ) -> CursorPage[RunStep]:
+        return self._list((thread_id, run_id), limit, order, after, before)
+
+
+class VectorStoreStore(IndexedStore[VectorStore]):
     def __init__(self) -> None:
         super().__init__()
         self.files = VectorStoreFileStore()
@@ -269,25 +511,8 @@ class VectorStoreStore(BaseStore[VectorStore]):
         order: Optional[str] = None,
         after: Optional[str] = None,
         before: Optional[str] = None,
-    ) -> List[VectorStore]:
-        limit = limit or "20"
-        objs = list(self._data.values())
-        objs = list(reversed(objs)) if (order or "desc") == "desc" else objs
-
-        start_ix = 0
-        if after:
-            obj = self._data.get(after)
-            if obj:
-                start_ix = objs.index(obj) + 1
-
-        end_ix = None
-        if before:
-            obj = self._data.get(before)
-            if obj:
-                end_ix = objs.index(obj)
-
-        objs = objs[start_ix:end_ix]
-        return objs[: int(limit)]
+    ) -> CursorPage[VectorStore]:
+        return self._list(None, limit, order, after, before)
 
     def list_files_for_batch(
         self,
@@ -300,34 +525,23 @@ class VectorStoreStore(BaseStore[VectorStore]):
         filter: Optional[
             Literal["in_progress", "completed", "failed", "cancelled"]
         ] = None,
-    ) -> List[VectorStoreFile]:
-        limit = limit or "20"
-        file_ids = self.file_batches.get_related_files(batch_id)
-        objs = [
-            m
-            for m in self.files.list(vector_store_id, filter=filter)
-            if m.vector_store_id == vector_store_id
-        ]
-        objs = [obj for obj in objs if obj.id in file_ids]
-        objs = list(reversed(objs)) if (order or "desc") == "desc" else objs
-
-        start_ix = 0
-        if after:
-            obj = self.files.get(after)
-            if obj:
-                start_ix = objs.index(obj) + 1
-
-        end_ix = None
-        if before:
-            obj = self.files.get(before)
-            if obj:
-                end_ix = objs.index(obj)
-
-        objs = objs[start_ix:end_ix]
-        return objs[: int(limit)]
-
-
-class VectorStoreFileStore(BaseStore[VectorStoreFile]):
+    ) -> CursorPage[VectorStoreFile]:
+        file_ids = set(self.file_batches.get_related_files(batch_id))
+        return self.files._list(
+            vector_store_id,
+            limit,
+            order,
+            after,
+            before,
+            lambda obj: obj.id in file_ids and (not filter or obj.status == filter),
+        )
+
+
+class VectorStoreFileStore(IndexedStore[VectorStoreFile]):
+    @staticmethod
+    def _scope(obj: VectorStoreFile) -> Hashable:
+        return obj.vector_store_id
+
     def list(
         self,
         vector_store_id: str,
@@ -338,29 +552,15 @@ class VectorStoreFileStore(BaseStore[VectorStoreFile]):
         filter: Optional[
             Literal["in_progress", "completed", "failed", "cancelled"]
         ] = None,
-    ) -> List[VectorStoreFile]:
-        limit = limit or "20"
-        objs = [
-            m for m in list(self._data.values()) if m.vector_store_id == vector_store_id
-        ]
-        if filter:
-            objs = [obj for obj in objs if obj.status == filter]
-        objs = list(reversed(objs)) if (order or "desc") == "desc" else objs
-
-        start_ix = 0
-        if after:
-            obj = self._data.get(after)
-            if obj:
-                start_ix = objs.index(obj) + 1
-
-        end_ix = None
-        if before:
-            obj = self._data.get(before)
-            if obj:
-                end_ix = objs.index(obj)
-
-        objs = objs[start_ix:end_ix]
-        return objs[: int(limit)]
+    ) -> CursorPage[VectorStoreFile]:
+        return self._list(
+            vector_store_id,
+            limit,
+            order,
+            after,
+            before,
+            (lambda obj: obj.status == filter) if filter else None,
+        )
 
 
 class VectorStoreFileBatchStore(BaseStore[VectorStoreFileBatch]):
@@ -368,10 +568,14 @@ class VectorStoreFileBatchStore(BaseStore[VectorStoreFileBatch]):
         super().__init__()
         self._related_files: Dict[str, List[str]] = {}
 
+    def _copy(self) -> None:
+        super()._copy()
+        self._related_files = {k: list(v) for k, v in self._related_files.items()}
+
     def get_related_files(self, batch_id: str) -> List[str]:
         return self._related_files.get(batch_id, [])
 
     def add_related_file(self, batch_id: str, file_id: str) -> None:
-        if not self._related_files.get(batch_id):
-            self._related_files[batch_id] = []
-        self._related_files[batch_id].append(file_id)
+        with self._lock:
+            self._own()
+            self._related_files.setdefault(batch_id, []).append(file_id)
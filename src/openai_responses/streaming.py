@@ -1,51 +1,199 @@
-import json
+import random
 from typing import (
+    Any,
     AsyncIterator,
     AsyncGenerator,
+    Dict,
     Generator,
     Generic,
+    Iterable,
+    Iterator,
+    List,
     Optional,
+    Tuple,
     TypeVar,
     Union,
 )
 
+from itertools import chain
+
+import httpx
+
 from openai.types.beta import AssistantStreamEvent
-from openai.types.chat import ChatCompletionChunk
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+from openai.types.completion_usage import CompletionUsage
 
-from ._utils.serde import model_dict
+from ._utils.serde import json_dumps, model_dict, model_json, model_parse
+from .latency import SYSTEM_CLOCK, Clock, Latency, as_latency, delays
 
-__all__ = ["EventStream", "AsyncEventStream"]
+__all__ = ["EventStream", "AsyncEventStream", "ChatCompletionEventStream"]
 
 M = TypeVar("M", bound=Union[AssistantStreamEvent, ChatCompletionChunk])
 
+DONE_FRAME = b"event: done\ndata: [DONE]\n\n"
+
+_PLACEHOLDER = "\x00choices\x00"
+
+_prefixes: Dict[str, bytes] = {}
+
+
+def _prefix(event_type: str) -> bytes:
+    prefix = _prefixes.get(event_type)
+    if prefix is None:
+        prefix = _prefixes[event_type] = f"event: {event_type}\ndata: ".encode()
+    return prefix
+
+
+class SSEFramer:
+    """Groups encoded SSE frames into response chunks
+
+    Args:
+        max_events (int): Flush after this many frames
+        max_bytes (Optional[int]): Flush once this many bytes are buffered
+        chunk_size (Optional[int]): Split the output into chunks of exactly this size, ignoring frame boundaries
+    """
+
+    def __init__(
+        self,
+        max_events: int = 1,
+        max_bytes: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ) -> None:
+        self._events = max(max_events, 1)
+        self._bytes = max_bytes
+        self._chunk_size = chunk_size
+        self._frames: List[bytes] = []
+        self._size = 0
+        self._carry = b""
+
+    def push(self, frame: bytes) -> Iterator[bytes]:
+        if self._events == 1 and self._bytes is None and self._chunk_size is None:
+            yield frame  # NOTE: fast path, one frame per chunk
+            return
+
+        self._frames.append(frame)
+        self._size += len(frame)
+        if len(self._frames) >= self._events or (
+            self._bytes is not None and self._size >= self._bytes
+        ):
+            yield from self._emit(self._take())
+
+    def flush(self) -> Iterator[bytes]:
+        if self._frames:
+            yield from self._emit(self._take())
+        if self._carry:
+            yield self._carry
+            self._carry = b""
+
+    def _take(self) -> bytes:
+        chunk = b"".join(self._frames)
+        self._frames.clear()
+        self._size = 0
+        return chunk
+
+    def _emit(self, chunk: bytes) -> Iterator[bytes]:
+        if self._chunk_size is None:
+            yield chunk
+            return
+
+        data = self._carry + chunk
+        n = self._chunk_size
+        end = len(data) - len(data) % n
+        for start in range(0, end, n):
+            yield data[start : start + n]
+        self._carry = data[end:]
+
+
+class _Pacer:
+    """Pairs response chunks with the delay to wait before sending each one
+
+    The delays of frames that are coalesced into a later chunk add up, so the
+    total wait does not depend on how events are grouped into chunks.
+    """
+
+    def __init__(self, framer: SSEFramer) -> None:
+        self._framer = framer
+        self._pending = 0.0
+
+    def push(self, delay: float, frame: bytes) -> Iterator[Tuple[float, bytes]]:
+        self._pending += delay
+        return self._paced(self._framer.push(frame))
+
+    def finish(self) -> Iterator[Tuple[float, bytes]]:
+        return self._paced(chain(self._framer.push(DONE_FRAME), self._framer.flush()))
+
+    def _paced(self, chunks: Iterable[bytes]) -> Iterator[Tuple[float, bytes]]:
+        for chunk in chunks:
+            yield self._pending, chunk
+            self._pending = 0.0
+
 
 class BaseEventStream(Generic[M]):
+    # NOTE: class attributes so subclasses do not need to call `super().__init__`
+    coalesce_events: int = 1
+    """Number of events sent together in one response chunk"""
+
+    coalesce_bytes: Optional[int] = None
+    """Send buffered events once they reach this many bytes"""
+
+    chunk_size: Optional[int] = None
+    """Re-chunk the stream into pieces of exactly this size, to test clients against
+    arbitrary chunk boundaries"""
+
+    time_to_first_token: Union[Latency, float, None] = None
+    """Delay before the first event"""
+
+    inter_token_delay: Union[Latency, float, None] = None
+    """Delay before each event after the first"""
+
+    clock: Clock = SYSTEM_CLOCK
+    """Clock used to wait, e.g. a `VirtualClock` to skip the delays in tests"""
+
+    rng: Optional[random.Random] = None
+    """Random number generator for the delays, e.g. the seeded one of the mock"""
+
     @staticmethod
-    def _dump_event(event: M) -> tuple[Optional[bytes], Optional[bytes]]:
-        if hasattr(event, "event") and hasattr(event, "data"):
-            event_type: Optional[str] = getattr(event, "event", None)
-            data: Optional[AssistantStreamEvent] = getattr(event, "data", None)
-            if event_type is not None and data is not None:
-                encoded_event = f"event: {event_type}\n".encode()
-                encoded_data = f"data: {json.dumps(model_dict(data))}\n\n".encode()
-                return encoded_event, encoded_data
-        encoded_data = f"data: {json.dumps(model_dict(event))}\n\n".encode()
-        return None, encoded_data
+    def _encode_event(event: M) -> bytes:
+        """Encode an event as a single SSE frame"""
+        event_type: Optional[str] = getattr(event, "event", None)
+        data: Optional[AssistantStreamEvent] = getattr(event, "data", None)
+        if event_type is not None and data is not None:
+            return _prefix(event_type) + model_json(data) + b"\n\n"
+        return b"data: " + model_json(event) + b"\n\n"
+
+    def _framer(self) -> SSEFramer:
+        return SSEFramer(self.coalesce_events, self.coalesce_bytes, self.chunk_size)
+
+    def _delays(self) -> Iterator[float]:
+        return delays(
+            as_latency(self.time_to_first_token),
+            as_latency(self.inter_token_delay),
+            self.rng,
+        )
 
 
 class EventStream(BaseEventStream[M]):
     """Event stream helper for building mock OpenAI server sent event stream"""
 
     def __iter__(self) -> Generator[bytes, None, None]:
-        for _event in self.generate():
-            t, d = self._dump_event(_event)
-            if t:
-                yield t
-            if d:
-                yield d
+        for delay, chunk in self._paced():
+            self.clock.sleep(delay)
+            yield chunk
 
-        yield b"event: done\n"
-        yield b"data: [DONE]\n\n"
+    def _paced(self) -> Iterator[Tuple[float, bytes]]:
+        """Response chunks along with the delay to wait before sending each one
+
+        Waiting is left to the caller, so async readers can wait without blocking
+        the event loop.
+        """
+        pacer = _Pacer(self._framer())
+        for delay, frame in zip(self._delays(), self._frames()):
+            yield from pacer.push(delay, frame)
+        yield from pacer.finish()
+
+    def _frames(self) -> Iterator[bytes]:
+        for _event in self.generate():
+            yield self._encode_event(_event)
 
     def generate(self) -> Generator[M, None, None]:
         raise NotImplementedError
@@ -55,14 +203,143 @@ class AsyncEventStream(BaseEventStream[M]):
     """Async event stream helper for building mock OpenAI server sent event stream"""
 
     async def __aiter__(self) -> AsyncIterator[bytes]:
+        pacer = _Pacer(self._framer())
+        delays = self._delays()
         async for _event in self.agenerate():
-            t, d = self._dump_event(_event)
-            if t:
-                yield t
-            if d:
-                yield d
-        yield b"event: done\n"
-        yield b"data: [DONE]\n\n"
+            frame = self._encode_event(_event)
+            for delay, chunk in pacer.push(next(delays), frame):
+                await self.clock.asleep(delay)
+                yield chunk
+
+        for delay, chunk in pacer.finish():
+            await self.clock.asleep(delay)
+            yield chunk
 
     def agenerate(self) -> AsyncGenerator[M, None]:
         raise NotImplementedError
+
+
+class ChatCompletionEventStream(
+    EventStream[ChatCompletionChunk],
+    httpx.SyncByteStream,
+    httpx.AsyncByteStream,
+):
+    """Streams a full chat completion as chunk deltas
+
+    Message content, refusals, and tool call arguments are split into deltas of
+    `delta_size` characters. Chunks are built lazily while the stream is read, so
+    long completions are never held as a list of events. The stream can be used as
+    an HTTPX response stream for both sync and async clients.
+
+    Args:
+        completion (ChatCompletion): Completion to stream
+        delta_size (int, optional): Characters per delta. Defaults to 4.
+        include_usage (bool, optional): Send a final chunk with usage and no choices, taken from the completion or, when it has none, counting each streamed delta as one completion token. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        completion: ChatCompletion,
+        delta_size: int = 4,
+        include_usage: bool = False,
+    ) -> None:
+        self.completion = completion
+        self.delta_size = max(delta_size, 1)
+        self.include_usage = include_usage
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for delay, chunk in self._paced():
+            await self.clock.asleep(delay)
+            yield chunk
+
+    def _frames(self) -> Iterator[bytes]:
+        # NOTE: only the choices differ between chunks, so the rest is encoded once
+        envelope = self._envelope()
+        encoded = json_dumps(envelope | {"choices": _PLACEHOLDER})
+        head, _, tail = encoded.partition(json_dumps(_PLACEHOLDER))
+        head = b"data: " + head
+        tail = tail + b"\n\n"
+
+        for chunk in self._chunks():
+            if len(chunk) == 1:
+                yield head + json_dumps(chunk["choices"]) + tail
+            else:
+                yield b"data: " + json_dumps(envelope | chunk) + b"\n\n"
+
+    def generate(self) -> Generator[ChatCompletionChunk, None, None]:
+        envelope = self._envelope()
+        for chunk in self._chunks():
+            yield model_parse(ChatCompletionChunk, envelope | chunk)
+
+    def _envelope(self) -> Dict[str, Any]:
+        completion = self.completion
+        return {
+            "id": completion.id,
+            "created": completion.created,
+            "model": completion.model,
+            "object": "chat.completion.chunk",
+            "service_tier": completion.service_tier,
+            "system_fingerprint": completion.system_fingerprint,
+        }
+
+    def _chunks(self) -> Iterator[Dict[str, Any]]:
+        """Chunk fields that are not part of the envelope"""
+
+        def _chunk(
+            index: int,
+            delta: Dict[str, Any],
+            finish_reason: Optional[str] = None,
+        ) -> Dict[str, Any]:
+            choice = {"index": index, "delta": delta, "finish_reason": finish_reason}
+            return {"choices": [choice]}
+
+        deltas = 0
+        for choice in self.completion.choices:
+            index, message = choice.index, choice.message
+
+            first: Dict[str, Any] = {"role": "assistant"}
+            if message.content is not None:
+                first["content"] = ""
+            yield _chunk(index, first)
+
+            for content in self._split(message.content):
+                deltas += 1
+                yield _chunk(index, {"content": content})
+
+            for refusal in self._split(message.refusal):
+                deltas += 1
+                yield _chunk(index, {"refusal": refusal})
+
+            for i, tool_call in enumerate(message.tool_calls or []):
+                function = getattr(tool_call, "function", None)
+                if function is None:
+                    continue
+                start = {
+                    "index": i,
+                    "id": tool_call.id,
+                    "type": "function",
+                    "function": {"name": function.name, "arguments": ""},
+                }
+                yield _chunk(index, {"tool_calls": [start]})
+
+                for arguments in self._split(function.arguments):
+                    deltas += 1
+                    part = {"index": i, "function": {"arguments": arguments}}
+                    yield _chunk(index, {"tool_calls": [part]})
+
+            yield _chunk(index, {}, choice.finish_reason)
+
+        if self.include_usage:
+            # NOTE: deltas stand in for tokens, the mock does not tokenize anything
+            usage = self.completion.usage or CompletionUsage(
+                prompt_tokens=0,
+                completion_tokens=deltas,
+                total_tokens=deltas,
+            )
+            yield {"choices": [], "usage": model_dict(usage)}
+
+    def _split(self, text: Optional[str]) -> Iterator[str]:
+        if not text:
+            return
+        for start in range(0, len(text), self.delta_size):
+            yield text[start : start + self.delta_size]
@@ -1,6 +1,10 @@
+import multiprocessing
+import os
 from typing import Optional
 
-from openai_responses._utils.faker import faker
+import pytest
+
+from openai_responses._utils.faker import Base62, Faker, IdPool, base62, faker
 
 
 def assert_is_functional_id(
@@ -62,3 +66,57 @@ def test_fake_vector_store_id():
 def test_fake_vector_store_file_batch_id():
     vector_store_file_batch_id = faker.beta.vector_store.file_batch.id()
     assert_is_functional_id(vector_store_file_batch_id, "vsfb")
+
+
+def test_base62_encode():
+    b = bytes(range(256))
+    expected = "".join(Base62.CHARSET[byte % Base62.BASE] for byte in reversed(b))
+    assert base62.encode(b) == expected
+
+
+def test_id_pool_refills_with_unique_ids():
+    pool = IdPool()
+    ids = [pool.take("msg_") for _ in range(IdPool.MIN_BATCH * 4)]
+
+    assert len(set(ids)) == len(ids)
+    for id in ids:
+        assert_is_functional_id(id, "msg")
+
+
+def test_seeded_faker_is_reproducible():
+    first = Faker(seed=42)
+    second = Faker(seed=42)
+
+    ids = [first.beta.thread.id() for _ in range(100)]
+    assert ids == [second.beta.thread.id() for _ in range(100)]
+
+    first.reseed()
+    assert first.beta.thread.id() == ids[0]
+
+
+def test_sequential_faker():
+    sequential = Faker(sequential=True)
+
+    ids = [sequential.beta.thread.message.id() for _ in range(3)]
+    assert ids == sorted(ids)
+    assert ids[0] == "msg_" + "1".zfill(24)
+    assert_is_functional_id(sequential.file.id(), "file", "-")
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_unseeded_pool_differs_in_forked_children():
+    faker.beta.assistant.id()  # NOTE: fill the queue before forking
+
+    context = multiprocessing.get_context("fork")
+    queue = context.SimpleQueue()
+    processes = [context.Process(target=_take, args=(queue,)) for _ in range(2)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert queue.get() != queue.get()
+
+
+def _take(queue: "multiprocessing.SimpleQueue[str]") -> None:
+    queue.put(faker.beta.assistant.id())
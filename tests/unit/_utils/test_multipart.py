@@ -0,0 +1,57 @@
+from typing import Iterator, List
+
+import httpx
+import pytest
+
+from openai_responses._utils.multipart import (
+    MultipartError,
+    boundary_from_content_type,
+    iter_parts,
+)
+
+
+def chunked(body: bytes, size: int) -> Iterator[bytes]:
+    for i in range(0, len(body), size):
+        yield body[i : i + size]
+
+
+@pytest.fixture
+def request_() -> httpx.Request:
+    return httpx.Request(
+        "POST",
+        "https://api.openai.com/v1/files",
+        data={"purpose": "fine-tune"},
+        files={"file": ("example.jsonl", b'{"a": 1}\r\n--\r\n{"b": 2}\n' * 100)},
+    )
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, 1 << 20])
+def test_iter_parts(request_: httpx.Request, size: int):
+    body = request_.read()
+    boundary = boundary_from_content_type(request_.headers["content-type"])
+
+    parts: List[tuple] = []
+    for part in iter_parts(chunked(body, size), boundary):
+        parts.append((part.name, part.filename, part.read()))
+
+    assert parts == [
+        ("purpose", None, b"fine-tune"),
+        ("file", "example.jsonl", b'{"a": 1}\r\n--\r\n{"b": 2}\n' * 100),
+    ]
+
+
+def test_iter_parts_skips_unread_data(request_: httpx.Request):
+    body = request_.read()
+    boundary = boundary_from_content_type(request_.headers["content-type"])
+
+    names = [part.name for part in iter_parts(chunked(body, 10), boundary)]
+    assert names == ["purpose", "file"]
+
+
+def test_iter_parts_truncated_body(request_: httpx.Request):
+    body = request_.read()
+    boundary = boundary_from_content_type(request_.headers["content-type"])
+
+    with pytest.raises(MultipartError):
+        for part in iter_parts((body[:-50],), boundary):
+            part.read()
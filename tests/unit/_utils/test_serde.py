@@ -0,0 +1,45 @@
+import json
+
+import pytest
+
+from openai.types.chat import ChatCompletionMessage
+
+from openai_responses._utils.serde import (
+    _select_backend,
+    json_response,
+    model_dict,
+    model_json,
+)
+
+
+@pytest.mark.parametrize("name", ["orjson", "msgspec", "json"])
+def test_backend_round_trip(name: str):
+    try:
+        backend = _select_backend(name)
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+
+    obj = {"id": "msg_abc", "content": "héllo", "n": [1, 2.5, None, True]}
+    encoded = backend.dumps(obj)
+
+    assert isinstance(encoded, bytes)
+    assert backend.loads(encoded) == obj
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        _select_backend("yaml")
+
+
+def test_model_json_matches_model_dict():
+    message = ChatCompletionMessage(role="assistant", content="Hello!")
+    assert json.loads(model_json(message)) == model_dict(message)
+
+
+def test_json_response():
+    message = ChatCompletionMessage(role="assistant", content="Hello!")
+    response = json_response(201, message)
+
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == model_dict(message)
@@ -0,0 +1,26 @@
+import json
+
+from openai_responses._utils.template import ResponseTemplate
+
+
+def test_render_static_body():
+    template = ResponseTemplate({"object": "list", "data": []})
+    assert json.loads(template.render()) == {"object": "list", "data": []}
+
+
+def test_render_patches_volatile_fields():
+    body = {"id": "chatcmpl_abc", "created": 0, "object": "chat.completion"}
+    template = ResponseTemplate(body, volatile=("id", "created"))
+
+    first = json.loads(template.render())
+    second = json.loads(template.render())
+
+    assert first["id"] != second["id"]
+    assert first["id"].startswith("chatcmpl_")
+    assert first["created"] > 0
+    assert first["object"] == "chat.completion"
+
+
+def test_render_skips_missing_volatile_fields():
+    template = ResponseTemplate({"model": "gpt-4o"}, volatile=("id", "created"))
+    assert json.loads(template.render()) == {"model": "gpt-4o"}
@@ -0,0 +1,76 @@
+import json
+from typing import Any
+
+import openai
+import pytest
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
+from openai_responses import OpenAIMock
+from openai_responses._routes import chat
+from openai_responses.streaming import ChatCompletionEventStream
+
+COMPLETION = ChatCompletion.model_validate(
+    {
+        "id": "chatcmpl_123",
+        "created": 0,
+        "model": "gpt-4o",
+        "object": "chat.completion",
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": "Hello! How can I help?"},
+            }
+        ],
+    }
+)
+
+
+def test_encoded_chunks_match_generated_chunks() -> None:
+    stream = ChatCompletionEventStream(COMPLETION, delta_size=3, include_usage=True)
+
+    frames = b"".join(stream).split(b"\n\n")
+    encoded = [
+        ChatCompletionChunk.model_validate(json.loads(frame[len(b"data: ") :]))
+        for frame in frames
+        if frame.startswith(b"data: {")
+    ]
+
+    assert encoded == list(stream.generate())
+    assert encoded[-1].usage is not None
+    assert encoded[-1].usage.completion_tokens == 8
+
+
+def test_stream_is_reusable() -> None:
+    stream = ChatCompletionEventStream(COMPLETION)
+    assert list(stream) == list(stream)
+
+
+@pytest.mark.parametrize("response", [{"choices": []}, COMPLETION])
+def test_streaming_request_is_parsed_once(
+    monkeypatch: pytest.MonkeyPatch,
+    response: Any,
+) -> None:
+    calls = []
+
+    def json_loads(content: Any) -> Any:
+        calls.append(content)
+        return json.loads(content)
+
+    monkeypatch.setattr(chat, "json_loads", json_loads)
+
+    openai_mock = OpenAIMock()
+    openai_mock.chat.completions.create.response = response
+
+    with openai_mock.router:
+        client = openai.Client(api_key="sk-fake123")
+        stream = client.chat.completions.create(
+            model="gpt-4o",
+            messages=[{"role": "user", "content": "Hello"}],
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        chunks = list(stream)
+
+    assert chunks[-1].usage is not None
+    assert len(calls) == 1
@@ -0,0 +1,108 @@
+from typing import Optional, Tuple
+
+import httpx
+import pytest
+
+from openai_responses import OpenAIMock
+from openai_responses._routes.files import _byte_range
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        (None, None),
+        ("bytes=0-9", (0, 10)),
+        ("bytes=5-", (5, 100)),
+        ("bytes=90-200", (90, 100)),
+        ("bytes=-10", (90, 100)),
+        ("bytes=-200", (0, 100)),
+        ("bytes=0-4,10-14", None),
+        ("items=0-9", None),
+        ("bytes=abc", None),
+    ],
+)
+def test_byte_range(header: Optional[str], expected: Optional[Tuple[int, int]]):
+    assert _byte_range(header, 100) == expected
+
+
+@pytest.mark.parametrize(
+    "header,size",
+    [
+        ("bytes=100-", 100),
+        ("bytes=10-5", 100),
+        ("bytes=-0", 100),
+        ("bytes=0-", 0),
+        ("bytes=-5", 0),
+    ],
+)
+def test_byte_range_not_satisfiable(header: str, size: int):
+    with pytest.raises(ValueError):
+        _byte_range(header, size)
+
+
+def test_retrieve_empty_file_content_range():
+    openai_mock = OpenAIMock()
+
+    with openai_mock.router:
+        file = httpx.post(
+            "https://api.openai.com/v1/files",
+            files={"file": ("empty.txt", b"")},
+            data={"purpose": "assistants"},
+        ).json()
+        response = httpx.get(
+            f"https://api.openai.com/v1/files/{file['id']}/content",
+            headers={"range": "bytes=-5"},
+        )
+
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */0"
+
+
+@pytest.mark.parametrize(
+    "content_type",
+    ["multipart/form-data", "application/json", "multipart/form-data; boundary=abc"],
+)
+def test_create_file_malformed_upload(content_type: str):
+    openai_mock = OpenAIMock()
+
+    with openai_mock.router:
+        response = httpx.post(
+            "https://api.openai.com/v1/files",
+            content=b"junk",
+            headers={"content-type": content_type},
+        )
+
+    assert response.status_code == 400
+
+
+def _multipart(*parts: bytes, end: bytes = b"--abc--\r\n") -> bytes:
+    return b"".join(b"--abc\r\n" + part + b"\r\n" for part in parts) + end
+
+
+_FILE_PART = (
+    b'Content-Disposition: form-data; name="file"; filename="{}"\r\n\r\ncontent'
+)
+_PURPOSE_PART = b'Content-Disposition: form-data; name="purpose"\r\n\r\nassistants'
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        _multipart(_FILE_PART.replace(b"{}", b""), _PURPOSE_PART),
+        _multipart(_FILE_PART.replace(b"{}", b"data.txt")),
+        _multipart(_FILE_PART.replace(b"{}", b"data.txt"), end=b"--abc"),
+    ],
+    ids=["empty-filename", "missing-purpose", "truncated"],
+)
+def test_create_file_rejected_upload_leaves_no_content(content: bytes):
+    openai_mock = OpenAIMock()
+
+    with openai_mock.router:
+        response = httpx.post(
+            "https://api.openai.com/v1/files",
+            content=content,
+            headers={"content-type": "multipart/form-data; boundary=abc"},
+        )
+
+    assert response.status_code == 400
+    assert not openai_mock.state.files.content._data
@@ -0,0 +1,153 @@
+import asyncio
+import random
+from typing import AsyncGenerator, Generator, List
+
+import openai
+import pytest
+from openai.types.chat import ChatCompletionChunk
+
+from openai_responses import OpenAIMock
+from openai_responses._utils.time import utcnow_unix_timestamp_s
+from openai_responses.latency import Empirical, Fixed, Normal, VirtualClock, delays
+from openai_responses.streaming import AsyncEventStream, EventStream
+
+
+def test_fixed() -> None:
+    assert Fixed(0.5).sample() == 0.5
+    assert Fixed(-1).sample() == 0.0
+
+
+def test_normal_is_clipped_and_seeded() -> None:
+    latency = Normal(0.1, 1.0, minimum=0.05)
+    samples = [latency.sample(random.Random(7)) for _ in range(3)]
+
+    assert len(set(samples)) == 1
+    assert all(s >= 0.05 for s in (latency.sample() for _ in range(1000)))
+
+
+def test_empirical() -> None:
+    latency = Empirical([0.1, 0.2, 0.3])
+    assert {latency.sample() for _ in range(100)} <= {0.1, 0.2, 0.3}
+
+    with pytest.raises(ValueError):
+        Empirical([])
+
+
+def test_delays() -> None:
+    it = delays(Fixed(1.0), Fixed(0.1))
+    assert [next(it) for _ in range(3)] == [1.0, 0.1, 0.1]
+
+    it = delays(None, None)
+    assert [next(it) for _ in range(2)] == [0.0, 0.0]
+
+
+def test_virtual_clock() -> None:
+    clock = VirtualClock(start=100)
+    clock.sleep(1.5)
+    asyncio.run(clock.asleep(0.5))
+
+    assert clock.now() == 102
+
+
+def test_virtual_clock_tick() -> None:
+    clock = VirtualClock(start=0, tick=0.5)
+    assert [clock.now() for _ in range(3)] == [0, 0.5, 1.0]
+
+
+def test_mock_clock_is_active_while_mocking() -> None:
+    openai_mock = OpenAIMock(clock=VirtualClock(start=42))
+    with openai_mock.router:
+        assert utcnow_unix_timestamp_s() == 42
+        openai_mock.clock = VirtualClock(start=7)
+        assert utcnow_unix_timestamp_s() == 7
+
+    assert utcnow_unix_timestamp_s() > 42
+
+
+def _stream_duration(seed: int) -> float:
+    openai_mock = OpenAIMock(seed=seed, clock=VirtualClock(start=0))
+    openai_mock.chat.completions.create.response = {
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"content": "Hello! How can I help?", "role": "assistant"},
+            }
+        ]
+    }
+    openai_mock.chat.completions.create.time_to_first_token = Normal(0.5, 0.2)
+    openai_mock.chat.completions.create.inter_token_delay = Normal(0.05, 0.02)
+
+    with openai_mock.router:
+        client = openai.Client(api_key="sk-fake123")
+        stream = client.chat.completions.create(
+            model="gpt-4o",
+            messages=[],
+            stream=True,
+        )
+        for _ in stream:
+            pass
+
+    return openai_mock.clock.now()
+
+
+def test_stream_delays_are_seeded() -> None:
+    random.seed(1)
+    first = _stream_duration(seed=7)
+    random.seed(2)
+    assert _stream_duration(seed=7) == first
+    assert _stream_duration(seed=8) != first
+
+
+_EVENTS = [
+    ChatCompletionChunk(
+        id=f"chatcmpl-{i}",
+        choices=[],
+        created=0,
+        model="gpt-4o",
+        object="chat.completion.chunk",
+    )
+    for i in range(7)
+]
+
+
+class _SyncStream(EventStream[ChatCompletionChunk]):
+    def generate(self) -> Generator[ChatCompletionChunk, None, None]:
+        yield from _EVENTS
+
+
+class _AsyncStream(AsyncEventStream[ChatCompletionChunk]):
+    async def agenerate(self) -> AsyncGenerator[ChatCompletionChunk, None]:
+        for event in _EVENTS:
+            yield event
+
+
+class _RecordingClock(VirtualClock):
+    def __init__(self) -> None:
+        super().__init__(start=0)
+        self.waits: List[float] = []
+
+    def advance(self, seconds: float) -> None:
+        self.waits.append(seconds)
+        super().advance(seconds)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("coalesce_events", [1, 3])
+async def test_async_stream_delays_match_sync(coalesce_events: int) -> None:
+    sync_stream, async_stream = _SyncStream(), _AsyncStream()
+    for stream in (sync_stream, async_stream):
+        stream.clock = _RecordingClock()
+        stream.coalesce_events = coalesce_events
+        stream.time_to_first_token = 1.0
+        stream.inter_token_delay = 0.5
+
+    sync_chunks = list(sync_stream)
+    async_chunks = [chunk async for chunk in async_stream]
+
+    assert sync_chunks == async_chunks
+    assert isinstance(sync_stream.clock, _RecordingClock)
+    assert isinstance(async_stream.clock, _RecordingClock)
+    assert sync_stream.clock.waits == async_stream.clock.waits
+    assert len(sync_stream.clock.waits) == len(sync_chunks)
+    assert sum(sync_stream.clock.waits) == 4.0
@@ -0,0 +1,58 @@
+from pathlib import Path
+
+from openai.types.beta.assistant import Assistant
+
+from openai_responses import OpenAIMock
+from openai_responses._utils.time import utcnow_unix_timestamp_s
+from openai_responses.latency import VirtualClock
+from openai_responses.stores import SQLiteStateStore, StateStore
+
+
+def _assistant() -> Assistant:
+    return Assistant(
+        id="asst_abc123",
+        created_at=0,
+        model="gpt-4o",
+        object="assistant",
+        tools=[],
+    )
+
+
+def test_reset_keeps_state_configuration():
+    openai_mock = OpenAIMock(state=StateStore(spill_threshold=10, thread_safe=True))
+    openai_mock.state.beta.assistants.put(_assistant())
+
+    openai_mock.reset()
+
+    assert openai_mock.state.thread_safe
+    assert openai_mock.state.files.content.spill_threshold == 10
+    assert openai_mock.state.beta.assistants.get("asst_abc123") is None
+
+
+def test_reset_sqlite_state_leaves_file_alone(tmp_path: Path):
+    path = str(tmp_path / "state.db")
+    openai_mock = OpenAIMock(state=SQLiteStateStore(path))
+    openai_mock.state.beta.assistants.put(_assistant())
+
+    openai_mock.reset()
+
+    assert isinstance(openai_mock.state, SQLiteStateStore)
+    assert openai_mock.state.beta.assistants.get("asst_abc123") is None
+    assert SQLiteStateStore(path).beta.assistants.get("asst_abc123") is not None
+
+
+def test_reset_restores_clock():
+    clock = VirtualClock(start=42)
+    openai_mock = OpenAIMock(clock=clock)
+
+    with openai_mock.router:
+        openai_mock.clock = VirtualClock(start=7)
+        openai_mock.reset()
+        assert openai_mock.clock is clock
+        assert utcnow_unix_timestamp_s() == 42
+
+    openai_mock = OpenAIMock()
+    default = openai_mock.clock
+    openai_mock.clock = clock
+    openai_mock.reset()
+    assert openai_mock.clock is default
@@ -0,0 +1,163 @@
+import asyncio
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+import pytest
+import respx
+from respx.models import AllMockedAssertionError
+
+from openai_responses import OpenAIMock
+from openai_responses._router import AsyncIteratorStream, _run_sync
+from openai_responses.streaming import EventStream
+
+
+def dispatch(
+    openai_mock: OpenAIMock,
+    method: str,
+    url: str,
+) -> Optional[Tuple[respx.Route, Dict[str, Any]]]:
+    return getattr(openai_mock.router, "_dispatch")(httpx.Request(method, url))
+
+
+@pytest.mark.parametrize(
+    "method,path,expected,params",
+    [
+        ("POST", "/threads/runs", "create_and_run", {}),
+        ("POST", "/threads/thread_abc", "update", {"thread_id": "thread_abc"}),
+        (
+            "POST",
+            "/threads/thread_abc/runs",
+            "runs.create",
+            {"thread_id": "thread_abc"},
+        ),
+        (
+            "GET",
+            "/threads/thread_abc/runs/run_abc/steps/step_abc",
+            "runs.steps.retrieve",
+            {"thread_id": "thread_abc", "run_id": "run_abc", "step_id": "step_abc"},
+        ),
+        (
+            "GET",
+            "/threads/thread_abc/messages",
+            "messages.list",
+            {"thread_id": "thread_abc"},
+        ),
+    ],
+)
+def test_dispatch_thread_routes(
+    method: str,
+    path: str,
+    expected: str,
+    params: Dict[str, Any],
+):
+    openai_mock = OpenAIMock()
+    route: Any = openai_mock.beta.threads
+    for attr in expected.split("."):
+        route = getattr(route, attr)
+
+    dispatched = dispatch(openai_mock, method, f"https://api.openai.com/v1{path}")
+    assert dispatched == (route.route, params)
+
+
+def test_dispatch_file_routes():
+    openai_mock = OpenAIMock()
+    base_url = "https://api.openai.com/v1"
+
+    dispatched = dispatch(openai_mock, "GET", f"{base_url}/files")
+    assert dispatched == (openai_mock.files.list.route, {})
+
+    dispatched = dispatch(openai_mock, "GET", f"{base_url}/files/file-abc/content")
+    assert dispatched == (openai_mock.files.content.route, {"file_id": "file-abc"})
+
+    dispatched = dispatch(openai_mock, "GET", f"{base_url}/files?purpose=assistants")
+    assert dispatched == (openai_mock.files.list.route, {})
+
+
+def test_dispatch_with_base_url():
+    openai_mock = OpenAIMock(base_url="https://example-endpoint.openai.azure.com")
+    url = "https://example-endpoint.openai.azure.com/openai/deployments/gpt-4o/chat/completions?api-version=2024-02-01"
+
+    dispatched = dispatch(openai_mock, "POST", url)
+    assert dispatched == (openai_mock.chat.completions.create.route, {})
+
+    dispatched = dispatch(openai_mock, "POST", "https://api.openai.com/v1/embeddings")
+    assert dispatched is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("offload", [False, True])
+async def test_async_iterator_stream(offload: bool):
+    threads = set()
+
+    def chunks():
+        for i in range(3):
+            threads.add(threading.get_ident())
+            yield str(i).encode()
+
+    stream = AsyncIteratorStream(chunks(), offload=offload)
+    assert [chunk async for chunk in stream] == [b"0", b"1", b"2"]
+    assert (threading.get_ident() not in threads) is offload
+
+
+def test_run_sync_inside_event_loop():
+    async def value() -> int:
+        await asyncio.sleep(0)
+        return 42
+
+    async def main() -> int:
+        return _run_sync(value())
+
+    assert _run_sync(value()) == 42
+    assert asyncio.run(main()) == 42
+
+
+class TickStream(EventStream[Any]):
+    inter_token_delay = 0.05
+
+    def _frames(self) -> Iterator[bytes]:
+        for i in range(5):
+            yield b"data: %d\n\n" % i
+
+
+@pytest.mark.asyncio
+async def test_async_iterator_stream_waits_without_blocking():
+    ticks = 0
+    done = asyncio.Event()
+
+    async def tick() -> None:
+        nonlocal ticks
+        while not done.is_set():
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    async def read() -> List[bytes]:
+        try:
+            return [chunk async for chunk in AsyncIteratorStream(TickStream())]
+        finally:
+            done.set()
+
+    _, chunks = await asyncio.gather(tick(), read())
+
+    assert len(chunks) == 6
+    assert ticks >= 10  # NOTE: about 0.2s of delays, none if the loop was blocked
+
+
+@pytest.mark.asyncio
+async def test_dispatched_side_effect_runs_once():
+    openai_mock = OpenAIMock()
+    calls: List[httpx.Request] = []
+
+    def count(request: httpx.Request) -> None:
+        calls.append(request)
+
+    openai_mock.beta.assistants.create.route.side_effect = count
+    request = httpx.Request("POST", "https://api.openai.com/v1/assistants", json={})
+
+    with pytest.raises(AllMockedAssertionError):
+        openai_mock.router.resolve(request)
+    assert len(calls) == 1
+
+    with pytest.raises(AllMockedAssertionError):
+        await openai_mock.router.aresolve(request)
+    assert len(calls) == 2
@@ -0,0 +1,148 @@
+import asyncio
+import socket
+from typing import List
+
+import httpx
+import pytest
+
+from openai_responses import OpenAIMock
+from openai_responses._utils.time import utcnow_unix_timestamp_s
+from openai_responses.latency import VirtualClock
+from openai_responses.server import MockServer, main
+
+
+def read_response(file: "socket.SocketIO") -> bytes:
+    head = b""
+    while not head.endswith(b"\r\n\r\n"):
+        head += file.read(1)
+    length = int(head.lower().split(b"content-length: ")[1].split(b"\r\n")[0])
+    return head + file.read(length)
+
+
+def test_keep_alive():
+    with MockServer() as server:
+        with socket.create_connection((server.host, server.port)) as conn:
+            file = conn.makefile("rb")
+            request = (
+                b"GET /v1/models/gpt-4o HTTP/1.1\r\n" b"Host: localhost\r\n" b"\r\n"
+            )
+            conn.sendall(request)
+            first = read_response(file)
+            conn.sendall(request)
+            second = read_response(file)
+
+    assert first.startswith(b"HTTP/1.1 200 OK")
+    assert second.startswith(b"HTTP/1.1 200 OK")
+    assert b"Connection: keep-alive" in second
+
+
+def test_chunked_request_body():
+    with MockServer() as server:
+        with socket.create_connection((server.host, server.port)) as conn:
+            file = conn.makefile("rb")
+            body = b'{"model": "gpt-4o"}'
+            conn.sendall(
+                b"POST /v1/assistants HTTP/1.1\r\n"
+                b"Host: localhost\r\n"
+                b"Content-Type: application/json\r\n"
+                b"Transfer-Encoding: chunked\r\n"
+                b"Connection: close\r\n"
+                b"\r\n"
+                + b"%x\r\n%s\r\n" % (5, body[:5])
+                + b"%x\r\n%s\r\n" % (len(body) - 5, body[5:])
+                + b"0\r\n\r\n"
+            )
+            response = read_response(file)
+
+    assert response.startswith(b"HTTP/1.1 201 Created")
+    assert b'"model":"gpt-4o"' in response
+    assert b"Connection: close" in response
+    assert len(server.openai_mock.state.beta.assistants.list()) == 1
+
+
+def test_malformed_request():
+    with MockServer() as server:
+        with socket.create_connection((server.host, server.port)) as conn:
+            conn.sendall(b"NONSENSE\r\n\r\n")
+            response = read_response(conn.makefile("rb"))
+
+    assert response.startswith(b"HTTP/1.1 400 Bad Request")
+
+
+def test_handler_error():
+    openai_mock = OpenAIMock()
+
+    def fail(request: httpx.Request) -> httpx.Response:
+        raise RuntimeError("boom")
+
+    openai_mock.beta.assistants.create.response = fail
+
+    with MockServer(openai_mock) as server:
+        response = httpx.post(f"{server.url}/assistants", json={"model": "gpt-4o"})
+
+    assert response.status_code == 500
+    assert "boom" in response.json()["error"]["message"]
+
+
+def test_streamed_response_is_chunked():
+    openai_mock = OpenAIMock()
+    openai_mock.chat.completions.create.response = {
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"content": "Hello! How can I help?", "role": "assistant"},
+            }
+        ]
+    }
+
+    with MockServer(openai_mock) as server:
+        with httpx.stream(
+            "POST",
+            f"{server.url}/chat/completions",
+            json={"model": "gpt-4o", "messages": [], "stream": True},
+        ) as response:
+            chunks: List[bytes] = list(response.iter_raw())
+
+    assert response.headers["transfer-encoding"] == "chunked"
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert len(chunks) > 1
+    assert b"".join(chunks).endswith(b"data: [DONE]\n\n")
+
+
+def test_hooks_active_while_serving():
+    openai_mock = OpenAIMock(clock=VirtualClock(start=1_000))
+
+    with MockServer(openai_mock) as server:
+        assert utcnow_unix_timestamp_s() == 1_000
+        response = httpx.post(f"{server.url}/assistants", json={"model": "gpt-4o"})
+
+    assert response.json()["created_at"] == 1_000
+    assert utcnow_unix_timestamp_s() != 1_000
+
+
+@pytest.mark.asyncio
+async def test_stop_closes_idle_connections():
+    server = MockServer(keep_alive_timeout=60)
+    await server.start()
+    async with httpx.AsyncClient(base_url=server.url) as client:
+        await client.get("/models/gpt-4o")
+        await asyncio.wait_for(server.stop(), timeout=5)
+
+
+def test_cli_arguments(monkeypatch: pytest.MonkeyPatch):
+    served: List[MockServer] = []
+
+    async def serve_forever(self: MockServer) -> None:
+        served.append(self)
+
+    async def start(self: MockServer) -> None:
+        pass
+
+    monkeypatch.setattr(MockServer, "start", start)
+    monkeypatch.setattr(MockServer, "serve_forever", serve_forever)
+
+    main(["--port", "9999", "--base-url", "https://example.com/openai/v1"])
+
+    assert served[0].port == 9999
+    assert served[0].url == "http://127.0.0.1:9999/openai/v1"
@@ -0,0 +1,37 @@
+from typing import List
+
+import pytest
+
+from openai_responses.streaming import DONE_FRAME, SSEFramer
+
+FRAMES = [b"data: 1\n\n", b"data: 22\n\n", b"data: 333\n\n", DONE_FRAME]
+
+
+def _frame(framer: SSEFramer) -> List[bytes]:
+    chunks: List[bytes] = []
+    for frame in FRAMES:
+        chunks.extend(framer.push(frame))
+    chunks.extend(framer.flush())
+    return chunks
+
+
+def test_one_frame_per_chunk() -> None:
+    assert _frame(SSEFramer()) == FRAMES
+
+
+def test_coalesce_events() -> None:
+    chunks = _frame(SSEFramer(max_events=3))
+    assert chunks == [b"".join(FRAMES[:3]), DONE_FRAME]
+
+
+def test_coalesce_bytes() -> None:
+    chunks = _frame(SSEFramer(max_events=100, max_bytes=19))
+    assert chunks == [b"".join(FRAMES[:2]), b"".join(FRAMES[2:])]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 8, 1024])
+def test_chunk_size(chunk_size: int) -> None:
+    chunks = _frame(SSEFramer(max_events=2, chunk_size=chunk_size))
+    assert b"".join(chunks) == b"".join(FRAMES)
+    assert all(len(chunk) == chunk_size for chunk in chunks[:-1])
+    assert 0 < len(chunks[-1]) <= chunk_size
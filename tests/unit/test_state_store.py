@@ -1,3 +1,12 @@
+import multiprocessing
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Set
+
+import openai
 import pytest
 from openai.types import FileObject
 from openai.types.beta.assistant import Assistant
@@ -5,12 +14,16 @@ from openai.types.beta.thread import Thread
 from openai.types.beta.threads.message import Message
 from openai.types.beta.threads.run import Run
 
-from openai_responses.stores import StateStore
+from openai_responses import OpenAIMock
+from openai_responses.stores import ContentStore, SQLiteStateStore, StateStore
+from openai_responses.stores.content_store import SpilledContent
 
 
-@pytest.fixture
-def state_store() -> StateStore:
-    return StateStore()
+@pytest.fixture(params=["memory", "thread_safe", "sqlite"])
+def state_store(request: pytest.FixtureRequest) -> StateStore:
+    if request.param == "sqlite":
+        return SQLiteStateStore()
+    return StateStore(thread_safe=request.param == "thread_safe")
 
 
 def test_file_store(state_store: StateStore):
@@ -224,3 +237,404 @@ def test_run_store(state_store: StateStore):
     assert len(runs) == 10
     assert runs[0].id == "run_29"
     assert runs[-1].id == "run_20"
+
+
+def test_message_store_thread_index(state_store: StateStore):
+    for i in range(10):
+        state_store.beta.threads.messages.put(
+            Message(
+                id=f"msg_{i}",
+                content=[],
+                created_at=0,
+                object="thread.message",
+                role="user",
+                status="completed",
+                thread_id=f"thread_{i % 2}",
+            )
+        )
+
+    messages = state_store.beta.threads.messages.list("thread_0", order="asc")
+    assert [m.id for m in messages] == ["msg_0", "msg_2", "msg_4", "msg_6", "msg_8"]
+
+    moved = state_store.beta.threads.messages.get("msg_0")
+    assert moved
+    moved.thread_id = "thread_1"
+    state_store.beta.threads.messages.put(moved)
+    assert len(state_store.beta.threads.messages.list("thread_0")) == 4
+    assert len(state_store.beta.threads.messages.list("thread_1")) == 6
+
+    for i in range(1, 10, 2):
+        state_store.beta.threads.messages.delete(f"msg_{i}")
+    messages = state_store.beta.threads.messages.list("thread_1")
+    assert [m.id for m in messages] == ["msg_0"]
+
+
+def test_list_ordered_by_created_at(state_store: StateStore):
+    for i, created_at in enumerate([2, 0, 1, 1, 0]):
+        state_store.beta.assistants.put(
+            Assistant(
+                id=f"asst_{i}",
+                created_at=created_at,
+                model="",
+                object="assistant",
+                tools=[],
+            )
+        )
+
+    assts = state_store.beta.assistants.list(order="asc")
+    assert [a.id for a in assts] == ["asst_1", "asst_4", "asst_2", "asst_3", "asst_0"]
+
+    assts = state_store.beta.assistants.list(limit="2", after="asst_2")
+    assert [a.id for a in assts] == ["asst_4", "asst_1"]
+
+    assts = state_store.beta.assistants.list(before="asst_4", order="asc")
+    assert [a.id for a in assts] == ["asst_1"]
+
+    updated = state_store.beta.assistants.get("asst_0")
+    assert updated
+    updated.created_at = -1
+    state_store.beta.assistants.put(updated)
+    assts = state_store.beta.assistants.list(limit="1", order="asc")
+    assert assts[0].id == "asst_0"
+
+
+def test_list_page_cursors(state_store: StateStore):
+    page = state_store.beta.assistants.list()
+    assert page == []
+    assert not page.has_more
+    assert page.first_id is None and page.last_id is None
+
+    for i in range(5):
+        state_store.beta.assistants.put(
+            Assistant(
+                id=f"asst_{i}",
+                created_at=0,
+                model="",
+                object="assistant",
+                tools=[],
+            )
+        )
+
+    page = state_store.beta.assistants.list(limit="2", order="asc")
+    assert page.has_more
+    assert page.first_id == "asst_0"
+    assert page.last_id == "asst_1"
+
+    page = state_store.beta.assistants.list(limit="2", order="asc", after="asst_2")
+    assert not page.has_more
+    assert [a.id for a in page] == ["asst_3", "asst_4"]
+
+
+def test_model_store_copy_on_write():
+    first = StateStore()
+    second = StateStore()
+    assert first.models._data is second.models._data
+
+    model = first.models.get("gpt-4")
+    assert model
+    first.models.delete("gpt-4")
+    assert first.models.get("gpt-4") is None
+    assert second.models.get("gpt-4") == model
+    assert StateStore().models.get("gpt-4") == model
+
+
+def test_model_store_edits_do_not_leak():
+    first = StateStore()
+    second = StateStore()
+
+    model = first.models.get("gpt-4")
+    assert model
+    model.owned_by = "someone-else"
+    first.models.list()[0].owned_by = "someone-else"
+
+    assert second.models.get("gpt-4") == StateStore().models.get("gpt-4")
+    assert all(m.owned_by != "someone-else" for m in second.models.list())
+
+    first.models.put(model)
+    assert first.models.get("gpt-4") is model
+    assert second.models.get("gpt-4") != model
+
+
+def test_fork_isolates_writes(state_store: StateStore):
+    for i in range(4):
+        state_store.beta.threads.messages.put(
+            Message(
+                id=f"msg_{i}",
+                content=[],
+                created_at=i,
+                object="thread.message",
+                role="user",
+                status="completed",
+                thread_id=f"thread_{i % 2}",
+            )
+        )
+
+    fork = state_store.fork()
+    message = state_store.beta.threads.messages.get("msg_0")
+    assert fork.beta.threads.messages.get("msg_0") == message
+
+    fork.beta.threads.messages.delete("msg_0")
+    fork.beta.threads.messages.put(
+        Message(
+            id="msg_4",
+            content=[],
+            created_at=4,
+            object="thread.message",
+            role="user",
+            status="completed",
+            thread_id="thread_1",
+        )
+    )
+
+    assert [m.id for m in fork.beta.threads.messages.list("thread_0")] == ["msg_2"]
+    assert len(fork.beta.threads.messages.list("thread_1")) == 3
+
+    assert state_store.beta.threads.messages.get("msg_4") is None
+    messages = state_store.beta.threads.messages.list("thread_0")
+    assert [m.id for m in messages] == ["msg_2", "msg_0"]
+    assert len(state_store.beta.threads.messages.list("thread_1")) == 2
+
+
+def test_snapshot_restore(state_store: StateStore):
+    state_store.files.content.put("file-abc123", b"foo")
+    snapshot = state_store.snapshot()
+
+    state_store.files.content.delete("file-abc123")
+    state_store.vector_stores.file_batches.add_related_file("vsfb_abc", "file-abc")
+    assert state_store.files.content.get("file-abc123") is None
+
+    state_store.restore(snapshot)
+    assert state_store.files.content.get("file-abc123") == b"foo"
+    assert state_store.vector_stores.file_batches.get_related_files("vsfb_abc") == []
+
+    state_store.files.content.delete("file-abc123")
+    assert snapshot.files.content.get("file-abc123") == b"foo"
+
+
+def test_sqlite_state_store_persists(tmp_path: Path):
+    path = str(tmp_path / "state.db")
+    state_store = SQLiteStateStore(path)
+    with state_store.transaction():
+        for i in range(300):
+            state_store.beta.assistants.put(
+                Assistant(
+                    id=f"asst_{i}",
+                    created_at=i,
+                    model="",
+                    object="assistant",
+                    tools=[],
+                )
+            )
+    state_store.models.delete("gpt-4")
+    state_store.close()
+
+    state_store = SQLiteStateStore(path)
+    assert state_store.models.get("gpt-4") is None
+
+    page = state_store.beta.assistants.list(limit="100", after="asst_250")
+    assert page.first_id == "asst_249"
+    assert page.last_id == "asst_150"
+    assert page.has_more
+
+
+def test_content_store_spills_large_content(tmp_path: Path):
+    content = ContentStore(spill_threshold=4, spill_dir=str(tmp_path))
+    content.put("file-small", b"abc")
+    content.put("file-large", b"abcdefgh")
+
+    assert content.raw("file-small") == b"abc"
+    spilled = content.raw("file-large")
+    assert isinstance(spilled, SpilledContent)
+    assert content.get("file-large") == b"abcdefgh"
+    assert b"".join(spilled.iter_chunks(3)) == b"abcdefgh"
+
+    del spilled
+    content.delete("file-large")
+    assert list(tmp_path.iterdir()) == []
+
+
+def _message(i: int, thread_id: str = "thread_0") -> Message:
+    return Message(
+        id=f"msg_{i}",
+        content=[],
+        created_at=0,
+        object="thread.message",
+        role="user",
+        status="completed",
+        thread_id=thread_id,
+    )
+
+
+def test_same_second_pagination(state_store: StateStore):
+    messages = state_store.beta.threads.messages
+    for i in range(1000):
+        messages.put(_message(i))
+
+    seen: List[str] = []
+    after = None
+    while True:
+        page = messages.list("thread_0", limit="100", order="asc", after=after)
+        seen.extend(m.id for m in page)
+        if not page.has_more:
+            break
+        after = page.last_id
+
+    assert seen == [f"msg_{i}" for i in range(1000)]
+
+
+def test_sequence_kept_across_updates_and_moves(state_store: StateStore):
+    messages = state_store.beta.threads.messages
+    for i in range(4):
+        messages.put(_message(i, thread_id=f"thread_{i % 2}"))
+
+    messages.put(_message(2, thread_id="thread_1"))
+    messages.put(_message(1))
+
+    assert [m.id for m in messages.list("thread_1", order="asc")] == ["msg_2", "msg_3"]
+    assert [m.id for m in messages.list("thread_0", order="asc")] == ["msg_0", "msg_1"]
+
+
+def test_concurrent_writes(state_store: StateStore):
+    if not state_store.thread_safe:
+        pytest.skip("store is not thread-safe")
+
+    messages = state_store.beta.threads.messages
+    batches = state_store.vector_stores.file_batches
+
+    def work(worker: int) -> None:
+        for i in range(200):
+            messages.put(_message(worker * 1000 + i, thread_id=f"thread_{i % 4}"))
+            batches.add_related_file("batch_0", f"file_{worker}_{i}")
+            if i % 3 == 0:
+                messages.delete(f"msg_{worker * 1000 + i}")
+
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        list(executor.map(work, range(32)))
+
+    total = 0
+    for t in range(4):
+        page = messages.list(f"thread_{t}", limit="10000")
+        assert not page.has_more
+        total += len(page)
+
+    assert total == 32 * (200 - 67)
+    assert len(batches.get_related_files("batch_0")) == 32 * 200
+
+
+def test_fork_while_writing():
+    state_store = StateStore(thread_safe=True)
+    messages = state_store.beta.threads.messages
+    stop = threading.Event()
+
+    def write() -> None:
+        i = 0
+        while not stop.is_set():
+            messages.put(_message(i))
+            i += 1
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    try:
+        forks = [state_store.fork() for _ in range(20)]
+    finally:
+        stop.set()
+        writer.join()
+
+    for fork in forks:
+        assert fork.thread_safe
+        page = fork.beta.threads.messages.list("thread_0", limit="100000")
+        assert len(page) == len({m.id for m in page})
+
+
+def _add_messages(path: str, worker: int) -> None:
+    openai_mock = OpenAIMock(state=SQLiteStateStore(path))
+    with openai_mock.router:
+        client = openai.Client(api_key="sk-fake123")
+        for i in range(10):
+            client.beta.threads.messages.create(
+                "thread_shared",
+                role="user",
+                content=f"{worker}-{i}",
+            )
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_sqlite_state_store_shared_between_processes(tmp_path: Path):
+    path = str(tmp_path / "state.db")
+    state_store = SQLiteStateStore(path)
+    state_store.beta.threads.put(
+        Thread(id="thread_shared", created_at=0, metadata=None, object="thread")
+    )
+
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=_add_messages, args=(path, worker))
+        for worker in range(3)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+
+    page = state_store.beta.threads.messages.list("thread_shared", limit="1000")
+    assert len(page) == 3 * 10
+    assert len({message.id for message in page}) == 3 * 10
+
+
+def test_sqlite_state_store_connection_per_thread(tmp_path: Path):
+    state_store = SQLiteStateStore(str(tmp_path / "state.db"))
+    assistants = state_store.beta.assistants
+    connections: Set[int] = set()
+
+    def work(worker: int) -> int:
+        connections.add(id(getattr(state_store._db, "_conn")))
+        for i in range(50):
+            assistants.put(
+                Assistant(
+                    id=f"asst_{worker}_{i}",
+                    created_at=i,
+                    model="",
+                    object="assistant",
+                    tools=[],
+                )
+            )
+        return len(assistants.list(limit="10000"))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        counts = list(executor.map(work, range(8)))
+
+    assert max(counts) == 8 * 50
+    assert len(connections) > 1
+    state_store.close()
+
+
+def test_sqlite_state_store_closes_connections_of_finished_threads(tmp_path: Path):
+    state_store = SQLiteStateStore(str(tmp_path / "state.db"))
+
+    threads = [
+        threading.Thread(target=state_store.beta.assistants.get, args=("asst_0",))
+        for _ in range(50)
+    ]
+    for thread in threads:
+        thread.start()
+        thread.join()
+
+    assert len(state_store._db._conns) <= 1
+    state_store.close()
+
+
+@pytest.mark.parametrize("in_memory", [True, False])
+def test_sqlite_state_store_closed(tmp_path: Path, in_memory: bool):
+    state_store = SQLiteStateStore(
+        ":memory:" if in_memory else str(tmp_path / "state.db")
+    )
+    assert state_store.models.get("gpt-4")
+    state_store.close()
+
+    assert not state_store._db._conns
+    with pytest.raises(sqlite3.ProgrammingError, match="is closed"):
+        state_store.models.get("gpt-4")
+    with pytest.raises(sqlite3.ProgrammingError, match="is closed"):
+        with state_store.transaction():
+            pass
@@ -0,0 +1,67 @@
+import threading
+from typing import List
+
+import httpx
+
+from openai_responses import OpenAIMock
+from openai_responses.stores import StateStore
+
+_MESSAGES = [
+    {"role": "user", "content": "Hello"},
+    {"role": "user", "content": "World"},
+]
+
+
+def test_create_thread_missing_file_writes_nothing():
+    openai_mock = OpenAIMock()
+
+    with openai_mock.router:
+        response = httpx.post(
+            "https://api.openai.com/v1/threads",
+            json={
+                "messages": _MESSAGES,
+                "tool_resources": {
+                    "file_search": {"vector_stores": [{"file_ids": ["file-missing"]}]}
+                },
+            },
+        )
+
+    assert response.status_code == 404
+    assert not openai_mock.state.beta.threads._data
+    assert not openai_mock.state.beta.threads.messages._data
+    assert not openai_mock.state.vector_stores._data
+
+
+def test_concurrent_readers_see_thread_with_messages():
+    openai_mock = OpenAIMock(state=StateStore(thread_safe=True))
+    threads = openai_mock.state.beta.threads
+    stop = threading.Event()
+    incomplete: List[str] = []
+
+    def read() -> None:
+        while not stop.is_set():
+            for thread_id in list(threads._data):
+                if len(threads.messages.list(thread_id)) != len(_MESSAGES):
+                    incomplete.append(thread_id)
+
+    with openai_mock.router, httpx.Client(base_url=openai_mock.base_url) as client:
+        assistant = client.post("/assistants", json={"model": "gpt-4o"}).json()
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        try:
+            for _ in range(100):
+                client.post("/threads", json={"messages": _MESSAGES})
+                client.post(
+                    "/threads/runs",
+                    json={
+                        "assistant_id": assistant["id"],
+                        "thread": {"messages": _MESSAGES},
+                    },
+                )
+        finally:
+            stop.set()
+            reader.join()
+
+    assert len(threads._data) == 200
+    assert not incomplete